@@ -0,0 +1,5 @@
+# the tools are flat scripts importing each other as siblings
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
@@ -0,0 +1,34 @@
+import io
+
+import pytest
+
+import calendars
+
+pymupdf = pytest.importorskip("pymupdf")
+
+def test_unknown_calendar():
+    with pytest.raises(ValueError):
+        calendars.generator("13", "core")
+    with pytest.raises(ValueError):
+        calendars.render_calendar(2026, "12", "deluxe")
+
+def test_render_to_bytes_and_stream():
+    gen = calendars.generator()
+    pdf = calendars.render_calendar(2026)
+    buf = io.BytesIO()
+    assert calendars.render_calendar(2026, out=buf) is buf
+    with pymupdf.open(stream=pdf, filetype="pdf") as doc:
+        assert len(doc) == len(gen.PAGES)
+        first = doc[0].get_text()
+    with pymupdf.open(stream=buf.getvalue(), filetype="pdf") as doc:
+        assert doc[0].get_text() == first
+    assert "2026" in first
+
+def test_zone_changes_the_dates():
+    # the March equinox (14:46 UTC) and December solstice (20:50 UTC) fall on
+    # the next day in Auckland
+    gen = calendars.generator()
+    utc = sorted(gen.load_year(2026, "UTC").season_markers)
+    nz = sorted(gen.load_year(2026, "Pacific/Auckland").season_markers)
+    assert [d.isoformat() for d in utc] == ["2026-03-20", "2026-06-21", "2026-09-23", "2026-12-21"]
+    assert [d.isoformat() for d in nz] == ["2026-03-21", "2026-06-21", "2026-09-23", "2026-12-22"]
@@ -0,0 +1,44 @@
+import datetime as dt
+import json
+
+import event_index
+from event_index import Event, EventIndex
+
+D = dt.date(2026, 3, 20)
+
+def _index():
+    ev = EventIndex()
+    ev.add(Event(D, "ingress", "Mercury", "Aries"))
+    ev.add(Event(D, "ingress", "Sun", "Aries", dt.datetime(2026, 3, 20, 14, 46, tzinfo=dt.timezone.utc)))
+    ev.add(Event(D, "season", "Sun", detail="March equinox"))
+    ev.add(Event(D, "moon", "Moon", "Aries"))
+    ev.add(Event(D, "holiday", detail="First"))
+    ev.add(Event(D, "holiday", detail="Second"))
+    ev.add_span(dt.date(2026, 3, 19), dt.date(2026, 3, 21), "meteor", detail="Shower")
+    return ev.sort()
+
+def test_drawing_order():
+    # by priority; ingresses by planet, Sun first; ties keep the order added
+    got = [(e.kind, e.body or e.detail) for e in _index().on(D)]
+    assert got == [("moon", "Moon"), ("season", "Sun"), ("meteor", "Shower"),
+                   ("ingress", "Sun"), ("ingress", "Mercury"),
+                   ("holiday", "First"), ("holiday", "Second")]
+
+def test_span_covers_every_day():
+    ev = _index()
+    assert [len(ev.on(D + dt.timedelta(days=k))) for k in (-2, -1, 1, 2)] == [0, 1, 1, 0]
+
+def test_extra_events_follow_equal_priorities():
+    ev = _index()
+    ev.add(Event(D, "eclipse", "Sun", detail="Solar"))
+    natal = Event(D, "natal", detail="Natal Sun")
+    kinds = [e.kind for e in ev.sort().on(D, extra=[natal])]
+    assert kinds[:4] == ["moon", "eclipse", "natal", "season"]
+    assert len(ev.on(D)) == 8   # the index itself is unchanged
+
+def test_json_round_trip():
+    ev = _index()
+    back = EventIndex.from_json(json.loads(json.dumps(ev.to_json())))
+    assert back.to_json() == ev.to_json()
+    assert back.on(D)[3].instant == ev.on(D)[3].instant
+    assert ev.to_json()["format"] == event_index.FORMAT
@@ -0,0 +1,30 @@
+import datetime as dt
+
+import ingress_engine
+
+UTC = dt.timezone.utc
+
+def _near(t, *when, minutes=3):
+    return abs(t - dt.datetime(*when, tzinfo=UTC)) <= dt.timedelta(minutes=minutes)
+
+def test_sun_ingresses_2026():
+    # the equinoxes and solstices of 2026 (UTC)
+    sun = dict((sign, t) for t, sign in ingress_engine.scan_ingresses(2026, ["Sun"])["Sun"])
+    assert len(sun) == 12
+    assert _near(sun["Aries"], 2026, 3, 20, 14, 46)
+    assert _near(sun["Cancer"], 2026, 6, 21, 8, 24)
+    assert _near(sun["Libra"], 2026, 9, 23, 0, 5)
+    assert _near(sun["Capricorn"], 2026, 12, 21, 20, 50)
+
+def test_outer_planets_enter_aries_2026():
+    got = ingress_engine.scan_ingresses(2026, ["Saturn", "Neptune"])
+    assert [s for _, s in got["Saturn"]] == ["Aries"]
+    assert got["Saturn"][0][0].date() == dt.date(2026, 2, 14)
+    assert [s for _, s in got["Neptune"]] == ["Aries"]
+    assert got["Neptune"][0][0].date() == dt.date(2026, 1, 26)
+
+def test_margin_widens_the_scan():
+    # the Sun entered Capricorn on 2025-12-21, inside a 15-day margin; the
+    # next Aquarius ingress (2027-01-20) is not
+    signs = [s for _, s in ingress_engine.scan_ingresses(2026, ["Sun"], margin=15)["Sun"]]
+    assert signs[0] == "Capricorn" and len(signs) == 13
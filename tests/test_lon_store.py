@@ -0,0 +1,32 @@
+import ephem
+import numpy as np
+import pytest
+
+import ingress_engine, lon_store
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    cache = tmp_path_factory.mktemp("ephem")
+    path = lon_store.precompute(2027, 2027, ("Moon", "Mars"), cache)
+    assert path == lon_store.path_for(2027, 2027, cache)
+    return lon_store.open_store(2027, 2027, cache)
+
+def test_interpolation_tracks_ephem(store):
+    # off-sample instants across the year, the margin days included
+    t0 = float(ephem.Date("2027/1/1")) - 3
+    ts = t0 + np.linspace(0.0, 370.0, 97) + 0.37
+    for body in ("Moon", "Mars"):
+        got = store.lons(body, ts)
+        want = np.array([ingress_engine.lon_at(body, t) for t in ts])
+        assert np.abs((got - want + 180) % 360 - 180).max() < 1e-3, body
+        assert store.lon(body, ts[5]) == pytest.approx(got[5])
+
+def test_range(store):
+    assert store.covers(2027) and not store.covers(2026) and not store.covers(2028)
+    with pytest.raises(ValueError):
+        store.lons("Mars", [float(ephem.Date("2026/12/1"))])
+    with pytest.raises(KeyError):
+        store.lons("Venus", [float(ephem.Date("2027/6/1"))])
+
+def test_missing_store(tmp_path):
+    assert lon_store.open_store(2030, 2031, tmp_path) is None
@@ -0,0 +1,21 @@
+import datetime as dt
+
+import lunar
+
+def _eclipses(year):
+    return {(l.instant.date(), l.eclipse) for l in lunar.in_year(year) if l.eclipse}
+
+def test_eclipses_2026():
+    assert _eclipses(2026) == {(dt.date(2026, 2, 17), "Solar"), (dt.date(2026, 3, 3), "Lunar"),
+                               (dt.date(2026, 8, 12), "Solar"), (dt.date(2026, 8, 28), "Lunar")}
+
+def test_far_from_node_eclipses():
+    # node distance ~15.3 (a partial solar) and ~17.0 deg (a penumbral lunar):
+    # beyond any fixed cutoff that keeps out the misses
+    assert (dt.date(2029, 7, 11), "Solar") in _eclipses(2029)
+    assert (dt.date(2031, 6, 5), "Lunar") in _eclipses(2031)
+
+def test_no_false_eclipses():
+    # NASA's canon: four to seven a year
+    assert len(_eclipses(2030)) == 4
+    assert len(_eclipses(2031)) == 5
@@ -0,0 +1,37 @@
+import datetime as dt
+
+import month_layout
+
+def _layout(**kw):
+    return month_layout.Layout(x=10, top=500, cell_w=50, grid_h=300, line_gap=10,
+                               number=(2, 1, -8), text=(2, 1, -18), **kw)
+
+def test_march_2026_grid():
+    # starts on a Sunday: six weeks, the 1st in the last column
+    L = _layout()
+    g = L.grid(*month_layout.shape(2026, 3))
+    assert (g.first_wd, g.days, g.rows) == (6, 31, 6)
+    assert [c.day for c in g.cells] == list(range(1, 32))
+    first, last = g.cells[0], g.cells[-1]
+    assert (first.row, first.col, first.x) == (0, 6, 10 + 6*50)
+    assert (last.row, last.col) == (5, 1)
+    assert g.cell_h == 50 and first.top == 500 and first.y == 450
+    assert first.number == (first.x + 2, 492) and first.text == (first.x + 2, 482)
+    assert first.max_lines == 3   # line gaps between the first baseline (482) and the bottom
+    assert g.full == (False, True, True, True, True, False)
+    assert L.grid(6, 31) is g
+
+def test_fixed_rows_and_spill():
+    L = _layout(rows=6, spill=True, reserve=1)
+    g = L.grid(*month_layout.shape(2026, 2))   # Feb 2026: Sunday, 28 days
+    assert g.rows == 6 and len(g.weeks) == 5 and len(g.cells) == 35
+    assert g.cells[0].day == -5 and g.cells[-1].day == 29
+    first = dt.date(2026, 2, 1)
+    assert month_layout.cell_date(first, g.cells[0]) == dt.date(2026, 1, 26)
+    assert month_layout.cell_date(first, g.cells[-1]) == dt.date(2026, 3, 1)
+    assert g.cells[0].max_lines == _layout(rows=6).grid(6, 28).cells[0].max_lines - 1
+
+def test_fixed_shape():
+    # 28-day months from Jan 1; month 13 starts on Dec 3 in 2026
+    assert month_layout.fixed_shape(2026, 1) == (3, 28)   # Thursday
+    assert month_layout.fixed_shape(2026, 13) == (dt.date(2026, 12, 3).weekday(), 28)
@@ -0,0 +1,17 @@
+import datetime as dt
+
+import moon_days
+
+UTC = dt.timezone.utc
+
+def test_sign_before_first_change():
+    # the first day starts before every change: its sign is the one preceding it
+    changes = ((dt.datetime(2028, 1, 1, 20, tzinfo=UTC), "Pisces"),)
+    day = moon_days.days(2028, "UTC", changes)[dt.date(2028, 1, 1)]
+    assert day.sign == "Aquarius"
+    assert [s for _, s in day.changes] == ["Pisces"]
+
+def test_new_year_east_of_utc():
+    # local Jan 1 starts on Dec 31 UTC, before the last change the old margin held
+    for tz in ("Asia/Tokyo", "Australia/Sydney", "Pacific/Auckland", "Pacific/Kiritimati"):
+        assert moon_days.days(2028, tz)[dt.date(2028, 1, 1)].sign == "Aquarius", tz
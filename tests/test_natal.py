@@ -0,0 +1,19 @@
+import datetime as dt
+
+import pytest
+
+import natal
+
+def test_each_bad_field_is_reported():
+    with pytest.raises(natal.FieldError) as e:
+        natal.birth_instant("1990-02-30", "12:00", None)
+    assert e.value.fields == {"birth_date": "'1990-02-30' is not a YYYY-MM-DD date",
+                              "city": "required (or an IANA tz)"}
+
+def test_birth_instant():
+    t = natal.birth_instant("1990-05-17", "14:30", "Oslo")
+    assert t == dt.datetime(1990, 5, 17, 12, 30, tzinfo=dt.timezone.utc)
+
+def test_find_timezone():
+    assert natal.find_timezone(" new york") == "America/New_York"
+    assert natal.find_timezone("Atlantis") is None
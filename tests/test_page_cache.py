@@ -0,0 +1,64 @@
+import datetime as dt
+import io
+
+import pytest
+from reportlab.pdfgen import canvas
+
+import page_cache
+
+pymupdf = pytest.importorskip("pymupdf")
+
+def _page(text):
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    c.drawString(72, 720, text)
+    c.showPage(); c.save()
+    return buf.getvalue()
+
+def _texts(path):
+    # a spliced file must parse without xref repair
+    with pymupdf.open(path) as doc:
+        assert not doc.is_repaired
+        return [p.get_text().strip() for p in doc]
+
+def _build(out, texts, cache_dir):
+    # a full build: every page drawn, then its keys recorded
+    c = canvas.Canvas(str(out))
+    for t in texts:
+        c.drawString(72, 720, t); c.showPage()
+    c.save()
+    page_cache.record(out, [page_cache.key(t) for t in texts], cache_dir)
+
+def test_rebuild_splices_changed_pages(tmp_path):
+    out, cache = tmp_path / "cal.pdf", tmp_path / "cache"
+    _build(out, ["Jan", "Feb", "Mar"], cache)
+    drawn = []
+    def rebuild(texts):
+        def render(i):
+            drawn.append(texts[i])
+            return _page(texts[i])
+        return page_cache.rebuild(out, [page_cache.key(t) for t in texts], render, cache)
+    assert rebuild(["Jan", "February", "Mar"]) == [1]
+    assert _texts(out) == ["Jan", "February", "Mar"]
+    assert rebuild(["Jan", "February", "Mar"]) == []
+    # a revert and a redo: each page drawn once, then taken from the cache
+    assert rebuild(["Jan", "Feb", "Mar"]) == [1]
+    assert rebuild(["Jan", "February", "Mar"]) == [1]
+    assert drawn == ["February", "Feb"]
+    assert _texts(out) == ["Jan", "February", "Mar"]
+
+def test_rebuild_needs_a_matching_record(tmp_path):
+    out, cache = tmp_path / "cal.pdf", tmp_path / "cache"
+    keys = [page_cache.key(t) for t in ["a", "b"]]
+    assert page_cache.rebuild(out, keys, _page, cache) is None        # never built
+    _build(out, ["a", "b"], cache)
+    assert page_cache.rebuild(out, keys + keys, _page, cache) is None  # page list changed
+    out.write_bytes(out.read_bytes() + b"\n")
+    assert page_cache.rebuild(out, keys, _page, cache) is None        # edited elsewhere
+
+def test_key_and_code_key():
+    assert page_cache.key("a", [1, 2]) == page_cache.key("a", [1, 2])
+    assert page_cache.key("a", [1, 2]) != page_cache.key("a", [2, 1])
+    assert page_cache.key(dt.date(2026, 1, 1)) == page_cache.key("2026-01-01")
+    ck = page_cache.code_key(page_cache, pytest)
+    assert len(ck) == 3 and ck == page_cache.code_key(page_cache, pytest)
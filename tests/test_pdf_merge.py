@@ -0,0 +1,65 @@
+import io
+
+import pytest
+from reportlab.pdfgen import canvas
+
+import fonts, pdf_merge
+
+pymupdf = pytest.importorskip("pymupdf")
+
+URI = "https://example.com/?ref=2 0 R&see=(1 0 R)"
+
+def _pdf(*texts, title="see 1 0 R"):
+    # one page per text, each with a link; the title, texts and link read
+    # like references
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    c.setTitle(title)
+    for text in texts:
+        c.drawString(72, 720, text)
+        c.linkURL(URI, (72, 700, 200, 730))
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+def _read(pdf):
+    with pymupdf.open(stream=pdf, filetype="pdf") as doc:
+        assert all(link["uri"] == URI for p in doc for link in p.get_links())
+        return [p.get_text().strip() for p in doc], doc.metadata["title"]
+
+def test_merge_keeps_reference_like_text():
+    a = _pdf("page 1: 3 0 R (nested (parens)) \\ 12 0 R", "page 2: 2 0 R")
+    b = _pdf("page 3: 1 0 R")
+    texts, title = _read(pdf_merge.merge([a, b]))
+    assert texts == ["page 1: 3 0 R (nested (parens)) \\ 12 0 R", "page 2: 2 0 R", "page 3: 1 0 R"]
+    assert title == "see 1 0 R"
+
+def test_splice_round_trip():
+    base = _pdf("a 4 0 R", "b 5 0 R", "c 6 0 R")
+    out = pdf_merge.splice(base, {1: _pdf("B 1 0 R")})
+    assert _read(out)[0] == ["a 4 0 R", "B 1 0 R", "c 6 0 R"]
+    # splicing the original page back gives the same pages again
+    again = pdf_merge.splice(out, {1: _pdf("b 5 0 R")})
+    assert _read(again)[0] == _read(base)[0]
+
+def test_scan_skips_strings_and_comments():
+    d = b"<< /A 1 0 R /T (x 2 0 R \\) 3 0 R) /H <4 0 52> % 5 0 R\n /K [ 6 0 R ] >>"
+    assert [n for _, _, n in pdf_merge._scan(d)] == [1, 6]
+
+def test_splice_shares_primed_font_subsets():
+    font = fonts.register("DejaVuSans", "Helvetica")
+    if font == "Helvetica":
+        pytest.skip("DejaVu fonts not installed")
+    def pdf(*texts):
+        buf = io.BytesIO()
+        c = canvas.Canvas(buf)
+        fonts.prime(c, [font], "★☽♈♉")
+        for text in texts:
+            c.setFont(font, 12); c.drawString(72, 720, text); c.showPage()
+        c.save()
+        return buf.getvalue()
+    base = pdf("♈ one", "♉ two ★", "three")
+    out = pdf_merge.splice(base, {1: pdf("♉ TWO ☽")})
+    assert _read(out)[0] == ["♈ one", "♉ TWO ☽", "three"]
+    # the replacement's font subset is base's, written once
+    assert len(out) < len(base) + 1000
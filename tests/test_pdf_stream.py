@@ -0,0 +1,45 @@
+import io
+
+import pytest
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+import fonts, pdf_stream
+
+pymupdf = pytest.importorskip("pymupdf")
+
+FONT = fonts.register("DejaVuSans", "Helvetica")
+TEXTS = ["Moon → Aries 02:37", "☽ Full Moon ○", "Sun → Capricorn ♑"]
+
+def _draw(c):
+    sizes = []
+    for t in TEXTS:
+        c.setFont(FONT, 14)
+        c.drawString(72, 720, t)
+        c.linkURL("https://example.com/", (72, 700, 200, 730))
+        c.showPage()
+        sizes.append(c._filename.tell() if isinstance(c, pdf_stream.Canvas) else None)
+    c.save()
+    return sizes
+
+def _read(pdf):
+    with pymupdf.open(stream=pdf, filetype="pdf") as doc:
+        return [p.get_text().strip() for p in doc], [len(p.get_links()) for p in doc]
+
+def test_pages_are_written_as_they_finish():
+    buf = io.BytesIO()
+    sizes = _draw(pdf_stream.Canvas(buf, pagesize=A4))
+    assert 0 < sizes[0] < sizes[1] < sizes[2] < len(buf.getvalue())
+    assert buf.getvalue().startswith(b"%PDF-1.4")
+    assert _read(buf.getvalue()) == (TEXTS, [1, 1, 1])
+
+def test_same_document_as_a_plain_canvas():
+    streamed, plain = io.BytesIO(), io.BytesIO()
+    _draw(pdf_stream.Canvas(streamed, pagesize=A4))
+    _draw(canvas.Canvas(plain, pagesize=A4))
+    assert _read(streamed.getvalue()) == _read(plain.getvalue())
+    # the font subset once for the whole document, named as a plain save names it
+    fonts_of = lambda pdf: [sorted(f[3] for f in p.get_fonts())
+                            for p in pymupdf.open(stream=pdf, filetype="pdf")]
+    assert fonts_of(streamed.getvalue()) == fonts_of(plain.getvalue())
+    assert len({f for page in fonts_of(streamed.getvalue()) for f in page}) == 2   # with the default Helvetica
@@ -0,0 +1,8 @@
+import lunar, profiling
+
+def test_session_counts_lunar_ephem_calls():
+    with profiling.session("lunations", profile=()) as rep:
+        with profiling.stage("solve"):
+            lunar.lunations.__wrapped__(2026)
+    assert rep.evals == {"Moon-lunation": 52, "Sun-eclipse": 252, "Moon-eclipse": 252}
+    assert rep.counters["ephem_evals"] == rep.stages["solve"][2] == 556
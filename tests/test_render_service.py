@@ -0,0 +1,14 @@
+import pytest
+
+import natal, render_service
+
+@pytest.mark.parametrize("order, fields", [
+    ([1, 2], {"order": "must be a JSON object"}),
+    ({"birth_date": "1990-05-17", "city": "Oslo", "name": 5}, {"name": "5 is not a name"}),
+    ({"birth_date": "1990-05-17", "city": "Oslo", "year": 9999}, {"year": "only 2026-2035 calendars are offered"}),
+    ({"birth_date": "1990-05-17", "city": 3}, {"city": "unknown birth city 3; pass an IANA tz instead"}),
+])
+def test_bad_orders_name_their_fields(order, fields):
+    with pytest.raises(natal.FieldError) as e:
+        render_service.prepare_order(order)
+    assert e.value.fields == fields
@@ -0,0 +1,24 @@
+import datetime as dt
+
+import ephem
+
+import stations
+
+UTC = dt.timezone.utc
+
+def test_mercury_stations_2026():
+    # three retrograde periods, each turning R then D
+    got = stations.scan_stations(2026, ["Mercury"])["Mercury"]
+    assert [k for _, k in got] == ["R", "D"]*3
+    expected = [(2, 26, 6, 48), (3, 20, 19, 33), (6, 29, 17, 36),
+                (7, 23, 22, 57), (10, 24, 7, 12), (11, 13, 15, 54)]
+    for (t, _), when in zip(got, expected):
+        assert abs(t - dt.datetime(2026, *when, tzinfo=UTC)) <= dt.timedelta(minutes=5), t
+
+def test_speed_sign_matches_station():
+    # retrograde between the February R and the March D station
+    (r, _), (d, _) = stations.scan_stations(2026, ["Mercury"])["Mercury"][:2]
+    mid = r + (d - r)/2
+    t = ephem.Date(mid.replace(tzinfo=None))
+    assert stations.speed("Mercury", t) < 0
+    assert stations.speed("Mercury", ephem.Date(t - 30)) > 0
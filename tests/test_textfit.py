@@ -0,0 +1,33 @@
+import pytest
+from reportlab.pdfbase import pdfmetrics
+
+import fonts, textfit
+
+FONT = fonts.register("DejaVuSans", "Helvetica")
+LABEL = "Mercury → Sagittarius 23:41 ☿ stations direct in the small hours"
+
+def test_width_matches_reportlab():
+    for size in (6.7, 7.2, 11):
+        assert textfit.width(LABEL, FONT, size) == pytest.approx(pdfmetrics.stringWidth(LABEL, FONT, size))
+
+@pytest.mark.parametrize("max_w", [20, 60, 95, 120, 200, 400])
+def test_fit_size_is_the_largest_rung_that_fits(max_w):
+    text = LABEL[:24]
+    size = textfit.fit_size(text, FONT, max_w)
+    rungs = [7.2 - n*0.2 for n in range(4)]   # 7.2 .. 6.6, the first at or under 6.7 last
+    assert min(rungs, key=lambda r: abs(r - size)) == pytest.approx(size)
+    larger = [r for r in rungs if r > size + 1e-9]
+    assert all(pdfmetrics.stringWidth(text, FONT, r) > max_w for r in larger)
+    if size > rungs[-1] + 1e-9:
+        assert pdfmetrics.stringWidth(text, FONT, size) <= max_w + 1e-9
+
+@pytest.mark.parametrize("max_w", [30, 70, 150, 1000])
+def test_wrap_round_trip(max_w):
+    lines = textfit.wrap(LABEL, FONT, 7, max_w)
+    assert " ".join(lines) == LABEL
+    for line in lines:
+        # a line only overflows when it is a single word too wide on its own
+        assert " " not in line or pdfmetrics.stringWidth(line, FONT, 7) <= max_w + 1e-9
+    # greedy: the next line's first word would not have fit on the line before
+    for a, b in zip(lines, lines[1:]):
+        assert pdfmetrics.stringWidth(f"{a} {b.split(' ')[0]}", FONT, 7) > max_w
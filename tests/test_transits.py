@@ -0,0 +1,34 @@
+import numpy as np
+
+from lon_table import LonTable
+from natal import TRANSITING
+import transits
+
+def _index(year=2026):
+    # every body 1 deg a day from 0 (359 the noon before the year, 5 the one
+    # after): each integer longitude is hit exactly at a noon
+    days = 365
+    lons = np.tile(np.arange(days, dtype=np.float64) % 360.0, (len(TRANSITING), 1))
+    edges = ([359.0]*len(TRANSITING), [5.0]*len(TRANSITING))
+    return transits.TransitIndex(LonTable(year, "UTC", TRANSITING, lons), edge_lons=edges)
+
+def test_crossing_at_a_sample_counts_once():
+    idx = _index()
+    hits = [(b, t) for b, t, _ in idx.crossings([10.0]) if b == 0]
+    # instants[0] is the noon before the year: day 10 is instants[11]
+    assert hits == [(0, idx.instants[11])]
+
+def test_crossing_between_samples():
+    idx = _index()
+    hits = [(b, t) for b, t, _ in idx.crossings([10.5]) if b == 0]
+    assert len(hits) == 1
+    assert abs(hits[0][1] - (idx.instants[11] + idx.instants[12])/2) < 1e-9
+
+def test_crossings_in_the_first_and_last_half_days():
+    idx = _index()
+    # 359.5: between Dec 31 and Jan 1 noon (the year's first 12 hours), 4.5:
+    # again between Dec 31 and Jan 1 noon at the end of the year
+    first = [t for b, t, _ in idx.crossings([359.5]) if b == 0]
+    assert abs(first[0] - (idx.instants[0] + idx.instants[1])/2) < 1e-9
+    last = [t for b, t, _ in idx.crossings([4.5]) if b == 0]
+    assert abs(last[-1] - (idx.instants[-2] + idx.instants[-1])/2) < 1e-9
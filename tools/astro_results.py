@@ -0,0 +1,147 @@
+# astro_results.py
+# The year's astro events as exact UTC instants, computed once and shared by
+# every page renderer and every timezone.
+#
+#   res = astro_results.get(2026)          # UTC instants; memoized and on disk
+#   oslo = res.local("Europe/Oslo")        # the same instants on Oslo dates
+#
+# Instants are solved for the UTC year plus MARGIN days on either side, so
+# any timezone's local year lies inside them. local(tz) does no astronomy:
+# it converts instants to local dates and keeps the year's (a few ms), so a
+# calendar for each of dozens of zones -- or a personalized order's birth
+# city -- costs one computation. Results (lunations and eclipses included)
+# are memoized in-process by (year, body set) and persisted as JSON under
+# serene-site/.cache/astro, so a layout-only rerun skips ephem entirely.
+
+import json, os
+import datetime as dt
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import ephem
+import ingress_engine, lunar, moon_days, stations
+from ingress_engine import to_utc
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "astro"
+FORMAT = 6   # bump when the stored layout or the solver changes (6: lunations stored)
+MARGIN = moon_days.MARGIN   # days beyond the UTC year; lunar.lunations() covers the same span
+
+SEASONS = [(ephem.next_vernal_equinox, "Spring Equinox"), (ephem.next_summer_solstice, "Summer Solstice"),
+           (ephem.next_autumnal_equinox, "Autumn Equinox"), (ephem.next_winter_solstice, "Winter Solstice")]
+
+class AstroResults:
+    # ingresses: {body: [(aware UTC datetime, sign entered)]}
+    # moon_ingresses: [(aware UTC datetime, sign entered)], moon_days.ingresses(year)
+    # lunations: (lunar.Lunation, ...), lunar.lunations(year)
+    # stations: {body: [(aware UTC datetime, "R" | "D")]}, Mercury..Pluto
+    # seasons: [(aware UTC datetime, "Spring Equinox" | ...)]
+    def __init__(self, year, bodies, ingresses, moon_ingresses, lunations, stations, seasons):
+        self.year = year
+        self.bodies = tuple(bodies)
+        self.ingresses = ingresses
+        self.moon_ingresses = tuple(moon_ingresses)
+        self.lunations = tuple(lunations)
+        self.stations = stations
+        self.seasons = seasons
+        self._local = {}   # tz -> LocalAstro
+
+    def local(self, tz):
+        # -> this year's events re-bucketed onto local dates in `tz` (memoized)
+        if tz not in self._local:
+            self._local[tz] = LocalAstro(self, tz)
+        return self._local[tz]
+
+    def to_json(self):
+        rows = lambda items: [[t.isoformat(), x] for t, x in items]
+        return {
+            "format": FORMAT, "ephem": ephem.__version__,
+            "year": self.year, "bodies": list(self.bodies),
+            "ingresses": {b: rows(items) for b, items in self.ingresses.items()},
+            "moon_ingresses": rows(self.moon_ingresses),
+            "lunations": [[l.instant.isoformat(), l.kind, l.sign, l.node_dist, l.eclipse]
+                          for l in self.lunations],
+            "stations": {b: rows(items) for b, items in self.stations.items()},
+            "seasons": rows(self.seasons),
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        rows = lambda items: [(dt.datetime.fromisoformat(t), x) for t, x in items]
+        return cls(data["year"], data["bodies"],
+                   {b: rows(items) for b, items in data["ingresses"].items()},
+                   rows(data["moon_ingresses"]),
+                   [lunar.Lunation(dt.datetime.fromisoformat(t), *rest) for t, *rest in data["lunations"]],
+                   {b: rows(items) for b, items in data["stations"].items()},
+                   rows(data["seasons"]))
+
+class LocalAstro:
+    # one timezone's view of an AstroResults: each instant on its local date,
+    # for the local calendar year only
+    # ingresses / stations: {body: [(date, sign | "R" | "D", aware UTC datetime)]}
+    # seasons: {date: label}; moon: {date: moon_days.MoonDay}
+    # lunations: [(date, lunar.Lunation)]; new_moons / full_moons: {date: sign}
+    # eclipses: [(date, "Solar" | "Lunar", sign)]
+    def __init__(self, res, tz):
+        zone = ZoneInfo(tz)
+        year = self.year = res.year
+        self.tz = tz
+        def dated(items):
+            out = [(t.astimezone(zone).date(), x, t) for t, x in items]
+            return [row for row in out if row[0].year == year]
+        self.ingresses = {b: dated(items) for b, items in res.ingresses.items()}
+        self.stations = {b: dated(items) for b, items in res.stations.items()}
+        self.seasons = {d: label for d, label, _ in dated(res.seasons)}
+        self.moon = moon_days.days(year, tz, res.moon_ingresses)
+        self.lunations = [(l.local_date(tz), l) for l in lunar.in_year(year, tz, res.lunations)]
+        self.new_moons, self.full_moons = lunar.phases(year, tz, res.lunations)
+        self.eclipses = lunar.eclipses(year, tz, res.lunations)
+
+    def sun_ingresses(self):
+        # [(date, sign)]
+        return [(d, sign) for d, sign, _ in self.ingresses.get("Sun", [])]
+
+def seasons(year):
+    start = ephem.Date(dt.datetime(year, 1, 1))
+    return [(to_utc(fn(start)), label) for fn, label in SEASONS]
+
+def compute(year, bodies=ingress_engine.PLANETS):
+    return AstroResults(year, bodies,
+                        ingress_engine.scan_ingresses(year, bodies, MARGIN),
+                        moon_days.ingresses(year),
+                        lunar.lunations(year),
+                        stations.scan_stations(year, margin=MARGIN),
+                        seasons(year))
+
+# ---------- memo + disk cache ----------
+_memo = {}
+
+def _cache_path(cache_dir, year, bodies):
+    return Path(cache_dir) / f"{year}-{'-'.join(bodies)}.json"
+
+def seed(res):
+    # make `res` what get() returns for its year and bodies in this process
+    # (results handed over by a parent, see batch_build.py)
+    _memo[(res.year, res.bodies)] = res
+
+def get(year, bodies=ingress_engine.PLANETS, cache_dir=CACHE_DIR):
+    key = (year, tuple(bodies))
+    if key in _memo:
+        return _memo[key]
+    path = _cache_path(cache_dir, *key) if cache_dir else None
+    res = None
+    if path and path.exists():
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("format") == FORMAT and data.get("ephem") == ephem.__version__:
+                res = AstroResults.from_json(data)
+        except (ValueError, KeyError):
+            res = None   # corrupt or stale: recompute
+    if res is None:
+        res = compute(*key)
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(res.to_json()), encoding="utf-8")
+            os.replace(tmp, path)
+    _memo[key] = res
+    return res
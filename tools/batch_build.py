@@ -0,0 +1,130 @@
+# batch_build.py
+# Render a downloads/-style tree for a matrix of year × format × style in parallel.
+#
+#   python tools/batch_build.py --years 2026 2027 --formats 12 --styles core
+#   python tools/batch_build.py --tz Europe/Oslo America/New_York Asia/Tokyo
+#
+# The parent solves each year's astro events once (astro_results.py) and
+# hands them to the pool serialized: one JSON blob per year in shared
+# memory, which every worker parses into its own copy when it starts. The
+# workers never touch ephem or the disk cache and only re-date the events
+# for their zone, so a calendar per zone costs drawing alone. A worker's
+# output ("Saved: ...") is collected and printed by the parent, one job
+# at a time. Output goes to
+# build/ (--out downloads to replace the published PDFs). A zone other than
+# the generator's own is written next to the default PDF with the zone in
+# its name. Combinations without a generator in tools/ are reported and
+# skipped. A PDF already in the tree gets only the pages whose inputs
+# changed redrawn (page_cache.py); --full writes every PDF from scratch.
+
+import argparse, contextlib, importlib, io, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import astro_results
+from calendars import GENERATORS
+
+SITE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR  = SITE_DIR / "build"
+
+FORMATS = ["12", "13"]
+STYLES  = ["core", "color", "deluxe", "deluxe-wgbs"]
+
+def out_path(out_dir, year, fmt, style, tz=None):
+    # tz: None for the generator's own zone, else an IANA name put in the file name
+    zone = f"-{tz.replace('/', '_')}" if tz else ""
+    if style.endswith("-wgbs"):
+        return Path(out_dir) / fmt / f"{style[:-5]}-{year}-wgbs-v1{zone}.pdf"
+    return Path(out_dir) / fmt / f"{style}-{year}-v1{zone}.pdf"
+
+# ---------- shared astro results ----------
+def publish_results(years):
+    # -> (shared-memory blocks to unlink later, specs for the workers); each
+    # block holds one year's AstroResults.to_json() as UTF-8 JSON
+    blocks, specs = [], []
+    for year in years:
+        blob = json.dumps(astro_results.get(year).to_json()).encode()
+        shm = shared_memory.SharedMemory(create=True, size=len(blob))
+        shm.buf[:len(blob)] = blob
+        blocks.append(shm)
+        specs.append((shm.name, len(blob)))
+    return blocks, specs
+
+def _attach(specs):
+    # pool initializer: parse every year's blob into this worker's memo
+    for name, size in specs:
+        # workers share the parent's resource tracker, and the parent unlinks
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            data = json.loads(bytes(shm.buf[:size]))
+        finally:
+            shm.close()
+        astro_results.seed(astro_results.AstroResults.from_json(data))
+
+def _render(job, incremental=True):
+    # -> (job, seconds, what the generator printed)
+    year, tz, fmt, style, out = job
+    gen = importlib.import_module(GENERATORS[(fmt, style)])
+    Path(out).parent.mkdir(parents=True, exist_ok=True)
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()) as log:
+        gen.build(year=year, out=str(out), tz=tz, incremental=incremental)
+    return job, time.perf_counter() - t0, log.getvalue()
+
+# ---------- driver ----------
+def run(years, formats=FORMATS, styles=STYLES, out_dir=OUT_DIR, jobs=None, full=False, zones=(None,)):
+    # zones: IANA names, None for each generator's own TZ
+    # -> ([(job, seconds, output)], [skipped (year, fmt, style)])
+    jobs_todo, skipped = [], []
+    for year in years:
+        for fmt in formats:
+            for style in styles:
+                if (fmt, style) not in GENERATORS:
+                    skipped.append((year, fmt, style))
+                    continue
+                own = importlib.import_module(GENERATORS[(fmt, style)]).TZ
+                for tz in dict.fromkeys(None if z == own else z for z in zones):
+                    jobs_todo.append((year, tz, fmt, style, out_path(out_dir, year, fmt, style, tz)))
+    if not jobs_todo:
+        return [], skipped
+
+    # solved here once per year
+    blocks, specs = publish_results(sorted(set(years)))
+    done = []
+    try:
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(),
+                                 initializer=_attach, initargs=(specs,)) as pool:
+            for fut in as_completed([pool.submit(_render, j, not full) for j in jobs_todo]):
+                done.append(fut.result())
+    finally:
+        for shm in blocks:
+            shm.close(); shm.unlink()
+    return done, skipped
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Batch-render calendar PDFs.")
+    ap.add_argument("--years", type=int, nargs="+", default=[2026])
+    ap.add_argument("--formats", nargs="+", default=FORMATS, choices=FORMATS)
+    ap.add_argument("--styles", nargs="+", default=STYLES, choices=STYLES)
+    ap.add_argument("--out", type=Path, default=OUT_DIR)
+    ap.add_argument("--tz", nargs="+", default=[None], metavar="ZONE",
+                    help="IANA zones to render each calendar for (default: the generator's own)")
+    ap.add_argument("--jobs", type=int, default=None)
+    ap.add_argument("--full", action="store_true",
+                    help="redraw every page instead of only the changed ones")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    done, skipped = run(args.years, args.formats, args.styles, args.out, args.jobs, args.full, args.tz)
+    for (year, tz, fmt, style, out), secs, log in sorted(done, key=lambda d: str(d[0][4])):
+        print(f"{year} {fmt:>2}-month {style:<12} {secs:6.2f}s  {out}")
+        for line in log.splitlines():
+            print(f"    {line}")
+    for year, fmt, style in skipped:
+        print(f"{year} {fmt:>2}-month {style:<12} skipped (no generator in tools/)")
+    print(f"{len(done)} PDFs in {time.perf_counter() - t0:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
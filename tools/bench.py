@@ -0,0 +1,295 @@
+# bench.py
+# Benchmarks for the astro and render pipelines. Offline: everything is
+# computed locally with ephem and drawn into memory.
+#
+#   python tools/bench.py                  # run and compare with bench_baseline.json
+#   python tools/bench.py --save           # run and make this the baseline
+#   python tools/bench.py --only scan_ingresses textfit --repeat 5
+#
+# Each stage runs --repeat times and reports its median wall time, the
+# ephemeris evaluations of one run (ingress_engine.EVALS, lunar.py's
+# searches included) and its peak traced memory, measured in one extra run
+# under tracemalloc (which slows code down, so it is kept out of the
+# timings); timings run with the garbage collector off, after a collection. Astro stages compute from scratch: they
+# call the solvers directly, past the memo and disk caches the builds use,
+# and never look at .cache: the ephem stages take the fallback path, the
+# *_store ones read a one-year longitude store bench builds for itself (in a
+# temporary directory, once per run), so a fresh checkout counts the same.
+# A stage regresses when it makes more ephemeris calls than the baseline, or
+# its peak memory is more than --tolerance (and more than NOISE) above it;
+# the exit status is then 1. A stage that is that much slower is only
+# reported, unless --strict: the same tree's timings swing by a quarter
+# from one process to the next, and are only comparable at all on the
+# machine the baseline was saved on. Evaluation counts are exact everywhere.
+
+import argparse, atexit, functools, gc, io, json, platform, shutil, statistics, sys, tempfile, time, tracemalloc
+import datetime as dt
+from contextlib import contextmanager
+from pathlib import Path
+
+import ephem, reportlab
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.pdfgen import canvas
+
+import ingress_engine, ephem_cache, lon_store, lon_table, lunar, moon_days, natal, stations, textfit, transits
+import serene_12month_2026_full as serene
+import build_2026_12mo_full as b12
+import astro_results
+
+BASELINE = Path(__file__).resolve().parent / "bench_baseline.json"
+FORMAT = 3   # bump when stages change meaning (2: ephem and store paths apart, 3: lunar counted)
+NOISE = {"ms": 5.0, "peak_kb": 16.0}   # increases below these never count as regressions
+HARD = {"evals", "peak_kb"}            # what fails the run without --strict
+
+STAGES = {}   # name -> fn(year, timed); fn wraps the measured part in `with timed():`
+ZONES = ["Pacific/Honolulu", "America/New_York", "UTC", "Europe/Oslo", "Asia/Kolkata",
+         "Asia/Tokyo", "Australia/Sydney", "Pacific/Auckland"]
+
+def stage(name):
+    def register(fn):
+        STAGES[name] = fn
+        return fn
+    return register
+
+def _canvas():
+    return canvas.Canvas(io.BytesIO(), pagesize=landscape(A4))
+
+@functools.lru_cache(maxsize=None)
+def _store(year):
+    # a store of `year` alone, whatever .cache holds
+    tmp = tempfile.mkdtemp(prefix="bench-lons-")
+    atexit.register(shutil.rmtree, tmp, True)
+    return lon_store.LonStore(lon_store.precompute(year, year, cache_dir=tmp))
+
+def _moon_window(year):
+    # the span moon_days.ingresses() solves
+    return (float(ephem.Date(dt.datetime(year, 1, 1))) - moon_days.MARGIN,
+            float(ephem.Date(dt.datetime(year + 1, 1, 1))) + moon_days.MARGIN)
+
+# ---------- astro ----------
+@stage("scan_ingresses")
+def _(year, timed):
+    with timed():
+        ingress_engine.scan_ingresses(year, ingress_engine.PLANETS)
+
+@stage("noon_longitudes")
+def _(year, timed):
+    # what ephem_cache writes to disk on a cold cache without a store: every
+    # body, every noon
+    ts = ephem_cache.day_instants(year, serene.TZ)
+    with timed():
+        for body in serene.TABLE_BODIES:
+            [ingress_engine.lon_at(body, t) for t in ts]
+
+@stage("noon_longitudes_store")
+def _(year, timed):
+    # ... and with one
+    store, ts = _store(year), ephem_cache.day_instants(year, serene.TZ)
+    with timed():
+        for body in serene.TABLE_BODIES:
+            store.lons(body, ts)
+
+@stage("projection")
+def _(year, timed):
+    # the shared UTC results re-dated for a spread of zones, as a batch over
+    # zones does after the one astro computation
+    res = astro_results.get(year)
+    with timed():
+        for tz in ZONES:
+            astro_results.LocalAstro(res, tz)
+
+# mercury_retrograde_periods is gone: retrograde runs come from the exact
+# stations
+@stage("scan_stations")
+def _(year, timed):
+    with timed():
+        stations.scan_stations(year)
+
+@stage("transits")
+def _(year, timed):
+    # a personalized order's overlay: the year's transit index over the
+    # daily noon table, and one natal chart's exact aspects
+    table = lon_table.daily_table(year, serene.TZ, serene.TABLE_BODIES)
+    chart = natal.natal_positions(natal.birth_instant("1990-05-17", "14:30", "Oslo"))
+    edges = transits.edges(table)
+    with timed():
+        transits.TransitIndex(table, edge_lons=edges).transit_days(chart)
+
+@stage("moon_days")
+def _(year, timed):
+    # each local day's Moon changes and dominant sign from the year's solved
+    # changes, for a spread of zones
+    changes = moon_days.ingresses(year)
+    with timed():
+        for tz in ZONES:
+            moon_days.days(year, tz, changes)
+
+@stage("lunations")
+def _(year, timed):
+    with timed():
+        lunar.lunations.__wrapped__(year)
+
+@stage("moon_ingresses")
+def _(year, timed):
+    t0, t1 = _moon_window(year)
+    with timed():
+        ingress_engine.body_ingresses("Moon", t0, t1)
+
+@stage("moon_ingresses_store")
+def _(year, timed):
+    store, (t0, t1) = _store(year), _moon_window(year)
+    with timed():
+        moon_days._from_store(store, t0, t1)
+
+# ---------- events and text ----------
+@stage("index_events")
+def _(year, timed):
+    tables = serene.drawing(year).t
+    with timed():
+        serene.index_events(tables)
+
+@stage("index_events_b12")
+def _(year, timed):
+    astro = astro_results.get(year, ingress_engine.PLANETS).local(b12.TZ)
+    with timed():
+        b12.index_events(year, astro)
+
+@stage("textfit")
+def _(year, timed):
+    # every cell's lines fitted from cold measurement caches, as a fresh
+    # process draws them
+    dr = serene.drawing(year)
+    days = sorted(dr.t.events.by_date)
+    usable = serene.CELL_W - 2*serene.CELL_PAD
+    textfit.em_width.cache_clear(); textfit._advances.clear()
+    with timed():
+        for d in days:
+            for txt in serene.cell_lines(serene.day_events(dr, d), dr.t.zone):
+                size = textfit.fit_size(txt, serene.FONT_BOLD, usable)
+                if textfit.width(txt, serene.FONT_BOLD, size) > usable:
+                    serene.wrap_to_width(txt, serene.FONT_BOLD, size, usable)
+
+# ---------- drawing and PDF ----------
+@stage("draw_month_gregorian")
+def _(year, timed):
+    dr = serene.drawing(year)
+    dr.c = _canvas()
+    with timed():
+        for m in range(1, 13):
+            serene.draw_month_gregorian(dr, m); dr.c.showPage()
+
+@stage("month_card")
+def _(year, timed):
+    astro = astro_results.get(year, ingress_engine.PLANETS).local(b12.TZ)
+    events = b12.index_events(year, astro)
+    c = _canvas()
+    with timed():
+        for page in range(2):
+            b12.render_month_page(c, events, page, year)
+
+@stage("canvas_save")
+def _(year, timed):
+    dr = serene.drawing(year)
+    dr.c = _canvas()
+    for page in serene.PAGES:
+        serene.draw_page(dr, page)
+    with timed():
+        dr.c.save()
+
+# ---------- harness ----------
+def measure(fn, year, repeat):
+    # -> {"ms": median wall time, "evals": ephem evaluations, "peak_kb": peak traced memory}
+    res = {"ms": None, "evals": None, "peak_kb": None}
+    times = []
+
+    @contextmanager
+    def timed():
+        before = sum(ingress_engine.EVALS.values())
+        if tracemalloc.is_tracing():
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            yield
+            res["peak_kb"] = round((tracemalloc.get_traced_memory()[1] - base)/1024, 1)
+            return
+        gc.collect(); gc.disable()
+        try:
+            t0 = time.perf_counter()
+            yield
+            ms = (time.perf_counter() - t0)*1000
+        finally:
+            gc.enable()
+        times.append(ms)
+        res["evals"] = sum(ingress_engine.EVALS.values()) - before
+
+    for _ in range(repeat):
+        fn(year, timed)
+    res["ms"] = round(statistics.median(times), 3)
+    tracemalloc.start()
+    try:
+        fn(year, timed)
+    finally:
+        tracemalloc.stop()
+    return res
+
+def run(year=2026, only=None, repeat=5):
+    stages = {n: STAGES[n] for n in (only or STAGES)}
+    return {"format": FORMAT, "year": year, "repeat": repeat,
+            "python": platform.python_version(), "machine": platform.machine(),
+            "ephem": ephem.__version__, "reportlab": reportlab.Version,
+            "stages": {name: measure(fn, year, repeat) for name, fn in stages.items()}}
+
+def regressions(result, baseline, tolerance=0.25):
+    # -> [(stage, what, baseline value, new value)]
+    out = []
+    for name, new in result["stages"].items():
+        old = baseline.get("stages", {}).get(name)
+        if old is None:
+            continue
+        if new["evals"] > old["evals"]:
+            out.append((name, "evals", old["evals"], new["evals"]))
+        for what, noise in NOISE.items():
+            if new[what] > old[what]*(1 + tolerance) and new[what] - old[what] > noise:
+                out.append((name, what, old[what], new[what]))
+    return out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark the astro and render pipelines.")
+    ap.add_argument("--year", type=int, default=2026)
+    ap.add_argument("--only", nargs="+", choices=list(STAGES))
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--baseline", type=Path, default=BASELINE)
+    ap.add_argument("--save", action="store_true", help="store the results as the baseline")
+    ap.add_argument("--tolerance", type=float, default=0.25,
+                    help="allowed relative increase in time and memory")
+    ap.add_argument("--strict", action="store_true", help="fail on slower stages too")
+    ap.add_argument("--json", type=Path, help="also write the results here")
+    args = ap.parse_args(argv)
+
+    result = run(args.year, args.only, args.repeat)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    if baseline.get("format") != FORMAT:
+        baseline = {}   # stages meant something else then
+    old = baseline.get("stages", {})
+    print(f"{'stage':<22} {'ms':>9} {'evals':>7} {'peak KB':>9}   vs baseline")
+    for name, r in result["stages"].items():
+        vs = ""
+        if name in old and old[name]["ms"]:
+            vs = f"{(r['ms']/old[name]['ms'] - 1)*100:+6.1f}% time"
+        print(f"{name:<22} {r['ms']:9.2f} {r['evals']:7d} {r['peak_kb']:9.1f}   {vs}")
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=1) + "\n")
+    if args.save:
+        if baseline and args.only:
+            result["stages"] = {**old, **result["stages"]}
+        args.baseline.write_text(json.dumps(result, indent=1) + "\n")
+        print(f"Saved baseline: {args.baseline}")
+        return 0
+    bad = 0
+    for name, what, a, b in regressions(result, baseline, args.tolerance):
+        hard = args.strict or what in HARD
+        bad += hard
+        print(f"{'REGRESSION' if hard else 'slower'} {name}: {what} {a} -> {b}")
+    return 1 if bad else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
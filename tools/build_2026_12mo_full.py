@@ -1,25 +1,28 @@
 # build_2026_12mo_full.py
-# 12-month 2026 calendar with astro features (Moon-in, phases, eclipses,
-# Sun & planet ingresses, solstices/equinoxes, meteor peaks).
-# Output: serene-site/downloads/12/core-2026-v1.pdf
+# 12-month calendar with astro features (Moon-in, phases, eclipses,
+# Sun & planet ingresses, solstices/equinoxes, meteor peaks), for 2026 or
+# any other year: build(year=2027).
+# Output: serene-site/downloads/12/core-<year>-v1.pdf
 
 from reportlab.lib.pagesizes import A4, landscape
-from reportlab.pdfgen import canvas
 from reportlab.lib import colors
 from reportlab.lib.units import cm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 
-import ephem, math, calendar
-from datetime import datetime, timedelta, date
+import math, sys, calendar, functools, io
+import ingress_engine, astro_results, event_index, month_layout, pdf_stream, page_cache, profiling
+from datetime import timezone, date
+from zoneinfo import ZoneInfo
 from pathlib import Path
 
 # ---------- paths ----------
 SCRIPT_DIR = Path(__file__).resolve().parent
 SITE_DIR   = SCRIPT_DIR.parent
-OUT_DIR    = SITE_DIR / "downloads" / "12"
-OUT_DIR.mkdir(parents=True, exist_ok=True)
-PDF_PATH = OUT_DIR / "core-2026-v1.pdf"
+OUT_DIR    = SITE_DIR / "downloads" / "12"   # created by build()
+
+def pdf_path(year, tz):
+    # the default output; a zone other than TZ goes in the file name
+    zone = "" if tz == TZ else "-" + tz.replace("/", "_")
+    return OUT_DIR / f"core-{year}-v1{zone}.pdf"
 
 # ---------- page/layout ----------
 W, H = landscape(A4)
@@ -29,7 +32,8 @@ GAP    = 0.22*cm
 FONT = "Helvetica"
 BOLD = "Helvetica-Bold"
 
-YEAR = 2026
+YEAR = 2026   # default year
+TZ   = "UTC"   # default zone for calendar dates and Moon-change times (build(tz=...) for others)
 
 # seasonal background tints behind each month card (soft)
 TINTS = {
@@ -47,213 +51,158 @@ def sign_from_lon(lon_deg):
     i = int(math.floor((lon_deg % 360.0)/30.0))
     return SIGNS[i]
 
-# ---------- daily Moon-in (noon UTC proxy) ----------
-def moon_sign_on(d: date):
-    # compute at 12:00 UTC as a stable proxy for "feel of the day"
-    t = ephem.Date(datetime(d.year, d.month, d.day, 12, 0, 0))
-    m = ephem.Moon(t)
-    ecl = ephem.Ecliptic(m)
-    lon_deg = float(ecl.lon) * 180.0/math.pi
-    return sign_from_lon(lon_deg)
-
 # ---------- planet sign change scan (Sun..Pluto) ----------
-PLANET_FUN = {
-    "Sun": ephem.Sun,
-    "Mercury": ephem.Mercury,
-    "Venus": ephem.Venus,
-    "Mars": ephem.Mars,
-    "Jupiter": ephem.Jupiter,
-    "Saturn": ephem.Saturn,
-    "Uranus": ephem.Uranus,
-    "Neptune": ephem.Neptune,
-    "Pluto": ephem.Pluto,
-}
-
-def ecliptic_lon_deg(body):
-    return float(ephem.Ecliptic(body).lon)*180.0/math.pi
-
-def planet_sign_at(dt_utc, name):
-    b = PLANET_FUN[name](ephem.Date(dt_utc))
-    return sign_from_lon(ecliptic_lon_deg(b))
-
 def scan_ingresses(year=YEAR):
-    # coarse-to-fine: step 6h, detect sign changes; then refine by binary search to hour.
-    start = datetime(year,1,1); end = datetime(year,12,31,23,59)
-    step = timedelta(hours=6)
-    ing = {k: [] for k in PLANET_FUN.keys()}
-    for pname in PLANET_FUN.keys():
-        t = start
-        prev = planet_sign_at(t, pname)
-        while t <= end:
-            t2 = t + step
-            cur = planet_sign_at(t2, pname)
-            if cur != prev:
-                # refine inside [t, t2]
-                lo, hi = t, t2
-                for _ in range(24):  # ~hour precision
-                    mid = lo + (hi-lo)/2
-                    if planet_sign_at(mid, pname) == prev:
-                        lo = mid
-                    else:
-                        hi = mid
-                dt = hi  # first moment in new sign
-                ing[pname].append( (dt.date(), cur) )
-                prev = cur
-            t = t2
-    return ing
-
-# ---------- fixed 2026 astro dates (from your corrections) ----------
-NEW_MOONS = [
-    date(2026,1,18), date(2026,3,19), date(2026,6,15), date(2026,8,12),
-    date(2026,9,11), date(2026,10,10), date(2026,11,9), date(2026,12,9)
-]
-FULL_MOONS = [
-    date(2026,1,3), date(2026,4,2), date(2026,8,28), date(2026,9,26),
-    date(2026,10,26), date(2026,11,24), date(2026,12,24)
-]
-ECLIPSES = [
-    ("Solar eclipse", date(2026,8,12)),
-    ("Lunar eclipse", date(2026,8,28)),
-]
-# Solstices / Equinoxes (calendar markers only; dates approximate & commonly used)
-SEASON_TURNS = [
-    ("March equinox", date(2026,3,20)),
-    ("June solstice", date(2026,6,21)),
-    ("September equinox", date(2026,9,22)),
-    ("December solstice", date(2026,12,21)),
-]
-# Meteor peaks (window written on both dates)
+    # {planet: [(exact UTC datetime, sign)]}; see ingress_engine for the solver
+    return ingress_engine.scan_ingresses(year, ingress_engine.PLANETS)
+
+# ---------- seasons and meteors ----------
+# Solstices / equinoxes: the solved instants (astro_results), named by month
+SEASON_TURNS = {3: "March equinox", 6: "June solstice", 9: "September equinox", 12: "December solstice"}
+# Meteor peaks: (month, day) of the two dates each window is written on
 METEORS = [
-    ("Quadrantids peak window", (date(2026,1,2),  date(2026,1,3))),
-    ("Lyrids peak window",      (date(2026,4,21), date(2026,4,22))),
-    ("Delta Aquarids peak window",(date(2026,7,28),date(2026,7,29))),
-    ("Perseids peak window",    (date(2026,8,12), date(2026,8,13))),
-    ("Orionids peak window",    (date(2026,10,21),date(2026,10,22))),
-    ("Taurids peak window",     (date(2026,11,4), date(2026,11,5))),
-    ("Leonids peak window",     (date(2026,11,17),date(2026,11,18))),
-    ("Geminids peak window",    (date(2026,12,13),date(2026,12,14))),
-    ("Ursids peak window",      (date(2026,12,21),date(2026,12,22))),
+    ("Quadrantids peak window",    (1,2),   (1,3)),
+    ("Lyrids peak window",         (4,21),  (4,22)),
+    ("Delta Aquarids peak window", (7,28),  (7,29)),
+    ("Perseids peak window",       (8,12),  (8,13)),
+    ("Orionids peak window",       (10,21), (10,22)),
+    ("Taurids peak window",        (11,4),  (11,5)),
+    ("Leonids peak window",        (11,17), (11,18)),
+    ("Geminids peak window",       (12,13), (12,14)),
+    ("Ursids peak window",         (12,21), (12,22)),
 ]
 
+# ---------- event index (what the grid shows, as typed records bucketed by date once) ----------
+def index_events(year, astro):
+    # astro: astro_results.LocalAstro, the shared instants on the calendar zone's dates
+    Event = event_index.Event
+    ev = event_index.EventIndex()
+    # Moon-in daily: the sign held for most of the day, or the exact change
+    for d, day in sorted(astro.moon.items()):
+        if day.changes:
+            t, entered = day.changes[0]
+            ev.add(Event(d, "moon", "Moon", day.sign, t.astimezone(timezone.utc), entered))
+        else:
+            ev.add(Event(d, "moon", "Moon", day.sign))
+    # Phases and eclipses (exact instants, on their local date)
+    for d, l in astro.lunations:
+        ev.add(Event(d, "phase", "Moon", l.sign, l.instant, l.kind))
+    for d, l in astro.lunations:
+        if l.eclipse:
+            ev.add(Event(d, "eclipse", "Sun" if l.eclipse == "Solar" else "Moon",
+                         l.sign, l.instant, l.eclipse))
+    # Solstices/Equinoxes, on their local date
+    for d in sorted(astro.seasons): ev.add(Event(d, "season", "Sun", detail=SEASON_TURNS[d.month]))
+    # Meteor windows (write on both dates)
+    for name, a, b in METEORS: ev.add_span(date(year, *a), date(year, *b), "meteor", detail=name)
+    # Sun & planet ingresses (computed)
+    for planet, items in astro.ingresses.items():
+        for d, sign, t_utc in items:
+            ev.add(Event(d, "ingress", planet, sign, t_utc))
+    return ev.sort()
+
+def event_label(e, tz=TZ):
+    # grid wording: plain words, no glyphs; times in `tz`
+    if e.kind == "moon":
+        if e.instant: return f"Moon → {e.detail} {e.instant.astimezone(ZoneInfo(tz)):%H:%M}"
+        return f"Moon in {e.sign}"
+    if e.kind == "phase":   return f"{e.detail} Moon"
+    if e.kind == "eclipse": return f"{e.detail} eclipse"
+    if e.kind == "ingress": return f"{e.body} → {e.sign}"
+    return e.detail   # season, meteor
+
 # ---------- text helpers ----------
 def add_line(c, x, y, w, text, font=FONT, size=8.7, color=colors.black):
     c.setFont(font, size); c.setFillColor(color)
     c.drawString(x, y, text)
 
-def draw_month(c, year, month, ingresses):
-    # card size grid (3 columns × 2 rows per page)
-    cols, rows = 3, 2
-    # (we’ll be called with absolute x,y,w,h)
-    pass
-
-# We’ll build each page manually to manage coordinates & spacing robustly
-def month_card(c, x, y, w, h, year, month, ingresses):
-    # background tint
-    c.setFillColor(TINTS[month]); c.roundRect(x, y, w, h, 10, fill=1, stroke=0)
-    # heading
-    c.setFillColor(colors.black)
-    c.setFont(BOLD, 16)
-    c.drawString(x+0.5*cm, y+h-0.75*cm, f"{calendar.month_name[month]} {year}")
+def use_form(c, name, draw):
+    # static chrome is drawn once per document as a PDF form and referenced after
+    if not c.hasForm(name):
+        c.beginForm(name); draw(); c.endForm()
+    c.doForm(name)
 
-    # header row (Mon–Sun)
+def card_grid(c, w, h):
+    # header row (Mon–Sun) and grid lines of a month card with its origin at 0,0
     headers = ["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]
     title_h = 1.1*cm
     header_h = 0.8*cm
-    grid_top = y + h - title_h
+    grid_top = h - title_h
     c.setFont(BOLD, 10)
     cell_w = w/7.0
     for i, wd in enumerate(headers):
-        add_line(c, x + i*cell_w + 0.08*cm, grid_top - 0.2*cm, wd, BOLD, 10)
+        add_line(c, i*cell_w + 0.08*cm, grid_top - 0.2*cm, cell_w, wd, BOLD, 10)
 
     # grid lines
     rows = 6
     cell_h = (h - title_h - header_h)/rows
     y0 = grid_top - header_h + 0.05*cm
-    c.setStrokeColor(colors.Color(0,0,0, alpha=0.12))
     for r in range(rows+1):
-        c.line(x, y0 - r*cell_h, x+w, y0 - r*cell_h)
+        c.line(0, y0 - r*cell_h, w, y0 - r*cell_h)
     for col in range(8):
-        c.line(x + col*cell_w, y0, x + col*cell_w, y0 - rows*cell_h)
-    c.setStrokeColor(colors.black)
-
-    # days matrix
-    cal = calendar.Calendar(firstweekday=0)  # Monday-first
-    matrix = cal.monthdatescalendar(year, month)
-
-    # pre-build event dict for this month (only what we show in-grid)
-    daily_events = {}
-    def push(d, s):
-        daily_events.setdefault(d, []).append(s)
-
-    # Moon-in daily
-    for week in matrix:
-        for d in week:
-            if d.month == month:
-                push(d, f"Moon in {moon_sign_on(d)}")
-
-    # Phases (grid shows only words "New Moon" / "Full Moon")
-    for d in NEW_MOONS:
-        if d.month == month: push(d, "New Moon")
-    for d in FULL_MOONS:
-        if d.month == month: push(d, "Full Moon")
-
-    # Eclipses (on the correct day only)
-    for name, d in ECLIPSES:
-        if d.month == month: push(d, name)
-
-    # Solstices/Equinoxes
-    for name, d in SEASON_TURNS:
-        if d.month == month: push(d, name)
+        c.line(col*cell_w, y0, col*cell_w, y0 - rows*cell_h)
+
+@functools.lru_cache(maxsize=None)
+def card_layout(w, h):
+    # cells of a w × h month card, relative to its bottom-left corner: six
+    # rows under the title and Mon–Sun header, spill-over days included
+    # (greyed, no events); day number top-right, text from a mid-anchor
+    title_h, header_h = 1.1*cm, 0.8*cm
+    cell_w = w/7.0
+    return month_layout.Layout(x=0.0, top=h - title_h - header_h + 0.05*cm, cell_w=cell_w,
+                               grid_h=h - title_h - header_h, rows=6, spill=True,
+                               number=(cell_w - 0.08*cm, 1.0, -0.22*cm), text=(0.08*cm, 1.0, -0.45*cm),
+                               line_gap=0.36*cm, floor=-0.17*cm, reserve=1)
 
-    # Meteor windows (write on both dates)
-    for name, (d1, d2) in METEORS:
-        if d1.month == month: push(d1, name)
-        if d2.month == month: push(d2, name)
+# We’ll build each page manually to manage coordinates & spacing robustly
+def month_card(c, x, y, w, h, year, month, events, tz=TZ):
+    # background tint
+    c.setFillColor(TINTS[month]); c.roundRect(x, y, w, h, 10, fill=1, stroke=0)
+    # heading
+    c.setFillColor(colors.black)
+    c.setFont(BOLD, 16)
+    c.drawString(x+0.5*cm, y+h-0.75*cm, f"{calendar.month_name[month]} {year}")
 
-    # Sun & planet ingresses (computed)
-    for planet, items in ingresses.items():
-        for d_local, sign in items:
-            if d_local.year==year and d_local.month==month:
-                arrow = "Sun →" if planet=="Sun" else f"{planet} →"
-                push(d_local, f"{arrow} {sign}")
-
-    # draw each cell
-    for r in range(rows):
-        if r >= len(matrix): break
-        week = matrix[r]
-        for col in range(7):
-            try: d = week[col]
-            except IndexError: continue
-            cx = x + col*cell_w
-            top = y0 - r*cell_h
-            # day number top-right
-            c.setFont(BOLD, 10)
-            if d.month == month:
-                c.setFillColor(colors.black)
-            else:
-                c.setFillColor(colors.Color(0,0,0, alpha=0.28))
-            c.drawRightString(cx + cell_w - 0.08*cm, top - 0.22*cm, str(d.day))
+    # header row (Mon–Sun) and grid lines: the same for every card, so drawn
+    # once as a form and placed at each card's origin
+    c.saveState(); c.translate(x, y)
+    # the lines' translucent stroke is set here and inherited by the form
+    # (reportlab does not carry ExtGState into form resources)
+    c.setStrokeColor(colors.Color(0,0,0, alpha=0.12))
+    use_form(c, f"card-grid-{round(w)}x{round(h)}", lambda: card_grid(c, w, h))
+    c.restoreState()
+
+    # the month's cells, worked out once per card size and month shape
+    lay = card_layout(w, h)
+    g = lay.grid(*month_layout.shape(year, month))
+    first = date(year, month, 1)
+    text_w = lay.cell_w - 0.16*cm
+    for cell in g.cells:
+        d = month_layout.cell_date(first, cell)
+        # day number top-right
+        c.setFont(BOLD, 10)
+        if d.month == month:
             c.setFillColor(colors.black)
-
-            # stacked text: start at a mid-anchor to avoid colliding with the number
-            line_y = top - 0.45*cm
-            line_h = 0.36*cm  # spacing
-            max_lines = int((cell_h - 0.28*cm)/line_h) - 1
-            lines = [s for s in daily_events.get(d, [])]
-            # special case: Aug 27 should NOT say Full/Lunar eclipse per your note
-            if d == date(2026,8,27):
-                lines = [s for s in lines if ("Full Moon" not in s and "Lunar eclipse" not in s)]
-            # render with overflow ellipsis
-            shown = 0
-            for s in lines:
-                if shown >= max_lines:
-                    add_line(c, cx+0.08*cm, line_y, cell_w-0.16*cm, "…", FONT, 9)
-                    break
-                add_line(c, cx+0.08*cm, line_y, cell_w-0.16*cm, s, FONT, 9)
-                shown += 1
-                line_y -= line_h
-
-def render_months(c, ingresses):
+        else:
+            c.setFillColor(colors.Color(0,0,0, alpha=0.28))
+        c.drawRightString(x + cell.number[0], y + cell.number[1], str(d.day))
+        c.setFillColor(colors.black)
+
+        # stacked text below the number; only this month's days carry
+        # events, spill-over days stay empty
+        line_x, line_y = x + cell.text[0], y + cell.text[1]
+        lines = [event_label(e, tz) for e in events.on(d)] if d.month == month else []
+        # render with overflow ellipsis
+        shown = 0
+        for s in lines:
+            if shown >= cell.max_lines:
+                add_line(c, line_x, line_y, text_w, "…", FONT, 9)
+                break
+            add_line(c, line_x, line_y, text_w, s, FONT, 9)
+            shown += 1
+            line_y -= lay.line_gap
+
+def render_month_page(c, events, page, year=YEAR, tz=TZ):
     # 3×2 months per page → 2 pages total
     cols, rows = 3, 2
     grid_w = W - 2*MARGIN
@@ -261,23 +210,23 @@ def render_months(c, ingresses):
     cell_w = (grid_w - (cols-1)*GAP)/cols
     cell_h = (grid_h - (rows-1)*GAP)/rows
 
-    months = list(range(1,13))
-    for page in range(2):
-        c.setFillColor(colors.white); c.rect(0,0,W,H, fill=1, stroke=0)
-        c.setFont(BOLD, 18); c.setFillColor(colors.black)
-        c.drawCentredString(W/2, H-0.9*cm, f"Serene · 12-Month Calendar — {YEAR}")
-        block = months[page*6:(page+1)*6]
-        for i, m in enumerate(block):
-            r = i//cols; col=i%cols
-            x = MARGIN + col*(cell_w+GAP)
-            y = H - MARGIN - (r+1)*cell_h - r*GAP
-            month_card(c, x, y, cell_w, cell_h, YEAR, m, ingresses)
-        c.setFont(FONT,9)
-        c.drawCentredString(W/2, 0.7*cm, "A4 landscape · print-friendly · © 2026 Serene")
-        c.showPage()
+    c.setFillColor(colors.white); c.rect(0,0,W,H, fill=1, stroke=0)
+    c.setFont(BOLD, 18); c.setFillColor(colors.black)
+    c.drawCentredString(W/2, H-0.9*cm, f"Serene · 12-Month Calendar — {year}")
+    for i, m in enumerate(page_months(page)):
+        r = i//cols; col=i%cols
+        x = MARGIN + col*(cell_w+GAP)
+        y = H - MARGIN - (r+1)*cell_h - r*GAP
+        month_card(c, x, y, cell_w, cell_h, year, m, events, tz)
+    c.setFont(FONT,9)
+    c.drawCentredString(W/2, 0.7*cm, "A4 landscape · print-friendly · © 2026 Serene")
+    c.showPage()
+
+def page_months(page):
+    return range(page*6 + 1, page*6 + 7)
 
 # ---------- Info / Reference pages ----------
-def info_page(c):
+def info_page(c, tz):
     c.setFillColor(colors.white); c.rect(0,0,W,H,fill=1,stroke=0)
     c.setFont(BOLD, 22); c.setFillColor(colors.black)
     c.drawCentredString(W/2, H-2.0*cm, "Information")
@@ -285,7 +234,7 @@ def info_page(c):
     y = H-3.0*cm
     lines = [
         "Moon phases shown as words in-grid: “New Moon”, “Full Moon”.",
-        "Daily “Moon in <Sign>” computed at local-noon proxy for a clean daily feel; not a minute-exact ephemeris.",
+        f"Daily “Moon in <Sign>”: the sign held for most of the day; “Moon → <Sign> hh:mm”: the exact change ({tz}).",
         "Sun and planet ingresses (Mercury → Pluto) are included on the calendar date.",
         "Solstices, equinoxes, and major meteor shower peak windows are included.",
         "Source cross-check: mooncalendar.astro-seek.com · All rights reserved.",
@@ -294,40 +243,30 @@ def info_page(c):
         c.drawString(2.0*cm, y, "• " + t); y -= 0.9*cm
     c.showPage()
 
-def zodiac_and_fullmoons_page(c):
+def zodiac_and_fullmoons_page(c, astro):
     c.setFillColor(colors.white); c.rect(0,0,W,H,fill=1,stroke=0)
     # layout: Full Moons (left), Zodiac keywords (bottom left), Sun Enters (right column)
     left_x = 2.0*cm; mid_x = W/2 + 0.5*cm; top_y = H - 2.0*cm
     c.setFont(BOLD, 18); c.setFillColor(colors.black)
-    c.drawString(left_x, top_y, "Full Moons · 2026")
+    c.drawString(left_x, top_y, f"Full Moons · {astro.year}")
     c.setFont(FONT, 12)
     y = top_y - 0.9*cm
     # Full Moons list (dates only; the grid itself has no sign words for phases)
-    fml = [
-        ("Jan 03", "Full Moon"),
-        ("Apr 02", "Full Moon"),
-        ("Aug 28", "Full Moon · Lunar eclipse"),
-        ("Sep 26", "Full Moon"),
-        ("Oct 26", "Full Moon"),
-        ("Nov 24", "Full Moon"),
-        ("Dec 24", "Full Moon"),
-    ]
-    for d, label in fml:
-        c.drawString(left_x, y, f"{d}: {label}"); y -= 0.7*cm
+    # phases & eclipses come with the shared astro results, on local dates
+    full_moons = astro.full_moons
+    lunar_ecl = {d for d, kind, _ in astro.eclipses if kind == "Lunar"}
+    for i, d in enumerate(sorted(full_moons)):
+        label = "Full Moon · Lunar eclipse" if d in lunar_ecl else "Full Moon"
+        c.drawString(left_x + (i//7)*6.5*cm, y - (i%7)*0.7*cm, f"{d.strftime('%b %d')}: {label}")
 
     # Sun enters signs (right column)
     c.setFont(BOLD, 18)
-    c.drawString(mid_x, top_y, "Sun Enters Signs · 2026")
+    c.drawString(mid_x, top_y, f"Sun Enters Signs · {astro.year}")
     c.setFont(FONT, 12)
     y2 = top_y - 0.9*cm
 
-    # Compute Sun ingresses from our scan (to avoid hardcoding)
-    sun_list = []
-    # we’ll re-scan quickly just for Sun for reliability
-    ing = scan_ingresses(YEAR)
-    for d, s in ing["Sun"]:
-        sun_list.append( (d, s) )
-    sun_list.sort(key=lambda x: x[0])
+    # Sun ingresses from the shared astro results (computed once per build)
+    sun_list = sorted(astro.sun_ingresses(), key=lambda x: x[0])
 
     for d, s in sun_list:
         c.drawString(mid_x, y2, f"{d.strftime('%b %d')}: Sun → {s}")
@@ -365,16 +304,81 @@ def zodiac_and_fullmoons_page(c):
     c.showPage()
 
 # ---------- build ----------
-def build():
-    print("Scanning ingresses (Sun + planets)…")
-    ing = scan_ingresses(YEAR)
-
-    c = canvas.Canvas(str(PDF_PATH), pagesize=landscape(A4))
-    render_months(c, ing)
-    info_page(c)
-    zodiac_and_fullmoons_page(c)
-    c.save()
-    print("Saved:", PDF_PATH)
+PAGES = ["months-1", "months-2", "info", "zodiac"]
+
+def draw_page(c, page, events, astro):
+    with profiling.stage(f"page {page}"):
+        if page.startswith("months-"): render_month_page(c, events, int(page[-1]) - 1, astro.year, astro.tz)
+        elif page == "info": info_page(c, astro.tz)
+        else: zodiac_and_fullmoons_page(c, astro)
+
+def page_key(page, events, astro):
+    # page_cache key: the page's share of the events, the style constants
+    # and the drawing code
+    year = astro.year
+    if page.startswith("months-"):
+        inputs = [[e.to_row() for e in events.on(date(year, m, n))]
+                  for m in page_months(int(page[-1]) - 1)
+                  for n in range(1, calendar.monthrange(year, m)[1] + 1)]
+    elif page == "zodiac":
+        inputs = [sorted(astro.full_moons), astro.eclipses, astro.sun_ingresses()]
+    else:
+        inputs = []
+    style = [W, H, MARGIN, GAP, FONT, BOLD, TINTS, year]
+    code = page_cache.code_key(sys.modules[__name__], event_index, month_layout)
+    return page_cache.key(__name__, code, style, astro.tz, page, inputs)
+
+def render_page(page, events, astro):
+    # -> one-page PDF bytes
+    buf = io.BytesIO()
+    c = pdf_stream.Canvas(buf, pagesize=landscape(A4))
+    draw_page(c, page, events, astro)
+    with profiling.stage("save"): c.save()
+    return buf.getvalue()
+
+def build(year=YEAR, out=None, tz=TZ, incremental=True, profile=None):
+    # out: path (default pdf_path(year, tz)) or writable binary stream; pages
+    # are written to it as they are finished (pdf_stream.py). tz: the zone
+    # events are dated in. incremental: an existing file at the path gets
+    # only its changed pages redrawn (page_cache.py; a path's page keys are
+    # recorded either way). Progress goes to stderr, so a PDF streamed to
+    # stdout stays intact.
+    # -> the build's profiling.Report; profile: captures to take, see profiling.py
+    with profiling.session(f"12-month astro {year}", profile) as rep:
+        _build(year, out, incremental, tz)
+    return rep
+
+def _build(year, out, incremental, tz):
+    print("Astro results (Sun + planets, Moon-in)…", file=sys.stderr)
+    with profiling.stage("astro"):
+        res = astro_results.get(year, ingress_engine.PLANETS)
+    with profiling.stage("projection"):
+        astro = res.local(tz)   # phases and eclipses included, stored with the results
+    with profiling.stage("events"):
+        events = index_events(year, astro)
+    if out is None or isinstance(out, (str, Path)):
+        path = Path(out or pdf_path(year, tz))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with profiling.stage("page keys"):
+            keys = [page_key(page, events, astro) for page in PAGES]
+        if incremental:
+            with profiling.stage("splice"):
+                redrawn = page_cache.rebuild(str(path), keys, lambda i: render_page(PAGES[i], events, astro))
+            if redrawn is not None:
+                print(f"Saved: {path} ({len(redrawn)} of {len(PAGES)} pages redrawn)", file=sys.stderr)
+                return
+        with open(path, "wb") as f:
+            write(f, events, astro)
+        page_cache.record(str(path), keys)
+        print("Saved:", path, file=sys.stderr)
+        return
+    write(out, events, astro)
+
+def write(out, events, astro):
+    c = pdf_stream.Canvas(out, pagesize=landscape(A4))
+    for page in PAGES:
+        draw_page(c, page, events, astro)
+    with profiling.stage("save"): c.save()
 
 if __name__ == "__main__":
     build()
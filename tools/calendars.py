@@ -0,0 +1,50 @@
+# calendars.py
+# One entry point for every calendar generator in tools/.
+#
+#   import calendars
+#   pdf = calendars.render_calendar(2027)                      # -> PDF bytes
+#   calendars.render_calendar(2026, "12", "core", "core-2026.pdf")
+#   calendars.render_calendar(2026, out=conn)                  # a connected socket
+#
+# Importing this module (or a generator) computes nothing and writes nothing:
+# a generator is imported on first use, and its year's astro tables are
+# computed by the first render of that year and kept for the rest of the
+# process, so a second render of the same year only draws -- in any zone:
+# astro is solved once per year and only re-dated per zone.
+
+import importlib, io, os, socket
+
+# (format, style) -> module with build(year=, out=, tz=, overlay=, for_whom=,
+# profile=) returning a profiling.Report, load_year(year, tz) and TZ / TABLE_BODIES
+GENERATORS = {
+    ("12", "core"): "serene_12month_2026_full",
+}
+
+def generator(kind="12", style="core"):
+    # -> the generator module for a calendar; ValueError if there is none
+    kind = str(kind)
+    if (kind, style) not in GENERATORS:
+        raise ValueError(f"no {kind}-month {style!r} calendar")
+    return importlib.import_module(GENERATORS[(kind, style)])
+
+def render_calendar(year, kind="12", style="core", out=None, overlay=None, for_whom="",
+                    profile=None, tz=None):
+    # out: None (-> PDF bytes), or a path, binary stream or socket (-> out);
+    # streams and sockets receive each page as soon as it is drawn.
+    # tz: the IANA zone the calendar is dated in (None: the generator's TZ)
+    # overlay / for_whom: a personalized order's natal transits, see render_service.py
+    # profile: captures for the build's report, left in profiling.last
+    gen = generator(kind, style)
+    kw = dict(year=year, tz=tz, overlay=overlay, for_whom=for_whom, profile=profile)
+    if out is None:
+        buf = io.BytesIO()
+        gen.build(out=buf, **kw)
+        return buf.getvalue()
+    if isinstance(out, socket.socket):
+        with out.makefile("wb") as f:
+            gen.build(out=f, **kw)
+        return out
+    if isinstance(out, (str, os.PathLike)):
+        out = os.fspath(out)
+    gen.build(out=out, **kw)
+    return out
@@ -0,0 +1,86 @@
+# ephem_cache.py
+# On-disk store of precomputed ecliptic longitudes.
+# One file per (body, year, timezone, local sample time) holding a float64
+# longitude for every day of the year, memory-mapped on read. Files live in
+# a directory named after the ephem version (and FORMAT), so upgrading ephem invalidates
+# everything at once. Warm rebuilds read longitudes without touching ephem;
+# cold ones interpolate from the year-range store (lon_store.py) when it
+# covers the year, and only call ephem without one.
+
+import os, mmap, array, functools
+import datetime as dt
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import ephem
+import numpy as np
+import ingress_engine, lon_store
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "ephem"
+
+_open = {}   # (body, year, tz, hour, minute) -> memoryview of doubles
+
+FORMAT = 2   # bump when the stored values change meaning (2: ecliptic of date)
+
+def _store_dir(cache_dir):
+    return Path(cache_dir) / f"ephem-{ephem.__version__}-f{FORMAT}"
+
+def _path(cache_dir, body, year, tz, hour, minute):
+    return _store_dir(cache_dir) / f"{body}-{year}-{tz.replace('/', '_')}-{hour:02d}{minute:02d}.f8"
+
+def _instant(d, zone, hour, minute):
+    return float(ephem.Date(dt.datetime(d.year, d.month, d.day, hour, minute, tzinfo=zone)))
+
+@functools.lru_cache(maxsize=None)
+def day_instants(year, tz, hour=12, minute=0):
+    # ephem dates of local hh:mm for each day; shared by every body's row
+    zone = ZoneInfo(tz)
+    out = []
+    d = dt.date(year, 1, 1)
+    while d.year == year:
+        out.append(_instant(d, zone, hour, minute))
+        d += dt.timedelta(days=1)
+    return tuple(out)
+
+def edge_instants(year, tz, hour=12, minute=0):
+    # the samples just outside `year`: local hh:mm on the Dec 31 before it
+    # and the Jan 1 after it
+    zone = ZoneInfo(tz)
+    return (_instant(dt.date(year - 1, 12, 31), zone, hour, minute),
+            _instant(dt.date(year + 1, 1, 1), zone, hour, minute))
+
+def _lons(body, year, ts):
+    store = lon_store.store_for(year)
+    if store is not None and body in store.columns:
+        return store.lons(body, np.array(ts))
+    return [ingress_engine.lon_at(body, t) for t in ts]
+
+def _compute(body, year, tz, hour, minute):
+    lons = _lons(body, year, day_instants(year, tz, hour, minute))
+    return array.array("d", np.asarray(lons, dtype=np.float64).tobytes())
+
+def edge_lons(body, year, tz="UTC", hour=12, minute=0):
+    # longitudes at edge_instants(), computed each call (not stored; two
+    # ephem evaluations at most)
+    return tuple(float(x) for x in _lons(body, year, edge_instants(year, tz, hour, minute)))
+
+def daily_lons(body, year, tz="UTC", hour=12, minute=0, cache_dir=CACHE_DIR):
+    # longitudes (deg) at local hh:mm for every day of `year`, indexed by day-of-year - 1
+    key = (body, year, tz, hour, minute)
+    view = _open.get(key)
+    if view is not None:
+        return view
+    path = _path(cache_dir, *key)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            _compute(*key).tofile(f)
+        os.replace(tmp, path)
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = _open[key] = memoryview(mm).cast("d")
+    return view
+
+def lon_on(body, d, tz="UTC", hour=12, minute=0, cache_dir=CACHE_DIR):
+    return daily_lons(body, d.year, tz, hour, minute, cache_dir)[d.timetuple().tm_yday - 1]
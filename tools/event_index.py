@@ -0,0 +1,91 @@
+# event_index.py
+# Typed calendar events and the per-date index the grids draw from.
+#
+# Every event of the year is added once as a compact Event record, interval
+# events (meteor peak windows) are expanded onto each of their days here, and
+# each day's list is put in drawing order once by its integer priority.
+# Renderers do one dict lookup per cell and format the records themselves, so
+# a label's wording never decides where it is drawn. A year of events
+# round-trips through JSON rows for caching and diffing.
+
+import datetime as dt
+
+FORMAT = 1   # bump when the row layout changes
+
+# drawing order inside a day cell; equal priorities keep the order added
+PRIORITY = {"moon": 0, "phase": 1, "eclipse": 2, "natal": 2, "season": 3, "meteor": 4,
+            "ingress": 5, "station": 14, "holiday": 15}
+INGRESS_ORDER = ["Sun","Mercury","Venus","Mars","Jupiter","Saturn","Uranus","Neptune","Pluto"]
+
+def priority(kind, body=None):
+    # ingresses rank by planet, Sun first
+    if kind == "ingress":
+        return PRIORITY["ingress"] + INGRESS_ORDER.index(body)
+    return PRIORITY[kind]
+
+class Event:
+    # kind: moon | phase | eclipse | season | holiday | meteor | ingress | station | natal
+    # body/sign: where they apply; instant: exact aware UTC datetime, or None
+    # for date-only events; detail: the kind's own field ("New"/"Full",
+    # "Solar"/"Lunar", "R"/"D", the sign a Moon change enters, or a holiday,
+    # season or shower name)
+    __slots__ = ("date", "kind", "body", "sign", "instant", "detail", "priority")
+
+    def __init__(self, date, kind, body=None, sign=None, instant=None, detail=None, prio=None):
+        self.date = date
+        self.kind = kind
+        self.body = body
+        self.sign = sign
+        self.instant = instant
+        self.detail = detail
+        self.priority = priority(kind, body) if prio is None else prio
+
+    def to_row(self):
+        return [self.date.isoformat(), self.kind, self.body, self.sign,
+                self.instant.isoformat() if self.instant else None, self.detail, self.priority]
+
+    @classmethod
+    def from_row(cls, row):
+        d, kind, body, sign, instant, detail, prio = row
+        return cls(dt.date.fromisoformat(d), kind, body, sign,
+                   dt.datetime.fromisoformat(instant) if instant else None, detail, prio)
+
+    def __repr__(self):
+        return f"Event({', '.join(repr(x) for x in self.to_row())})"
+
+class EventIndex:
+    def __init__(self):
+        self.by_date = {}   # date -> [Event] in drawing order after sort()
+
+    def add(self, ev):
+        self.by_date.setdefault(ev.date, []).append(ev)
+
+    def add_span(self, first, last, kind, **fields):
+        # an event written on every day from first to last inclusive
+        for i in range((last - first).days + 1):
+            self.add(Event(first + dt.timedelta(days=i), kind, **fields))
+
+    def sort(self):
+        # stable: equal priorities keep the order they were added in
+        for items in self.by_date.values():
+            items.sort(key=lambda e: e.priority)
+        return self
+
+    def on(self, d, extra=()):
+        # the day's events in drawing order; `extra` events (e.g. a personal
+        # overlay) go after the indexed events of equal priority
+        items = self.by_date.get(d, [])
+        if extra:
+            items = sorted([*items, *extra], key=lambda e: e.priority)
+        return items
+
+    def to_json(self):
+        return {"format": FORMAT,
+                "events": [ev.to_row() for d in sorted(self.by_date) for ev in self.by_date[d]]}
+
+    @classmethod
+    def from_json(cls, data):
+        idx = cls()
+        for row in data["events"]:
+            idx.add(Event.from_row(row))
+        return idx   # rows are stored in drawing order
@@ -0,0 +1,81 @@
+# fonts.py
+# Font registration shared by the generators.
+#
+# Each TTF is located and parsed once per process (register() is memoized),
+# so a batch or service process that builds many PDFs keeps one copy of the
+# glyph outlines and metrics. reportlab already embeds per document only the
+# glyph subsets a PDF uses; EmbedTTFont also trims the 'name' table of those
+# subsets, ~15 KB per DejaVu font, most of it the licence text repeated per
+# platform: the copyright, licence and font name records are kept, once
+# (the Windows platform's).
+#
+# reportlab numbers a document's glyphs in order of first use, so two PDFs
+# drawing different pages embed different subsets. prime() gives a canvas a
+# fixed start: a generator's symbol alphabet takes the first codes, so its
+# PDFs that draw nothing outside ASCII and that alphabet embed the same
+# subsets byte for byte, and pdf_merge keeps one copy of them when it
+# merges or splices such PDFs.
+
+import functools, os, struct
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace, TTFontMaker
+
+SEARCH = ["/usr/share/fonts/truetype/dejavu", "/usr/share/fonts/TTF", "/usr/local/share/fonts", "."]
+KEEP_NAMES = {0, 1, 2, 4, 6, 13, 14}   # copyright, family, style, full and PostScript name, licence + URL
+
+def trim_names(table, keep=KEEP_NAMES):
+    # a 'name' table (format 0) with only the `keep` name IDs, for one
+    # platform: Windows if it has any of them, else every platform
+    count, base = struct.unpack(">HH", table[2:6])
+    records = [struct.unpack(">6H", table[6 + 12*i:18 + 12*i]) for i in range(count)]
+    records = [r for r in records if r[3] in keep]
+    if any(r[0] == 3 for r in records):
+        records = [r for r in records if r[0] == 3]
+    head, strings = [], b""
+    for platform, encoding, language, name_id, length, off in records:
+        head.append(struct.pack(">6H", platform, encoding, language, name_id, length, len(strings)))
+        strings += table[base + off:base + off + length]
+    return struct.pack(">3H", 0, len(records), 6 + 12*len(records)) + b"".join(head) + strings
+
+def tables(ttf):
+    # [(tag, bytes)] of a TrueType file, in directory order
+    out = []
+    for i in range(struct.unpack(">H", ttf[4:6])[0]):
+        tag, _, off, length = struct.unpack(">4sLLL", ttf[12 + 16*i:28 + 16*i])
+        out.append((tag.decode("latin-1"), ttf[off:off + length]))
+    return out
+
+class EmbedTTFace(TTFontFace):
+    # a face whose subsets get a trimmed 'name' table (checksums redone)
+    def makeSubset(self, subset):
+        out = TTFontMaker()
+        for tag, data in tables(super().makeSubset(subset)):
+            out.add(tag, trim_names(data) if tag == "name" else data)
+        return out.makeStream()
+
+class EmbedTTFont(TTFont):
+    # a TTFont over an EmbedTTFace (TTFont.__init__ parses a plain face
+    # first; the file is read twice, once per process)
+    def __init__(self, name, filename):
+        super().__init__(name, filename)
+        self.face = EmbedTTFace(filename)
+
+def prime(canv, names, chars):
+    # give `chars` (in a fixed order) the first codes of every TrueType
+    # font in `names` on the canvas's document
+    for name in names:
+        font = pdfmetrics.getFont(name)
+        if isinstance(font, TTFont):
+            font.splitString(chars, canv._doc)
+
+@functools.lru_cache(maxsize=None)
+def register(name, fallback):
+    # -> `name` once its TTF is registered, or `fallback` (a built-in PDF font)
+    # when the file is not installed
+    for d in SEARCH:
+        path = os.path.join(d, f"{name}.ttf")
+        if os.path.exists(path):
+            pdfmetrics.registerFont(EmbedTTFont(name, path))
+            return name
+    return fallback
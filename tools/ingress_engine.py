@@ -0,0 +1,159 @@
+# ingress_engine.py
+# Sign ingresses (Sun, Moon, Mercury..Pluto) as exact UTC instants.
+#
+# No fixed sampling grid. Each body is stepped by how far it can possibly move:
+# distance to the nearest sign boundary / its max speed, so Pluto takes steps
+# of months and Mercury only slows down near a cusp. The Sun and Moon never
+# go retrograde, so they jump straight to the crossing predicted from their
+# current speed. Every bracketed crossing is then solved with Brent's method
+# to about a second.
+
+import ephem, math
+import datetime as dt
+from collections import Counter
+
+SIGNS = ["Aries","Taurus","Gemini","Cancer","Leo","Virgo",
+         "Libra","Scorpio","Sagittarius","Capricorn","Aquarius","Pisces"]
+
+BODIES = {
+    "Sun": ephem.Sun,
+    "Moon": ephem.Moon,
+    "Mercury": ephem.Mercury,
+    "Venus": ephem.Venus,
+    "Mars": ephem.Mars,
+    "Jupiter": ephem.Jupiter,
+    "Saturn": ephem.Saturn,
+    "Uranus": ephem.Uranus,
+    "Neptune": ephem.Neptune,
+    "Pluto": ephem.Pluto,
+}
+PLANETS = [b for b in BODIES if b != "Moon"]   # Sun..Pluto
+
+# upper bound of |geocentric ecliptic speed|, deg/day (slightly generous)
+MAX_SPEED = {
+    "Sun": 1.03, "Moon": 15.5, "Mercury": 2.30, "Venus": 1.30, "Mars": 0.82,
+    "Jupiter": 0.26, "Saturn": 0.14, "Uranus": 0.07, "Neptune": 0.042, "Pluto": 0.042,
+}
+DIRECT_ONLY = {"Sun", "Moon"}
+
+MIN_STEP = 0.25   # days; near a cusp we are never coarser than the old 6-hour scan
+XTOL     = 1e-5   # days (~0.9 s)
+
+EVALS = Counter()  # ephemeris evaluations per body (lunar.py's as "Moon-lunation", "Sun-eclipse", ...)
+
+# ---------- longitude ----------
+_body_cache = {}
+
+def ecliptic_of_date(b, t):
+    # apparent position on the ecliptic of date (tropical zodiac); plain
+    # ephem.Ecliptic(b) is the J2000 frame, ~0.36° off in 2026
+    return ephem.Ecliptic(ephem.Equatorial(b.ra, b.dec, epoch=t), epoch=t)
+
+def lon_at(name, t):
+    # geocentric ecliptic longitude in degrees; t is an ephem.Date (or float)
+    b = _body_cache.get(name)
+    if b is None:
+        b = _body_cache[name] = BODIES[name]()
+    b.compute(t)
+    EVALS[name] += 1
+    return math.degrees(float(ecliptic_of_date(b, t).lon)) % 360.0
+
+def _wrap(x):
+    return (x + 180.0) % 360.0 - 180.0
+
+def to_utc(t):
+    return ephem.Date(t).datetime().replace(tzinfo=dt.timezone.utc)
+
+# ---------- root finding ----------
+def brent(f, a, b, fa, fb, xtol=XTOL, maxiter=60):
+    # Brent–Dekker: inverse quadratic / secant steps, guarded by bisection.
+    # fa and fb must have opposite signs.
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(maxiter):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 4e-16*abs(b) + 0.5*xtol
+        m = 0.5*(c - b)
+        if abs(m) <= tol or fb == 0:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb/fa
+            if a == c:
+                p = 2*m*s; q = 1 - s
+            else:
+                q = fa/fc; r = fb/fc
+                p = s*(2*m*q*(q - r) - (b - a)*(r - 1))
+                q = (q - 1)*(r - 1)*(s - 1)
+            if p > 0: q = -q
+            else:     p = -p
+            if 2*p < min(3*m*q - abs(tol*q), abs(e*q)):
+                e = d; d = p/q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = f(b)
+    return b
+
+def _crossings(name, t0, l0, t1, l1):
+    # all cusps passed between two samples, assuming monotonic motion in between
+    delta = _wrap(l1 - l0)
+    out = []
+    if delta > 0:
+        k, k_end, step = math.floor(l0/30.0) + 1, math.floor((l0 + delta)/30.0), 1
+    else:
+        k, k_end, step = math.ceil(l0/30.0) - 1, math.ceil((l0 + delta)/30.0), -1
+    while (k <= k_end) if step > 0 else (k >= k_end):
+        cusp = (k*30.0) % 360.0
+        f = lambda t, cusp=cusp: _wrap(lon_at(name, t) - cusp)
+        t = brent(f, t0, t1, _wrap(l0 - cusp), _wrap(l1 - cusp))
+        sign = SIGNS[k % 12] if step > 0 else SIGNS[(k - 1) % 12]
+        out.append((t, sign))
+        k += step
+    return out
+
+# ---------- per-body scan ----------
+def body_ingresses(name, start, end):
+    # [(ephem float, sign entered)] for start <= t <= end (ephem floats)
+    start, end = float(start), float(end)
+    t, lon = start, lon_at(name, start)
+    out = []
+    if name in DIRECT_ONLY:
+        h = 0.25
+        v = _wrap(lon_at(name, t + h) - lon)/h
+        while t < end:
+            # aim for the middle of the next sign: robust to speed changes
+            ahead = 30.0 - lon % 30.0
+            t2 = min(t + (ahead + 15.0)/v, end)
+            lon2 = lon_at(name, t2)
+            if int(lon2 // 30) != int(lon // 30):
+                out += _crossings(name, t, lon, t2, lon2)
+            v = _wrap(lon2 - lon)/(t2 - t)
+            t, lon = t2, lon2
+        return out
+
+    vmax = MAX_SPEED[name]
+    while t < end:
+        # no cusp can be reached sooner than dist/vmax
+        r = lon % 30.0
+        t2 = min(t + max(min(r, 30.0 - r)/vmax, MIN_STEP), end)
+        lon2 = lon_at(name, t2)
+        if int(lon2 // 30) != int(lon // 30):
+            out += _crossings(name, t, lon, t2, lon2)
+        t, lon = t2, lon2
+    return out
+
+def scan_ingresses(year, bodies=PLANETS, margin=0):
+    # {body: [(aware UTC datetime, sign entered)]} for the calendar year in
+    # UTC, widened by `margin` days on both sides
+    start = ephem.Date(ephem.Date(dt.datetime(year, 1, 1)) - margin)
+    end   = ephem.Date(ephem.Date(dt.datetime(year + 1, 1, 1)) + margin)
+    return {name: [(to_utc(t), sign) for t, sign in body_ingresses(name, start, end)]
+            for name in bodies}
@@ -0,0 +1,117 @@
+# lon_store.py
+# Longitudes for a whole range of years in one memory-mapped file.
+#
+#   python tools/lon_store.py              # 2026..2035 into .cache/ephem
+#   python tools/lon_store.py 2026 2040
+#
+# One step computes the Moon hourly and Sun..Pluto daily (from 0h UTC) for
+# the range and writes them as float32 columns behind a small JSON header.
+# Readers map the file (every process shares the same pages) and interpolate:
+# a cubic through the four samples around t, unwrapped across 0/360 deg,
+# which stays within ~1e-4 deg of ephem for every body -- a few seconds of
+# the Moon's motion. ephem_cache.py fills its daily tables (any timezone,
+# any sample time) from here whenever the store covers the year, so the
+# generators' tables cost no ephem calls at all. The solvers that need exact
+# instants (ingress_engine, stations, lunar) still call ephem directly. A
+# store is tied to the ephem version that wrote it; without one, everything
+# falls back to ephem.
+
+import functools, json, os, struct, sys
+import datetime as dt
+from pathlib import Path
+
+import ephem
+import numpy as np
+
+import ingress_engine
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "ephem"
+FORMAT = 2   # bump when the file layout or the sampling changes
+FIRST, LAST = 2026, 2035   # the catalog's range; what open_store() looks for
+MARGIN = 4                 # days sampled beyond the range: moon_days.MARGIN plus cubic neighbours
+STEP = {"Moon": 1/24}      # days between samples; every other body daily
+MAGIC = b"LONS"
+
+def path_for(first, last, cache_dir=CACHE_DIR):
+    return Path(cache_dir) / f"lons-{first}-{last}-ephem-{ephem.__version__}-f{FORMAT}.f4"
+
+def _wrap(x):
+    return (x + 180.0) % 360.0 - 180.0
+
+class LonStore:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, n = struct.unpack("<4sI", f.read(8))
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not a longitude store")
+            head = json.loads(f.read(n))
+        data = np.memmap(path, dtype="<f4", mode="r", offset=head["data"])
+        self.first, self.last = head["first"], head["last"]
+        self.t0 = head["t0"]
+        # body -> (step in days, float32 samples at t0, t0 + step, ...)
+        self.columns = {c["body"]: (c["step"], data[c["offset"]:c["offset"] + c["count"]])
+                        for c in head["columns"]}
+
+    def covers(self, year):
+        return self.first <= year <= self.last
+
+    def lons(self, body, t):
+        # longitudes (deg, float64) at ephem dates t (array-like)
+        step, col = self.columns[body]
+        x = (np.asarray(t, dtype=np.float64) - self.t0)/step
+        i = np.floor(x).astype(np.intp)
+        if i.size and (i.min() < 1 or i.max() > len(col) - 3):
+            raise ValueError(f"{body}: time outside the stored {self.first}..{self.last}")
+        f = x - i
+        s0 = col[i].astype(np.float64)
+        dm, d1, d2 = (_wrap(col[i + k] - s0) for k in (-1, 1, 2))
+        # Lagrange weights for nodes -1, 0, 1, 2 (node 0 contributes s0 itself)
+        return (s0 - f*(f - 1)*(f - 2)/6*dm - (f + 1)*f*(f - 2)/2*d1
+                + (f + 1)*f*(f - 1)/6*d2) % 360.0
+
+    def lon(self, body, t):
+        return float(self.lons(body, [float(t)])[0])
+
+def precompute(first=FIRST, last=LAST, bodies=tuple(ingress_engine.BODIES), cache_dir=CACHE_DIR):
+    # sample every body over first..last with ephem and write the store -> its path
+    t0 = float(ephem.Date(dt.datetime(first, 1, 1))) - MARGIN
+    t1 = float(ephem.Date(dt.datetime(last + 1, 1, 1))) + MARGIN
+    columns, chunks, offset = [], [], 0
+    for body in bodies:
+        step = STEP.get(body, 1.0)
+        count = int((t1 - t0)/step) + 1
+        chunks.append(np.array([ingress_engine.lon_at(body, t0 + k*step) for k in range(count)],
+                               dtype="<f4"))
+        columns.append({"body": body, "step": step, "count": count, "offset": offset})
+        offset += count
+    head = {"format": FORMAT, "ephem": ephem.__version__, "first": first, "last": last,
+            "t0": t0, "columns": columns}
+    blob = json.dumps(head).encode()
+    # pad so the float32 data starts on a 16-byte boundary
+    head["data"] = (8 + len(blob) + 64 + 15)//16*16
+    blob = json.dumps(head).encode().ljust(head["data"] - 8)
+    path = path_for(first, last, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(struct.pack("<4sI", MAGIC, len(blob)) + blob)
+        for chunk in chunks:
+            chunk.tofile(f)
+    os.replace(tmp, path)
+    open_store.cache_clear()
+    return path
+
+@functools.lru_cache(maxsize=None)
+def open_store(first=FIRST, last=LAST, cache_dir=CACHE_DIR):
+    # -> the mapped LonStore for the range, or None if it was never precomputed
+    path = path_for(first, last, cache_dir)
+    return LonStore(path) if path.exists() else None
+
+def store_for(year):
+    # -> the default store if it covers `year`, else None
+    store = open_store()
+    return store if store is not None and store.covers(year) else None
+
+if __name__ == "__main__":
+    first, last = (int(a) for a in sys.argv[1:3]) if len(sys.argv) > 2 else (FIRST, LAST)
+    print("Saved:", precompute(first, last))
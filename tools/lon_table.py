@@ -0,0 +1,43 @@
+# lon_table.py
+# One NumPy array of daily longitudes, shape (bodies × days), sampled at
+# local noon for a whole year. A body's longitude or sign on a date is an
+# array lookup, and transits.py folds whole rows into interval hulls instead
+# of day-by-day Python loops per body.
+
+import datetime as dt
+import numpy as np
+
+import ephem_cache
+
+def wrap180(x):
+    return (x + 180.0) % 360.0 - 180.0
+
+class LonTable:
+    def __init__(self, year, tz, bodies, lons, hour=12):
+        self.year = year
+        self.tz = tz
+        self.hour = hour
+        self.bodies = tuple(bodies)
+        self.rows = {b: i for i, b in enumerate(self.bodies)}
+        self.lons = lons                                   # float64 (bodies × days)
+        self.signs = (lons // 30.0).astype(np.int8)        # sign index per cell
+        self.day0 = dt.date(year, 1, 1)
+
+    def day(self, i):
+        return self.day0 + dt.timedelta(days=int(i))
+
+    def index(self, d):
+        return (d - self.day0).days
+
+    def lon(self, body, d):
+        return float(self.lons[self.rows[body], self.index(d)])
+
+    def sign_index(self, body, d):
+        return int(self.signs[self.rows[body], self.index(d)])
+
+def daily_table(year, tz="UTC", bodies=("Sun","Moon","Mercury","Venus","Mars",
+                                       "Jupiter","Saturn","Uranus","Neptune","Pluto"), hour=12):
+    # rows come straight from the mmapped ephem_cache files (computed on first use)
+    lons = np.vstack([np.frombuffer(ephem_cache.daily_lons(b, year, tz, hour), dtype=np.float64)
+                      for b in bodies])
+    return LonTable(year, tz, bodies, lons, hour)
@@ -0,0 +1,112 @@
+# lunar.py
+# New/full moons and eclipses for any year, computed instead of hand-keyed.
+# Lunations come from ephem.next_new_moon / next_full_moon. A syzygy within
+# the ecliptic limit of a lunar node (its node distance recovered from the
+# Moon's latitude, sin β = sin i · sin F) is an eclipse candidate, and the
+# geometry decides: at the closest approach around the syzygy, a solar
+# eclipse needs the Moon within the sum of the semidiameters plus the
+# parallax difference of the Sun's centre (partial somewhere on Earth), a
+# lunar one the Moon's disc touching the penumbra around the antisolar point
+# (penumbral included). Results are cached per year. Every ephem call is
+# counted in ingress_engine.EVALS: "Moon-lunation" for the new/full moon
+# searches and the node distance, "Sun-eclipse" / "Moon-eclipse" for the
+# closest-approach geometry.
+
+import math, functools
+import datetime as dt
+from zoneinfo import ZoneInfo
+
+import ephem
+from ingress_engine import EVALS, SIGNS, to_utc, ecliptic_of_date
+
+INCLINATION = math.radians(5.145)   # mean inclination of the lunar orbit
+CANDIDATE_LIMIT = 21.0              # node distance (deg) beyond any ecliptic limit: no geometry needed
+PENUMBRA_ENLARGE = 1.02             # the atmosphere's widening of Earth's shadow (Danjon)
+EARTH_RADIUS_AU = ephem.earth_radius/ephem.meters_per_au
+
+class Lunation:
+    # kind: "New" | "Full"; eclipse: None | "Solar" | "Lunar"
+    __slots__ = ("instant", "kind", "sign", "node_dist", "eclipse")
+
+    def __init__(self, instant, kind, sign, node_dist, eclipse):
+        self.instant = instant
+        self.kind = kind
+        self.sign = sign
+        self.node_dist = node_dist
+        self.eclipse = eclipse
+
+    def local_date(self, tz="UTC"):
+        return self.instant.astimezone(ZoneInfo(tz)).date()
+
+def _parallax(body):
+    return math.asin(EARTH_RADIUS_AU/body.earth_distance)
+
+def _gap(t, kind):
+    # how far (rad) the Moon is from eclipsing at t; negative: it does
+    sun, moon = ephem.Sun(t), ephem.Moon(t)
+    EVALS["Sun-eclipse"] += 1; EVALS["Moon-eclipse"] += 1
+    if kind == "New":
+        sep = ephem.separation((moon.ra, moon.dec), (sun.ra, sun.dec))
+        return float(sep) - (moon.radius + sun.radius + _parallax(moon) - _parallax(sun))
+    sep = ephem.separation((moon.ra, moon.dec), (sun.ra + math.pi, -sun.dec))
+    penumbra = PENUMBRA_ENLARGE*(_parallax(moon) + _parallax(sun) + sun.radius)
+    return float(sep) - (penumbra + moon.radius)
+
+def _eclipses(t, kind, span=0.5, steps=40):
+    # closest approach within ±span days of the syzygy (golden-section
+    # search; the latitude offset moves it off the syzygy by up to an hour)
+    g = (math.sqrt(5) - 1)/2
+    a, b = t - span, t + span
+    c, d = b - g*(b - a), a + g*(b - a)
+    fc, fd = _gap(c, kind), _gap(d, kind)
+    for _ in range(steps):
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - g*(b - a); fc = _gap(c, kind)
+        else:
+            a, c, fc = c, d, fd
+            d = a + g*(b - a); fd = _gap(d, kind)
+    return min(fc, fd) < 0
+
+def _lunation(t, kind):
+    ecl = ecliptic_of_date(ephem.Moon(t), t)
+    EVALS["Moon-lunation"] += 1
+    lon = math.degrees(float(ecl.lon)) % 360.0
+    node_dist = math.degrees(math.asin(min(1.0, abs(math.sin(float(ecl.lat)))/math.sin(INCLINATION))))
+    eclipse = None
+    if node_dist < CANDIDATE_LIMIT and _eclipses(float(t), kind):
+        eclipse = "Solar" if kind == "New" else "Lunar"
+    return Lunation(to_utc(t), kind, SIGNS[int(lon // 30)], node_dist, eclipse)
+
+@functools.lru_cache(maxsize=None)
+def lunations(year):
+    # every new and full moon from three days before to three days after the
+    # UTC year, so any timezone's local year is fully covered
+    t = ephem.Date(ephem.Date(dt.datetime(year, 1, 1)) - 3)
+    end = ephem.Date(dt.datetime(year + 1, 1, 1)) + 3
+    out = []
+    for nxt, kind in ((ephem.next_new_moon, "New"), (ephem.next_full_moon, "Full")):
+        s = t
+        while True:
+            s = nxt(s)
+            EVALS["Moon-lunation"] += 1
+            if s > end: break
+            out.append(_lunation(s, kind))
+    out.sort(key=lambda l: l.instant)
+    return tuple(out)
+
+def in_year(year, tz="UTC", solved=None):
+    # solved: the year's lunations() (e.g. restored from a cache), computed if None
+    solved = lunations(year) if solved is None else solved
+    return [l for l in solved if l.local_date(tz).year == year]
+
+def phases(year, tz="UTC", solved=None):
+    # ({date: sign} of new moons, {date: sign} of full moons) in local dates
+    new, full = {}, {}
+    for l in in_year(year, tz, solved):
+        (new if l.kind == "New" else full)[l.local_date(tz)] = l.sign
+    return new, full
+
+def eclipses(year, tz="UTC", solved=None):
+    # [(local date, "Solar" | "Lunar", sign)]
+    return [(l.local_date(tz), l.eclipse, l.sign) for l in in_year(year, tz, solved) if l.eclipse]
@@ -0,0 +1,108 @@
+# month_layout.py
+# Month-grid geometry, computed once per (layout, month shape).
+#
+#   L = month_layout.Layout(x=LM, top=H - TM, cell_w=CELL_W, grid_h=..., ...)
+#   g = L.grid(*month_layout.shape(2026, 3))     # memoized on L
+#   for cell in g.cells: cell.x, cell.y, cell.text, cell.max_lines, ...
+#
+# Where a month's cells, day numbers and text lines go depends only on its
+# shape: the weekday of its 1st and its length. That is at most 7 × 4 shapes
+# for Gregorian months, whatever the year, and one per start weekday for the
+# 28-day months of the 13-month format (fixed_shape()), so a Layout works
+# each one out once -- cell rectangles, the anchors of the day number and
+# the first text line, and how many lines fit -- and page drawing is a loop
+# over its cells. A Layout describes one page design (one
+# card size); its coordinates are relative to the layout's origin, so a
+# design drawn at several places on a page (the 12-month astro cards) adds
+# its own offset. Weeks are Monday-first.
+
+import calendar
+import datetime as dt
+
+class Cell:
+    # day: 1..days, or outside it for a spill-over cell (the previous or next
+    # month's day in the same week; its date is first + day - 1)
+    # x, y: bottom-left corner; top: y + h as the rows are stacked
+    # number / text: (x, y) anchors of the day number and the first text line
+    # max_lines: text lines that fit at line_gap below text[1]
+    __slots__ = ("day", "row", "col", "x", "y", "w", "h", "top", "number", "text", "max_lines")
+
+    def __init__(self, day, row, col, x, y, w, h, top, number, text, max_lines):
+        self.day, self.row, self.col = day, row, col
+        self.x, self.y, self.w, self.h, self.top = x, y, w, h, top
+        self.number, self.text, self.max_lines = number, text, max_lines
+
+class Grid:
+    # one month shape under one layout
+    # rows: the row count the height is shared by; weeks: (cells of each
+    # week the month touches), top to bottom; cells: all of them in order
+    # full: per week, whether all seven cells are this month's days
+    __slots__ = ("first_wd", "days", "rows", "cell_h", "weeks", "cells", "full")
+
+    def __init__(self, first_wd, days, rows, cell_h, weeks, full):
+        self.first_wd, self.days = first_wd, days
+        self.rows, self.cell_h = rows, cell_h
+        self.weeks, self.full = weeks, full
+        self.cells = tuple(cell for week in weeks for cell in week)
+
+class Layout:
+    # x, top: left and top edges of the grid; cell_w: column width
+    # grid_h: height shared by the rows; rows: a fixed row count, or None
+    # for as many as the month needs (4..6)
+    # spill: also lay out the other months' days in the month's weeks
+    # number / text: anchors of the day number and the first text line, as
+    # (dx, fy, dy): cell x + dx, cell y + fy*cell height + dy
+    # line_gap: distance between text lines; floor: lowest baseline above the
+    # cell bottom; reserve: lines kept free at the bottom (the "…" marker)
+    def __init__(self, x, top, cell_w, grid_h, rows=None, spill=False,
+                 number=(0.0, 0.0, 0.0), text=(0.0, 1.0, 0.0), line_gap=10.0, floor=0.0, reserve=0):
+        self.x, self.top, self.cell_w, self.grid_h = x, top, cell_w, grid_h
+        self.rows, self.spill = rows, spill
+        self.number, self.text = number, text
+        self.line_gap, self.floor, self.reserve = line_gap, floor, reserve
+        self._grids = {}   # (first_wd, days) -> Grid
+
+    def grid(self, first_wd, days):
+        key = (first_wd, days)
+        g = self._grids.get(key)
+        if g is None:
+            g = self._grids[key] = self._layout(first_wd, days)
+        return g
+
+    def _layout(self, first_wd, days):
+        weeks = (first_wd + days + 6)//7   # ceil
+        rows = self.rows or weeks
+        ch = self.grid_h/rows
+        out, full = [], []
+        (ndx, nfy, ndy), (tdx, tfy, tdy) = self.number, self.text
+        for r in range(weeks):
+            y = self.top - (r + 1)*ch
+            top = self.top - r*ch
+            first = r*7 - first_wd + 1
+            full.append(first >= 1 and first + 6 <= days)
+            cells = []
+            for col in range(7):
+                n = first + col
+                if not (self.spill or 1 <= n <= days):
+                    continue
+                x = self.x + col*self.cell_w
+                text_y = y + ch*tfy + tdy
+                max_lines = max(0, int((text_y - (y + self.floor))//self.line_gap) - self.reserve)
+                cells.append(Cell(n, r, col, x, y, self.cell_w, ch, top,
+                                  (x + ndx, y + ch*nfy + ndy), (x + tdx, text_y), max_lines))
+            out.append(tuple(cells))
+        return Grid(first_wd, days, rows, ch, tuple(out), tuple(full))
+
+def shape(year, month):
+    # (weekday of the 1st, Mon=0, days) of a Gregorian month
+    return calendar.monthrange(year, month)
+
+def fixed_shape(year, month, length=28):
+    # the same for month `month` (1..13) of a 13-month year of `length`-day
+    # months starting on January 1 (the year day after them has no grid)
+    first = dt.date(year, 1, 1) + dt.timedelta(days=(month - 1)*length)
+    return first.weekday(), length
+
+def cell_date(first, cell):
+    # the date a cell shows, for a month starting on `first`
+    return first + dt.timedelta(days=cell.day - 1)
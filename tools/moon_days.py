@@ -0,0 +1,92 @@
+# moon_days.py
+# The Moon's sign changes as exact instants, and what each calendar day
+# makes of them.
+#
+# Sampling the Moon once a day mislabels every day it changes sign on the
+# other side of the sample, and two calendars sampling at different noons
+# disagree. Here every change is solved instead: the hourly Moon column of
+# the year-range store (lon_store.py) brackets each crossing of a sign
+# boundary and Brent finds it on the interpolated longitude to about a
+# second -- ~160 a year without a single ephem call. Years outside the store
+# fall back to ingress_engine's ephem scan (~4.5 evaluations a change). A
+# local day then gets the change that happens in it ("Moon → Leo 14:32") and
+# its dominant sign, the one the Moon is in for most of the day.
+
+import functools, math
+import datetime as dt
+from zoneinfo import ZoneInfo
+
+import ephem
+import ingress_engine, lon_store
+from ingress_engine import SIGNS, brent, to_utc
+
+MARGIN = 3   # days solved beyond the UTC year: any timezone's local year (UTC-12..+14)
+             # and the stretch before its first day, however long the Moon stays in a sign
+
+class MoonDay:
+    # sign: dominant sign of the local day; changes: [(aware local datetime,
+    # sign entered)] during it, in order (at most one in practice)
+    __slots__ = ("date", "sign", "changes")
+
+    def __init__(self, date, sign, changes):
+        self.date = date
+        self.sign = sign
+        self.changes = changes
+
+def _wrap(x):
+    return (x + 180.0) % 360.0 - 180.0
+
+def _from_store(store, t0, t1):
+    step, col = store.columns["Moon"]
+    i0 = math.ceil((t0 - store.t0)/step)
+    i1 = math.floor((t1 - store.t0)/step)
+    out = []
+    signs = col[i0:i1 + 1]//30
+    for k in (signs[1:] != signs[:-1]).nonzero()[0]:
+        a = store.t0 + (i0 + k)*step
+        sign = int(signs[k + 1]) % 12
+        cusp = 30.0*sign
+        f = lambda t: _wrap(store.lon("Moon", t) - cusp)
+        out.append((brent(f, a, a + step, f(a), f(a + step)), SIGNS[sign]))
+    return out
+
+@functools.lru_cache(maxsize=None)
+def ingresses(year):
+    # ((aware UTC datetime, sign entered), ...) from MARGIN days before to
+    # MARGIN days after the UTC year
+    t0 = float(ephem.Date(dt.datetime(year, 1, 1))) - MARGIN
+    t1 = float(ephem.Date(dt.datetime(year + 1, 1, 1))) + MARGIN
+    store = lon_store.store_for(year)
+    found = (_from_store(store, t0, t1) if store is not None
+             else ingress_engine.body_ingresses("Moon", t0, t1))
+    return tuple((to_utc(t), sign) for t, sign in found)
+
+def days(year, tz="UTC", changes=None):
+    # {date: MoonDay} for every local date of `year` in `tz`; changes: the
+    # year's ingresses() (e.g. restored from a cache), computed if None
+    changes = ingresses(year) if changes is None else changes
+    zone = ZoneInfo(tz)
+    out = {}
+    k = 0
+    d = dt.date(year, 1, 1)
+    while d.year == year:
+        # in UTC, so a DST day is 23 or 25 hours long
+        nxt = d + dt.timedelta(days=1)
+        start = dt.datetime(d.year, d.month, d.day, tzinfo=zone).astimezone(dt.timezone.utc)
+        end = dt.datetime(nxt.year, nxt.month, nxt.day, tzinfo=zone).astimezone(dt.timezone.utc)
+        while k < len(changes) and changes[k][0] <= start:
+            k += 1
+        # the Moon's sign at local midnight; before the first change, the
+        # sign preceding it (the Moon is never retrograde)
+        sign = changes[k - 1][1] if k else SIGNS[(SIGNS.index(changes[0][1]) - 1) % 12]
+        spans, inside, t = {}, [], start
+        while k < len(changes) and changes[k][0] < end:
+            at, entered = changes[k]
+            spans[sign] = spans.get(sign, dt.timedelta()) + (at - t)
+            inside.append((at.astimezone(zone), entered))
+            sign, t = entered, at
+            k += 1
+        spans[sign] = spans.get(sign, dt.timedelta()) + (end - t)
+        out[d] = MoonDay(d, max(spans, key=spans.get), inside)
+        d = nxt
+    return out
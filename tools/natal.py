@@ -0,0 +1,76 @@
+# natal.py
+# Birth-chart positions for the personalized calendar overlay (the transits
+# to them are found by transits.py).
+# Birth places are resolved offline: the city is matched against the IANA
+# zone names (Oslo -> Europe/Oslo), or an explicit tz is given.
+
+import datetime as dt, functools
+import zoneinfo
+from zoneinfo import ZoneInfo
+
+import ephem
+
+import ingress_engine
+
+NATAL_POINTS = ["Sun","Moon","Mercury","Venus","Mars","Jupiter","Saturn","Uranus","Neptune","Pluto"]
+TRANSITING   = ["Sun","Mercury","Venus","Mars","Jupiter","Saturn","Uranus","Neptune","Pluto"]
+ASPECTS = [("☌", 0.0), ("✱", 60.0), ("□", 90.0), ("△", 120.0), ("☍", 180.0)]   # ✱ = sextile
+
+class FieldError(ValueError):
+    # bad input, per field: fields = {"birth_date": "what is wrong", ...};
+    # args is the dict itself so the error survives a process pool
+    def __init__(self, fields):
+        super().__init__(fields)
+        self.fields = fields
+
+    def __str__(self):
+        return "; ".join(f"{k}: {v}" for k, v in self.fields.items())
+
+@functools.lru_cache(maxsize=None)
+def _zones():
+    # {"oslo": "Europe/Oslo", ...}: each zone by its lowercased last component,
+    # the first name in sorted order winning; scanning the tz database takes
+    # tens of ms, so it is done once per process
+    out = {}
+    for name in sorted(zoneinfo.available_timezones()):
+        out.setdefault(name.rsplit("/", 1)[-1].lower(), name)
+    return out
+
+def find_timezone(city):
+    # "Oslo" -> "Europe/Oslo", "new york" -> "America/New_York"; None if unknown
+    return _zones().get(city.strip().replace(" ", "_").lower())
+
+def birth_instant(date, time="12:00", city=None, tz=None):
+    # aware UTC datetime; FieldError naming every bad input (a known city or
+    # a valid tz is needed)
+    errors = {}
+    day = clock = zone = None
+    if not date:
+        errors["birth_date"] = "required"
+    else:
+        try:
+            day = dt.date.fromisoformat(date)
+        except (TypeError, ValueError):
+            errors["birth_date"] = f"{date!r} is not a YYYY-MM-DD date"
+    try:
+        clock = dt.time.fromisoformat(time)
+    except (TypeError, ValueError):
+        errors["birth_time"] = f"{time!r} is not an HH:MM time"
+    if tz is not None:
+        try:
+            zone = ZoneInfo(tz)
+        except (zoneinfo.ZoneInfoNotFoundError, TypeError, ValueError):
+            errors["tz"] = f"unknown timezone {tz!r}"
+    elif not city:
+        errors["city"] = "required (or an IANA tz)"
+    elif not isinstance(city, str) or find_timezone(city) is None:
+        errors["city"] = f"unknown birth city {city!r}; pass an IANA tz instead"
+    else:
+        zone = ZoneInfo(find_timezone(city))
+    if errors:
+        raise FieldError(errors)
+    return dt.datetime.combine(day, clock, zone).astimezone(dt.timezone.utc)
+
+def natal_positions(t_utc, points=NATAL_POINTS):
+    t = ephem.Date(t_utc)
+    return {p: ingress_engine.lon_at(p, t) for p in points}
@@ -0,0 +1,93 @@
+# page_cache.py
+# Incremental rebuilds: a page is drawn again only when what it shows changed.
+#
+# A generator keys every page on its inputs -- the page's slice of the event
+# index, the style and layout constants, and code_key() of the modules that
+# draw it (their source and the reportlab version), so an edit to any of
+# them redraws every page. After a full build the output's page keys are
+# recorded in a manifest (with a hash of the file written). The next build of
+# the same file compares keys, renders only the pages whose key changed (as
+# one-page PDFs, kept under .cache/pages by key so a reverted edit costs
+# nothing) and splices them into the existing PDF (pdf_merge.splice); the
+# other pages, fonts and forms stay as they are. A spliced page shares the
+# document's fonts, forms and (primed, see fonts.prime) font subsets where
+# they are identical, so the file grows by little more than the page's
+# content until the next full build.
+
+import functools, hashlib, json, os
+from pathlib import Path
+
+import reportlab
+import pdf_merge
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "pages"
+FORMAT = 1   # bump when the manifest layout changes
+
+def key(*parts):
+    # parts: anything JSON can write (dates and colors via str)
+    blob = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def code_key(*modules):
+    # -> what a page key needs to know about the drawing code: the modules'
+    # source digests and the reportlab version
+    return [reportlab.Version, *(_source_digest(m.__file__) for m in modules)]
+
+def _manifest_path(out, cache_dir):
+    name = hashlib.sha256(os.path.abspath(out).encode()).hexdigest()[:32]
+    return Path(cache_dir) / "manifests" / f"{name}.json"
+
+def record(out, keys, cache_dir=CACHE_DIR):
+    # after writing `out` in full: remember its page keys
+    with open(out, "rb") as f:
+        digest = hashlib.md5(f.read()).hexdigest()
+    path = _manifest_path(out, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"format": FORMAT, "out": os.path.abspath(out),
+                               "md5": digest, "keys": list(keys)}))
+    os.replace(tmp, path)
+
+def fragment(page_key, render, cache_dir=CACHE_DIR):
+    # -> one-page PDF bytes for a key, rendered only if not cached yet
+    path = Path(cache_dir) / f"{page_key}.pdf"
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        pass
+    pdf = render()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(pdf)
+    os.replace(tmp, path)
+    return pdf
+
+def rebuild(out, keys, render, cache_dir=CACHE_DIR):
+    # Bring `out` up to date with `keys` by splicing; render(i) -> one-page PDF
+    # of page i. -> the page indices replaced, or None when `out` has no
+    # usable record (missing, edited elsewhere, different page list) and the
+    # caller has to build it in full and record() it.
+    try:
+        man = json.loads(_manifest_path(out, cache_dir).read_text())
+        with open(out, "rb") as f:
+            old = f.read()
+    except (OSError, ValueError):
+        return None
+    if (man.get("format") != FORMAT or len(man["keys"]) != len(keys)
+            or hashlib.md5(old).hexdigest() != man["md5"]):
+        return None
+    changed = [i for i, (a, b) in enumerate(zip(man["keys"], keys)) if a != b]
+    if changed:
+        pdf = pdf_merge.splice(old, {i: fragment(keys[i], lambda: render(i), cache_dir)
+                                     for i in changed})
+        tmp = f"{out}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp, out)
+        record(out, keys, cache_dir)
+    return changed
@@ -0,0 +1,206 @@
+# pdf_merge.py
+# Concatenate PDF fragments written by reportlab into one document, page
+# order preserved. Just enough PDF for what reportlab emits: a classic xref
+# table, uncompressed object dictionaries and a page tree. Objects are sliced
+# out by their xref offsets (so binary streams are never scanned), everything
+# reachable from the pages is renumbered into one file -- references are
+# found by a scanner that steps over string literals, hex strings and
+# comments, so text and metadata that read like "12 0 R" stay as they
+# are -- and a fresh page tree,
+# catalog and xref are written around them. Objects with the same content
+# (references compared by what they point to) are written once, so forms,
+# fonts and font subsets that fragments share -- fonts.prime() makes the
+# subsets match -- cost nothing extra; other subsets each fragment keeps,
+# making a merged file somewhat larger than a single-canvas build.
+# splice() swaps single pages of a document for freshly rendered ones and
+# keeps the rest of it, shared fonts and forms included, as it is.
+
+import hashlib, re
+
+# where a scan stops: a reference, or the start of something to step over
+_TOKEN = re.compile(rb"<<|>>|\(|<|%|(?<![\d.+-])(\d+) 0 R\b")
+_EOL = re.compile(rb"[\r\n]")
+
+def _string_end(d, i):
+    # -> the index after the literal string whose "(" ends at i
+    depth = 1
+    while depth:
+        c = d[i]
+        if c == 0x5c:   # backslash: the next byte is escaped
+            i += 2
+            continue
+        depth += (c == 0x28) - (c == 0x29)
+        i += 1
+    return i
+
+def _scan(d):
+    # -> [(start, end, object number)] of the indirect references in an
+    # object's dictionary part
+    out, i = [], 0
+    while True:
+        m = _TOKEN.search(d, i)
+        if m is None:
+            return out
+        tok, i = m.group(), m.end()
+        if m.group(1) is not None:
+            out.append((m.start(), i, int(m.group(1))))
+        elif tok == b"(":
+            i = _string_end(d, i)
+        elif tok == b"<":
+            i = d.index(b">", i) + 1
+        elif tok == b"%":
+            eol = _EOL.search(d, i)
+            i = eol.end() if eol else len(d)
+
+def _key(d, start):
+    # the /Name a reference at `start` is the value of, or None
+    m = re.search(rb"/([^\s/<>\[\]()]+)\s*$", d[max(0, start - 64):start])
+    return m.group(1) if m else None
+
+def _rewrite(d, fn):
+    # d with each reference's number n replaced by fn(n, key) (bytes)
+    out, i = [], 0
+    for start, end, n in _scan(d):
+        out += [d[i:start], fn(n, _key(d, start))]
+        i = end
+    return b"".join(out) + d[i:]
+
+def _objects(pdf):
+    # {num: object bytes "N 0 obj ... endobj"}, trailer dict bytes
+    start = int(re.search(rb"startxref\s+(\d+)", pdf[-64:]).group(1))
+    m = re.compile(rb"xref\s+(\d+) (\d+)\s+").match(pdf, start)
+    first, count = int(m.group(1)), int(m.group(2))
+    offsets = {}
+    for i, entry in enumerate(pdf[m.end():m.end() + 20*count].split(b"\n")[:count]):
+        off, _, kind = entry.split()[:3]
+        if kind == b"n":
+            offsets[first + i] = int(off)
+    bounds = sorted(offsets.values()) + [start]
+    ends = {a: b for a, b in zip(bounds, bounds[1:])}
+    objs = {n: pdf[off:ends[off]].rstrip() for n, off in offsets.items()}
+    trailer = pdf[pdf.index(b"trailer", start):]
+    return objs, trailer
+
+def _split(obj):
+    # -> (dictionary part, stream part or b"") of "N 0 obj ... endobj"
+    body = obj[obj.index(b"obj") + 3:obj.rindex(b"endobj")]
+    i = body.find(b"stream")
+    return (body, b"") if i < 0 else (body[:i], body[i:])
+
+def _ref(d, key):
+    return next((n for start, _, n in _scan(d) if _key(d, start) == key), None)
+
+def _pages(objs, num):
+    # leaf pages in order under a /Pages node
+    d, _ = _split(objs[num])
+    if b"/Type /Pages" not in d:
+        return [num]
+    kids = d[d.index(b"/Kids"):]
+    kids = kids[:kids.index(b"]")]
+    return [p for _, _, k in _scan(kids) for p in _pages(objs, k)]
+
+def merge(fragments):
+    # [PDF bytes] -> one PDF with every fragment's pages in order
+    return assemble(fragments, [(i, None) for i in range(len(fragments))])
+
+def splice(base, replacements):
+    # -> `base` with page i swapped for the one-page PDF replacements[i]; the
+    # other pages keep base's objects (and its font subsets) as they are
+    n = len(_parse(base)[2])
+    picks = [(1 + sorted(replacements).index(i), 0) if i in replacements else (0, i)
+             for i in range(n)]
+    return assemble([base, *(replacements[i] for i in sorted(replacements))], picks)
+
+def _parse(pdf):
+    # -> (objects, trailer, leaf page numbers in order)
+    objs, trailer = _objects(pdf)
+    root = _ref(_split(objs[_ref(trailer, b"Root")])[0], b"Pages")
+    return objs, trailer, _pages(objs, root)
+
+def _digests(objs, src, pages):
+    # -> digest(n): what object n holds, its references replaced by their
+    # targets' digests (/Parent left out); a leaf page, or an object on a
+    # reference cycle, is its own and never shared
+    memo = {}
+    def digest(n):
+        if n not in memo:
+            if n in pages or n not in objs:
+                memo[n] = b"%d:%d" % (src, n)
+                return memo[n]
+            memo[n] = None   # in progress
+            d, stream = _split(objs[n])
+            body = _rewrite(d, lambda r, key: b"" if key == b"Parent" else digest(r) or b"%d:%d" % (src, r))
+            memo[n] = hashlib.sha1(body + stream).hexdigest().encode()
+        return memo[n]
+    return digest
+
+def assemble(sources, picks):
+    # -> one PDF of the picked pages: (source index, page index or None for
+    # all of its pages), in order. Objects the picked pages share, within a
+    # source or across sources, are written once.
+    parsed = [_parse(pdf) for pdf in sources]
+    chosen = [[] for _ in sources]
+    for src, page in picks:
+        pages = parsed[src][2]
+        chosen[src] += pages if page is None else [pages[page]]
+
+    out_objs, info = [], None
+    renums, nxt = [], 1
+    written = {}   # digest -> new number
+    for src, ((objs, trailer, _), pages) in enumerate(zip(parsed, chosen)):
+        renum = {}
+        renums.append(renum)
+        if not pages:
+            continue
+        if info is None and _ref(trailer, b"Info") in objs:
+            info = _split(objs[_ref(trailer, b"Info")])[0]
+        # everything the pages use, but not the page tree above them
+        seen, todo = set(), list(pages)
+        while todo:
+            n = todo.pop()
+            if n in seen or n not in objs:
+                continue
+            seen.add(n)
+            d, _ = _split(objs[n])
+            todo += [r for start, _, r in _scan(d) if _key(d, start) != b"Parent"]
+        digest = _digests(objs, src, set(pages))
+        for n in sorted(seen):
+            k = digest(n)
+            if k in written:
+                renum[n] = written[k]
+                continue
+            renum[n] = written[k] = nxt; nxt += 1
+            d, stream = _split(objs[n])
+            out_objs.append((renum, renum[n], d, stream))
+    kids = []
+    for src, page in picks:
+        pages = parsed[src][2]
+        kids += [renums[src][p] for p in (pages if page is None else [pages[page]])]
+
+    pages_num, catalog_num = nxt, nxt + 1
+    info_num = nxt + 2 if info is not None else None
+    parent = b"%d 0 R" % pages_num
+    buf = bytearray(b"%PDF-1.4\n%\x93\x8c\x8b\x9e merged page fragments\n")
+    offsets = {}
+    def put(num, body):
+        offsets[num] = len(buf)
+        buf.extend(b"%d 0 obj" % num + body.rstrip() + b"\nendobj\n")
+    for renum, num, d, stream in out_objs:
+        put(num, _rewrite(d, lambda n, key: parent if key == b"Parent"
+                          else b"%d 0 R" % renum.get(n, 0)) + stream)
+    put(pages_num, b"\n<<\n/Count %d /Kids [ %s ] /Type /Pages\n>>" %
+        (len(kids), b" ".join(b"%d 0 R" % k for k in kids)))
+    put(catalog_num, b"\n<<\n/Pages %d 0 R /Type /Catalog\n>>" % pages_num)
+    if info is not None:
+        put(info_num, info)
+    size = max(offsets) + 1
+    xref = len(buf)
+    buf.extend(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+    for n in range(1, size):
+        buf.extend(b"%010d 00000 n \n" % offsets[n])
+    digest = hashlib.md5(bytes(buf)).hexdigest().encode()
+    buf.extend(b"trailer\n<<\n/ID [<%s><%s>]\n" % (digest, digest))
+    if info is not None:
+        buf.extend(b"/Info %d 0 R\n" % info_num)
+    buf.extend(b"/Root %d 0 R\n/Size %d\n>>\nstartxref\n%d\n%%%%EOF\n" % (catalog_num, size, xref))
+    return bytes(buf)
@@ -0,0 +1,109 @@
+# pdf_stream.py
+# A reportlab canvas that writes a PDF to a binary stream page by page.
+#
+# reportlab keeps every page of a document in memory and formats the whole
+# file in save(). Here each finished page -- its dictionary, its content
+# stream and any form XObjects first drawn on it -- is written to the stream
+# by showPage() and dropped. Only what still changes until the end is kept:
+# the font subsets (their glyph sets grow with every page), the shared font
+# dictionary, the page tree, catalog and info, written by save() with the
+# xref (PageWriter, over the canvas's own PDFDocument). Objects keep the numbers reportlab gives them; only their order in
+# the file differs from a normal save, so one document's fonts are still
+# subset once. Memory stays at about one page whatever the page count.
+#
+#   with open("out.pdf", "wb") as f:
+#       c = pdf_stream.Canvas(f, pagesize=landscape(A4))
+#       ...; c.showPage()    # page 1 is in f now
+#       c.save()
+
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfgen import canvas
+
+HEADER_VERSION = (1, 4)   # written before the pages are drawn; covers transparency
+
+class PageWriter:
+    # writes the objects of a reportlab PDFDocument to `out` as they are
+    # finished; the document itself is the canvas's own, unchanged
+    def __init__(self, doc, out):
+        self.doc = doc
+        self.out = out
+        self.pos = 0
+        self.header_version = max(doc._pdfVersion, HEADER_VERSION)
+
+    def _write(self, data):
+        # -> the offset `data` was written at
+        if self.pos == 0:
+            head = pdfdoc.PDFFile(self.header_version).format(self.doc)
+            self.out.write(head); self.pos = len(head)
+        at = self.pos
+        self.out.write(data); self.pos += len(data)
+        return at
+
+    def _open(self):
+        # objects that change until save(): written last
+        doc = self.doc
+        return {id(doc.Catalog), id(doc.Pages), id(doc.info), id(doc.Outlines),
+                id(doc.idToObject[pdfdoc.BasicFonts])}
+
+    def flush(self, final=False):
+        # write every registered object not yet written; formatting one may
+        # register more (a page registers its content stream)
+        doc = self.doc
+        keep = set() if final else self._open()
+        n = 1
+        while n in doc.numberToId:
+            oid = doc.numberToId[n]
+            obj = doc.idToObject[oid]
+            if oid not in doc.idToOffset and id(obj) not in keep:
+                doc.idToOffset[oid] = self._write(pdfdoc.PDFIndirectObject(oid, obj).format(doc))
+                # keep only the name: the page tree and xref need nothing else
+                doc.idToObject[oid] = pdfdoc.PDFObjectReference(oid)
+            n += 1
+
+    def page_done(self):
+        # after the document's addPage(): the page and what it registered
+        self.flush()
+        pages = self.doc.Pages.pages
+        pages[-1] = pdfdoc.PDFObjectReference(pages[-1].__InternalName__)
+        if hasattr(self.out, "flush"):
+            self.out.flush()
+
+    def finish(self, canvas):
+        # what PDFDocument.GetPDFData prepares (font subsets, info, outline),
+        # then the rest of the objects, the xref and the trailer
+        doc = self.doc
+        if doc._pdfVersion > self.header_version:
+            raise ValueError(f"PDF {doc._pdfVersion} features used after the header was written")
+        for fnt in doc.delayedFonts:
+            fnt.addObjects(doc)
+        doc.info.invariant = doc.invariant
+        doc.info.digest(doc.signature)
+        doc.Reference(doc.Catalog)
+        doc.Reference(doc.info)
+        doc.Outlines.prepare(doc, canvas)
+        if doc.Outlines.ready < 0:
+            doc.Catalog.Outlines = None
+        self.flush(final=True)
+        ids = [doc.numberToId[n] for n in range(1, len(doc.numberToId) + 1)]
+        xref = pdfdoc.PDFCrossReferenceTable()
+        xref.addsection(0, ids)
+        tail = xref.format(doc)
+        trailer = pdfdoc.PDFTrailer(startxref=self.pos, Size=len(ids) + 1,
+                                    Root=doc.Reference(doc.Catalog),
+                                    Info=doc.Reference(doc.info), ID=doc.ID())
+        self._write(tail + trailer.format(doc))
+
+class Canvas(canvas.Canvas):
+    # canvas.Canvas over a writable binary stream (file, socket.makefile("wb"),
+    # BytesIO, ...) that leaves each page in the stream at showPage()
+    def __init__(self, out, **kw):
+        super().__init__(out, **kw)
+        self._writer = PageWriter(self._doc, out)
+
+    def showPage(self):
+        super().showPage()
+        self._writer.page_done()
+
+    def save(self):
+        if len(self._code): self.showPage()
+        self._writer.finish(self)
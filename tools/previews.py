@@ -0,0 +1,156 @@
+# previews.py
+# PNG previews of the built calendars for the shop pages.
+#
+#   python tools/previews.py                       # every PDF in downloads/12 and downloads/13
+#   python tools/previews.py downloads/12/core-2026-v1.pdf --pages 1 2 7 --jobs 4
+#
+# Selected pages of each PDF are rasterized twice: a thumbnail (index.html
+# cards) and a web-size preview (product.html). Pages are rendered in
+# parallel, one pool task per page. Renders are cached under
+# .cache/previews by the PDF's content hash (and the render settings), so an
+# unchanged calendar costs one hash and is never rasterized again, and a
+# reverted one comes back from the cache. The PNGs are published to
+# previews/<format>/<name>/ (a file is only rewritten when its bytes differ)
+# with previews/manifest.json, which product.html reads to find them.
+# Offline: pymupdf renders if installed, else poppler's pdftoppm.
+
+import argparse, hashlib, json, os, shutil, subprocess, sys, tempfile, time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import pymupdf
+except ImportError:   # falls back to pdftoppm
+    pymupdf = None
+
+SITE_DIR  = Path(__file__).resolve().parent.parent
+CACHE_DIR = SITE_DIR / ".cache" / "previews"
+OUT_DIR   = SITE_DIR / "previews"
+SOURCES   = ["downloads/12", "downloads/13"]
+FORMAT = 1   # bump when the file naming or the rendering changes
+
+PAGES = (1, 2, 7)   # cover, the first month and one mid-year; pages past the end are skipped
+SIZES = {"thumb": 360, "web": 1280}   # width in pixels; the height follows the page
+
+def renderer():
+    # what rasterizes here, as it goes into the cache key
+    if pymupdf is not None:
+        return f"pymupdf-{pymupdf.__version__}"
+    if shutil.which("pdftoppm"):
+        return "pdftoppm"
+    raise RuntimeError("previews need pymupdf or poppler's pdftoppm")
+
+def page_count(pdf):
+    if pymupdf is not None:
+        with pymupdf.open(pdf) as doc:
+            return doc.page_count
+    out = subprocess.run(["pdfinfo", str(pdf)], capture_output=True, text=True, check=True).stdout
+    return next(int(l.split()[1]) for l in out.splitlines() if l.startswith("Pages:"))
+
+def digest(pdf):
+    return hashlib.sha256(Path(pdf).read_bytes()).hexdigest()
+
+def settings(sizes=SIZES):
+    # everything besides the PDF that shapes its PNGs, hashed for the cache path
+    blob = json.dumps([FORMAT, renderer(), sizes], sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+def _name(page, size):
+    return f"page-{page}-{size}.png"
+
+def _write(path, data):
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+def _rasterize(pdf, page, sizes, out_dir):
+    # pool task: page (1-based) of pdf at every size into out_dir
+    out_dir = Path(out_dir)
+    if pymupdf is not None:
+        with pymupdf.open(pdf) as doc:
+            p = doc[page - 1]
+            for size, width in sizes.items():
+                zoom = width/p.rect.width
+                pix = p.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+                _write(out_dir / _name(page, size), pix.tobytes("png"))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        for size, width in sizes.items():
+            prefix = Path(tmp) / size
+            subprocess.run(["pdftoppm", "-png", "-singlefile", "-f", str(page), "-l", str(page),
+                            "-scale-to-x", str(width), "-scale-to-y", "-1", str(pdf), str(prefix)],
+                           check=True, capture_output=True)
+            _write(out_dir / _name(page, size), prefix.with_suffix(".png").read_bytes())
+
+def _publish(src, dst):
+    # copy unless dst already holds the same bytes; -> True if written
+    data = src.read_bytes()
+    if dst.exists() and dst.read_bytes() == data:
+        return False
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    _write(dst, data)
+    return True
+
+def run(pdfs, pages=PAGES, sizes=SIZES, out_dir=OUT_DIR, cache_dir=CACHE_DIR, jobs=None):
+    # -> {pdf: (pages rendered now, pages reused from the cache)}
+    todo, plan, stats = [], [], {}
+    tag = settings(sizes)
+    for pdf in pdfs:
+        pdf = Path(pdf)
+        sha = digest(pdf)
+        cached = Path(cache_dir) / f"{sha}-{tag}"
+        cached.mkdir(parents=True, exist_ok=True)
+        wanted = [p for p in pages if p <= page_count(pdf)]
+        missing = [p for p in wanted if not all((cached / _name(p, s)).exists() for s in sizes)]
+        todo += [(str(pdf), p, sizes, str(cached)) for p in missing]
+        plan.append((pdf, sha, cached, wanted))
+        stats[str(pdf)] = (len(missing), len(wanted) - len(missing))
+    if todo:
+        with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count(), len(todo))) as pool:
+            for fut in [pool.submit(_rasterize, *job) for job in todo]:
+                fut.result()
+
+    # publish: previews/<format>/<name>/page-N-<size>.png, paths relative to the site
+    manifest_path = Path(out_dir) / "manifest.json"
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+    for pdf, sha, cached, wanted in plan:
+        # keyed as the pages link the PDF: downloads/12/core-2026-v1.pdf
+        full = pdf.resolve()
+        rel = full.relative_to(SITE_DIR) if full.is_relative_to(SITE_DIR) else full
+        dst = Path(out_dir) / full.parent.name / pdf.stem
+        entries = []
+        for p in wanted:
+            entry = {"page": p}
+            for size in sizes:
+                _publish(cached / _name(p, size), dst / _name(p, size))
+                entry[size] = (dst / _name(p, size)).relative_to(Path(out_dir).parent).as_posix()
+            entries.append(entry)
+        manifest[rel.as_posix()] = {"sha256": sha, "pages": entries}
+    text = json.dumps(manifest, indent=1, sort_keys=True) + "\n"
+    if not manifest_path.exists() or manifest_path.read_text() != text:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        _write(manifest_path, text.encode())
+    return stats
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render cached PNG previews of the calendar PDFs.")
+    ap.add_argument("pdfs", nargs="*", type=Path,
+                    help=f"PDFs to preview (default: every PDF in {' and '.join(SOURCES)})")
+    ap.add_argument("--pages", type=int, nargs="+", default=list(PAGES))
+    ap.add_argument("--out", type=Path, default=OUT_DIR)
+    ap.add_argument("--jobs", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    pdfs = args.pdfs or sorted(p for src in SOURCES for p in (SITE_DIR / src).glob("*.pdf"))
+    t0 = time.perf_counter()
+    stats = run(pdfs, tuple(args.pages), SIZES, args.out, jobs=args.jobs)
+    for pdf, (rendered, reused) in stats.items():
+        print(f"{pdf}: {rendered} pages rendered, {reused} from the cache")
+    print(f"{len(stats)} PDFs in {time.perf_counter() - t0:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
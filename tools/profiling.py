@@ -0,0 +1,132 @@
+# profiling.py
+# Where a build's time goes: named stage timers, counters and optional
+# cProfile / tracemalloc captures, collected into one report per build().
+#
+#   rep = serene.build(2027, out=buf)      # every build() returns its Report
+#   rep.as_dict()                          # {"wall_ms", "stages", "counters", ...}
+#   CALENDAR_PROFILE=cprofile,tracemalloc python tools/serene_12month_2026_full.py
+#
+# A generator opens a session() in build() and wraps its steps in
+# stage("name"); a stage entered more than once (a page drawn twice, say)
+# adds up. Sessions nest: a build() called inside another joins the outer
+# report, and stage() outside any session costs nothing. Counters cover the
+# session only: ephem calls (ingress_engine.EVALS, also per body: the
+# longitude solvers' and lunar.py's searches and eclipse geometry) and the
+# reportlab stringWidth calls textfit makes (textfit.MEASURED; centred and
+# right-aligned strings are measured by reportlab itself, uncounted). With
+# CALENDAR_PROFILE set (to anything) the report is printed to stderr when
+# build() ends; naming captures in it adds a cProfile listing and the
+# tracemalloc peak. The last
+# finished report of the process is kept in `last` for callers that only
+# see render_calendar().
+
+import cProfile, io, os, pstats, sys, time, tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+import ingress_engine, textfit
+
+ENV = "CALENDAR_PROFILE"
+CAPTURES = ("cprofile", "tracemalloc")
+TOP = 25   # functions listed from a cProfile capture
+
+current = None   # the Report being collected, if a build is running
+last = None      # the last finished Report
+
+class Report:
+    def __init__(self, name, captures=()):
+        self.name = name
+        self.captures = set(captures)
+        self.wall = 0.0
+        self.stages = {}          # name -> [seconds, calls, ephem evals, stringWidth calls]
+        self.counters = Counter() # "ephem_evals", "stringWidth"
+        self.evals = {}           # body -> ephem evals
+        self.peak_kb = None       # tracemalloc peak over the build
+        self.profile = None       # cProfile listing, TOP functions by cumulative time
+
+    def as_dict(self):
+        return {"name": self.name, "wall_ms": round(self.wall*1000, 3),
+                "stages": {n: {"ms": round(s*1000, 3), "calls": k, "ephem_evals": e, "stringWidth": w}
+                           for n, (s, k, e, w) in self.stages.items()},
+                "counters": dict(self.counters), "evals": self.evals,
+                "peak_kb": self.peak_kb, "profile": self.profile}
+
+    def format(self):
+        lines = [f"{self.name}: {self.wall*1000:.1f} ms, {self.counters['ephem_evals']} ephem evals,"
+                 f" {self.counters['stringWidth']} stringWidth calls"]
+        for n, (s, k, e, w) in self.stages.items():
+            lines.append(f"  {n:<18} {s*1000:9.1f} ms {k:4d}x {e:7d} evals {w:6d} widths")
+        if self.peak_kb is not None:
+            lines.append(f"  peak traced memory {self.peak_kb:.1f} KB")
+        if self.profile:
+            lines.append(self.profile)
+        return "\n".join(lines)
+
+def _captures(profile):
+    # -> (captures, print at the end?) from build()'s profile= or the environment
+    if profile is not None:
+        return set(profile), False
+    env = os.environ.get(ENV)
+    if env is None:
+        return set(), False
+    return {c.strip() for c in env.split(",")} & set(CAPTURES), True
+
+def _evals():
+    return sum(ingress_engine.EVALS.values())
+
+def _widths():
+    return sum(textfit.MEASURED.values())
+
+@contextmanager
+def session(name, profile=None):
+    # profile: captures to take ("cprofile", "tracemalloc"), or None for
+    # those named in $CALENDAR_PROFILE
+    global current, last
+    if current is not None:
+        yield current
+        return
+    captures, emit = _captures(profile)
+    rep = current = Report(name, captures)
+    evals0, widths0 = ingress_engine.EVALS.copy(), _widths()
+    prof = cProfile.Profile() if "cprofile" in captures else None
+    tracing = "tracemalloc" in captures and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    if prof:
+        prof.enable()
+    try:
+        yield rep
+    finally:
+        if prof:
+            prof.disable()
+        rep.wall = time.perf_counter() - t0
+        if tracing:
+            rep.peak_kb = round(tracemalloc.get_traced_memory()[1]/1024, 1)
+            tracemalloc.stop()
+        rep.counters["stringWidth"] = _widths() - widths0
+        rep.evals = dict(ingress_engine.EVALS - evals0)
+        rep.counters["ephem_evals"] = sum(rep.evals.values())
+        if prof:
+            buf = io.StringIO()
+            pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(TOP)
+            rep.profile = buf.getvalue()
+        current, last = None, rep
+        if emit:
+            print(rep.format(), file=sys.stderr)
+
+@contextmanager
+def stage(name):
+    rep = current
+    if rep is None:
+        yield
+        return
+    t0, e0, w0 = time.perf_counter(), _evals(), _widths()
+    try:
+        yield
+    finally:
+        s = rep.stages.setdefault(name, [0.0, 0, 0, 0])
+        s[0] += time.perf_counter() - t0
+        s[1] += 1
+        s[2] += _evals() - e0
+        s[3] += _widths() - w0
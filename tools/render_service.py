@@ -0,0 +1,289 @@
+# render_service.py
+# Local HTTP service that renders personalized calendars for PayPal orders
+# (personalized.html): birth date, time and city in, PDF out.
+#
+#   python tools/render_service.py --port 8765 --workers 4
+#   curl -d '{"birth_date":"1990-05-17","birth_time":"14:30","city":"Oslo","name":"Ada"}' \
+#        http://127.0.0.1:8765/render -o calendar.pdf
+#
+# Renders run in long-lived worker processes that load the year's astro data
+# once, so a request only pays for the natal overlay and the drawing. At most
+# `workers` renders run at once and up to `queue` more wait; beyond that the
+# service answers 503 with Retry-After. The worker sends each page over a
+# pipe as soon as it is drawn and the response goes out chunked, so the
+# client starts receiving before the last page is done. With --split N an
+# order's pages are drawn in N workers at once and merged (pdf_merge.py),
+# trading a larger file for lower latency when the pool is not saturated;
+# the merged file is sent in one piece. An order's calendar is dated in its
+# birth city's zone (the year's astro is shared by every zone, see
+# astro_results.py). GET /stats returns the profiling reports (profiling.py)
+# of the last streamed orders.
+
+import argparse, asyncio, collections, json, multiprocessing, os, sys
+from concurrent.futures import ProcessPoolExecutor
+
+import lon_store, lon_table, natal, transits, pdf_merge, profiling
+from calendars import GENERATORS, generator, render_calendar
+
+YEAR  = 2026
+CHUNK = 64*1024
+REPORTS = 100   # profiling reports kept for /stats
+
+# ---------- worker side ----------
+_indexes = {}   # (year, tz, bodies) -> transits.TransitIndex, kept warm per worker
+
+def _warm(year):
+    # load every generator's year and build its transit index before the first order
+    for which in GENERATORS:
+        gen = generator(*which)
+        gen.load_year(year)
+        _index(gen, year, gen.TZ)
+
+def _index(gen, year, tz):
+    key = (year, tz, tuple(gen.TABLE_BODIES))
+    if key not in _indexes:
+        _indexes[key] = transits.TransitIndex(lon_table.daily_table(year, tz, gen.TABLE_BODIES))
+    return _indexes[key]
+
+def prepare_order(order):
+    # -> ((kind, style), year, tz, overlay, for_whom); natal.FieldError
+    # naming every field that is wrong with the order itself
+    if not isinstance(order, dict):
+        raise natal.FieldError({"order": "must be a JSON object"})
+    errors = {}
+    which = str(order.get("kind", "12")), order.get("style", "core")
+    if not isinstance(which[1], str):
+        errors["style"] = f"{which[1]!r} is not a style name"
+    else:
+        try:
+            gen = generator(*which)
+        except ValueError as e:
+            errors["kind" if which[0] not in {k for k, _ in GENERATORS} else "style"] = str(e)
+    # years outside the precomputed store would each start a fresh ephemeris
+    # solve (and new cache files) inside a request
+    try:
+        year = int(order.get("year", YEAR))
+    except (TypeError, ValueError):
+        errors["year"] = f"{order.get('year')!r} is not a year"
+    else:
+        if not lon_store.FIRST <= year <= lon_store.LAST:
+            errors["year"] = f"only {lon_store.FIRST}-{lon_store.LAST} calendars are offered"
+    name = order.get("name") or ""
+    if not isinstance(name, str):
+        errors["name"] = f"{name!r} is not a name"
+    city, tz = order.get("city"), order.get("tz")
+    try:
+        born = natal.birth_instant(order.get("birth_date"), order.get("birth_time") or "12:00", city, tz)
+    except natal.FieldError as e:
+        errors.update(e.fields)
+    if errors:
+        raise natal.FieldError(errors)
+    # the calendar is dated where the customer was born
+    tz = tz or (natal.find_timezone(city) if city else None) or gen.TZ
+    overlay = _index(gen, year, tz).transit_days(natal.natal_positions(born))
+    name = name.strip()
+    for_whom = f"Personal transits for {name}" if name else "Personal transits"
+    return which, year, tz, overlay, for_whom
+
+def render_order(order):
+    # -> PDF bytes, drawn in one worker
+    (kind, style), year, tz, overlay, for_whom = prepare_order(order)
+    return render_calendar(year, kind, style, tz=tz, overlay=overlay, for_whom=for_whom)
+
+class _PipeOut:
+    # binary file over a Pipe connection: what is written by the time of each
+    # flush() (pdf_stream flushes per page) goes to the parent as one message
+    def __init__(self, conn):
+        self.conn = conn
+        self.buf = bytearray()
+
+    def write(self, data):
+        self.buf += data
+        return len(data)
+
+    def flush(self):
+        if self.buf:
+            self.conn.send(("data", bytes(self.buf)))
+            self.buf.clear()
+
+def stream_order(prepared, conn):
+    # worker: draw a prepare_order() result into `conn` page by page, then
+    # ("end", the build's profiling report as a dict), or ("error", message)
+    # if the render fails
+    (kind, style), year, tz, overlay, for_whom = prepared
+    out = _PipeOut(conn)
+    try:
+        render_calendar(year, kind, style, out, tz=tz, overlay=overlay, for_whom=for_whom)
+        out.flush()
+        conn.send(("end", profiling.last.as_dict()))
+    except Exception as e:
+        conn.send(("error", f"render failed: {e}"))
+    finally:
+        conn.close()
+
+def _recv(conn):
+    try:
+        return conn.recv()
+    except EOFError:   # the worker died
+        return ("error", "render failed: worker exited")
+
+# ---------- HTTP ----------
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+MAX_BODY = 64*1024
+ATTACHMENT = 'Content-Disposition: attachment; filename="serene-personal.pdf"'
+
+async def _read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    method, path, _ = line.decode("latin-1").split(" ", 2)
+    headers = {}
+    while True:
+        h = await reader.readline()
+        if h in (b"\r\n", b"\n", b""):
+            break
+        k, _, v = h.decode("latin-1").partition(":")
+        headers[k.strip().lower()] = v.strip()
+    n = int(headers.get("content-length", 0))
+    body = await reader.readexactly(n) if 0 < n <= MAX_BODY else b""
+    return method, path, headers, body, n
+
+def _head(writer, status, ctype, length, extra):
+    head = [f"HTTP/1.1 {status} {REASONS[status]}", f"Content-Type: {ctype}",
+            f"Content-Length: {length}" if length is not None else "Transfer-Encoding: chunked",
+            "Connection: close", *extra]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+
+async def _respond(writer, status, body, ctype="application/json", extra=()):
+    _head(writer, status, ctype, len(body), extra)
+    for i in range(0, len(body), CHUNK):
+        writer.write(body[i:i+CHUNK])
+        await writer.drain()
+    await writer.drain()
+
+def _error(msg, fields=None):
+    # fields: {field: problem} of an order that failed validation
+    return json.dumps({"error": msg, **({"fields": fields} if fields else {})}).encode()
+
+class Service:
+    def __init__(self, workers=os.cpu_count(), queue=32, year=YEAR, split=1):
+        # forkserver: a worker forked from this process while a client is
+        # connected would hold that socket open after the response is done
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm, initargs=(year,),
+                                        mp_context=multiprocessing.get_context("forkserver"))
+        self.slots = asyncio.Semaphore(workers)
+        self.split = split   # >1: an order's pages are drawn in that many workers and merged
+        self.capacity = workers + queue
+        self.pending = 0
+        self.reports = collections.deque(maxlen=REPORTS)
+
+    async def handle(self, reader, writer):
+        try:
+            req = await _read_request(reader)
+            if req is None:
+                return
+            method, path, headers, body, n = req
+            if path == "/health":
+                await _respond(writer, 200, json.dumps({"pending": self.pending}).encode())
+            elif path == "/stats":
+                await _respond(writer, 200, json.dumps(list(self.reports)).encode())
+            elif path != "/render":
+                await _respond(writer, 404, _error("not found"))
+            elif method != "POST":
+                await _respond(writer, 405, _error("POST an order to /render"))
+            elif n > MAX_BODY:
+                await _respond(writer, 413, _error("order too large"))
+            elif self.pending >= self.capacity:
+                await _respond(writer, 503, _error("busy, retry shortly"), extra=("Retry-After: 5",))
+            else:
+                await self._render(writer, body)
+        except (ValueError, asyncio.IncompleteReadError):
+            await _respond(writer, 400, _error("malformed request"))
+        finally:
+            writer.close()
+
+    async def _render(self, writer, body):
+        try:
+            order = json.loads(body)
+        except ValueError:
+            return await _respond(writer, 400, _error("body must be a JSON order"))
+        self.pending += 1
+        try:
+            async with self.slots:
+                if self.split > 1:
+                    pdf = await self._render_split(order)
+                else:
+                    return await self._stream(writer, order)
+        except ValueError as e:
+            return await _respond(writer, 400, _error(str(e), getattr(e, "fields", None)))
+        except Exception as e:
+            return await _respond(writer, 500, _error(f"render failed: {e}"))
+        finally:
+            self.pending -= 1
+        await _respond(writer, 200, pdf, "application/pdf", (ATTACHMENT,))
+
+    async def _stream(self, writer, order):
+        # order errors surface before the 200 goes out; after it, a failed
+        # render can only cut the chunked body short
+        loop = asyncio.get_running_loop()
+        prepared = await loop.run_in_executor(self.pool, prepare_order, order)
+        recv, send = multiprocessing.Pipe(duplex=False)
+        fut = loop.run_in_executor(self.pool, stream_order, prepared, send)
+        # once the worker has the order, the parent's copy only keeps EOF from
+        # being seen if the worker dies
+        fut.add_done_callback(lambda f: send.close())
+        try:
+            kind, data = await loop.run_in_executor(None, _recv, recv)
+            if kind == "error":
+                return await _respond(writer, 500, _error(data))
+            _head(writer, 200, "application/pdf", None, (ATTACHMENT,))
+            while kind == "data":
+                writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+                await writer.drain()
+                kind, data = await loop.run_in_executor(None, _recv, recv)
+            if kind == "end":
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+                self.reports.append(data)
+        finally:
+            await asyncio.wait([fut])
+            recv.close()
+
+    async def _render_split(self, order):
+        loop = asyncio.get_running_loop()
+        which, year, tz, overlay, for_whom = await loop.run_in_executor(self.pool, prepare_order, order)
+        gen = generator(*which)
+        frags = await asyncio.gather(*(
+            loop.run_in_executor(self.pool, gen.render_fragment, year, run, overlay, for_whom, tz)
+            for run in gen.split_pages(self.split)))
+        return pdf_merge.merge(frags)
+
+async def serve(host, port, workers, queue, year, split=1):
+    svc = Service(workers, queue, year, split)
+    server = await asyncio.start_server(svc.handle, host, port)
+    print(f"Serving on http://{host}:{port}/render ({workers} workers, queue {queue})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        svc.pool.shutdown(cancel_futures=True)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Personalized calendar rendering service.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--workers", type=int, default=os.cpu_count())
+    ap.add_argument("--queue", type=int, default=32)
+    ap.add_argument("--year", type=int, default=YEAR)
+    ap.add_argument("--split", type=int, default=1,
+                    help="draw each order's pages in this many workers and merge them")
+    args = ap.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue, args.year, args.split))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
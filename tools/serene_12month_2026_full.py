@@ -1,44 +1,48 @@
-~/calenv/bin/python3 ~/serene-site/tools/serene_12month_2026_full.py
-xdg-open ~/serene-site/downloads/12/core-2026-v1.pdf
-
-cd ~/serene-site
-git add downloads/12/core-2026-v1.pdf tools/serene_12month_2026_full.py
-git commit -m "12-month calendar: remove all out-of-month boxes"
-git push
+# ~/calenv/bin/python3 ~/serene-site/tools/serene_12month_2026_full.py
+# xdg-open ~/serene-site/downloads/12/core-2026-v1.pdf
+#
+# cd ~/serene-site
+# git add downloads/12/core-2026-v1.pdf tools/serene_12month_2026_full.py
+# git commit -m "12-month calendar: remove all out-of-month boxes"
+# git push
 
 # 2026 — 12-Month Calendar (FULL · matches 13-month style)
 # Update: draws ONLY real days; no boxes for out-of-month cells.
 
-import os, math, random, calendar, datetime as dt
+import io, os, sys, calendar, functools, datetime as dt
 from zoneinfo import ZoneInfo
 import ephem
+import astro_results, textfit, event_index, month_layout, pdf_merge, pdf_stream, page_cache, fonts
+import profiling
 
 from reportlab.lib.pagesizes import landscape, A4
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import cm
 from reportlab.lib import colors
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfbase.pdfmetrics import stringWidth
+
+# Importing this module does no astro work and touches no files: fonts are
+# registered and the year's tables computed (once, memoized) by the first
+# build() / render_fragment() that needs them. See calendars.render_calendar.
+# A build keeps its canvas, tables and personal overlay in a Drawing that
+# every page function takes; nothing here changes from one build to the next,
+# so builds of different years and zones can share a process.
 
 # ---------------- Output path ----------------
 SITE_DIR  = os.path.expanduser("~/serene-site")
-OUT_DIR   = os.path.join(SITE_DIR, "downloads", "12")
-os.makedirs(OUT_DIR, exist_ok=True)
+OUT_DIR   = os.path.join(SITE_DIR, "downloads", "12")   # created by build() when used
 pdf_path  = os.path.join(OUT_DIR, "core-2026-v1.pdf")
 
 # ---------------- Fonts ----------------
-FONT_REG  = "DejaVuSans"
-FONT_BOLD = "DejaVuSans-Bold"
-def _reg(name, paths):
-    for p in paths:
-        if os.path.exists(p):
-            pdfmetrics.registerFont(TTFont(name, p)); return True
-    return False
-if not _reg(FONT_REG, ["/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf","/usr/share/fonts/TTF/DejaVuSans.ttf","/usr/local/share/fonts/DejaVuSans.ttf","DejaVuSans.ttf"]):
-    FONT_REG = "Helvetica"
-if not _reg(FONT_BOLD, ["/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf","/usr/share/fonts/TTF/DejaVuSans-Bold.ttf","/usr/local/share/fonts/DejaVuSans-Bold.ttf","DejaVuSans-Bold.ttf"]):
-    FONT_BOLD = "Helvetica-Bold"
+FONT_REG, FONT_BOLD = "DejaVuSans", "DejaVuSans-Bold"
+# every non-ASCII character the pages draw, given the first font codes of
+# each PDF (fonts.prime) so fragments and full builds share font subsets
+GLYPHS = "·–’…→○●★☽♈♉♊♋♌♍♎♏♐♑♒♓♥✢✦✳✶✸✺✿❀❁❦❧□△☌☍✱"
+
+def setup_fonts():
+    # once per process (fonts.register is memoized); Helvetica if DejaVu is not installed
+    global FONT_REG, FONT_BOLD
+    FONT_REG  = fonts.register("DejaVuSans", "Helvetica")
+    FONT_BOLD = fonts.register("DejaVuSans-Bold", "Helvetica-Bold")
 
 # ---------------- Colors ----------------
 season_colors = {
@@ -59,126 +63,113 @@ month_symbols = {1:"✶",2:"♥",3:"❀",4:"✿",5:"❧",6:"✢",7:"✺",8:"✸"
 zodiac_glyph  = {"Aries":"♈","Taurus":"♉","Gemini":"♊","Cancer":"♋","Leo":"♌","Virgo":"♍","Libra":"♎","Scorpio":"♏","Sagittarius":"♐","Capricorn":"♑","Aquarius":"♒","Pisces":"♓"}
 zodiac_order  = ["Aries","Taurus","Gemini","Cancer","Leo","Virgo","Libra","Scorpio","Sagittarius","Capricorn","Aquarius","Pisces"]
 
-# ---------------- Phases (locked) ----------------
-full_moons = {
-    dt.date(2026,1,3):"Cancer",  dt.date(2026,4,2):"Libra",
-    dt.date(2026,8,28):"Pisces", dt.date(2026,9,26):"Aries",
-    dt.date(2026,10,26):"Taurus", dt.date(2026,11,24):"Gemini",
-    dt.date(2026,12,24):"Cancer",
-}
-new_moons = {
-    dt.date(2026,1,18):"Capricorn", dt.date(2026,3,19):"Pisces",
-    dt.date(2026,6,15):"Gemini",    dt.date(2026,8,12):"Leo",
-    dt.date(2026,9,11):"Virgo",     dt.date(2026,10,10):"Libra",
-    dt.date(2026,11,9):"Scorpio",   dt.date(2026,12,9):"Sagittarius",
-}
-
-# ---------------- Sun ingresses ----------------
-sun_ingress = {
-    dt.date(2026,1,20):"Aquarius", dt.date(2026,2,18):"Pisces", dt.date(2026,3,20):"Aries",
-    dt.date(2026,4,20):"Taurus",   dt.date(2026,5,21):"Gemini", dt.date(2026,6,21):"Cancer",
-    dt.date(2026,7,22):"Leo",      dt.date(2026,8,23):"Virgo",  dt.date(2026,9,23):"Libra",
-    dt.date(2026,10,23):"Scorpio", dt.date(2026,11,22):"Sagittarius", dt.date(2026,12,21):"Capricorn",
-}
+# ---------------- Year & place ----------------
+YEAR = 2026
+TZ   = "Europe/Oslo"  # default zone: events land on its local dates (build(tz=...) for others)
+UTC  = ZoneInfo("UTC")
+PLANETS={"Mercury":ephem.Mercury,"Venus":ephem.Venus,"Mars":ephem.Mars,"Jupiter":ephem.Jupiter,"Saturn":ephem.Saturn,"Uranus":ephem.Uranus,"Neptune":ephem.Neptune,"Pluto":ephem.Pluto}
+TABLE_BODIES = ["Sun","Moon",*PLANETS]
 
 # ---------------- Holidays ----------------
-GLOBAL_HOLIDAYS = {
-    dt.date(2026,4,5):"Easter Sunday ★",
-    dt.date(2026,10,31):"Halloween ★",
-    dt.date(2026,12,25):"Christmas Day ★",
-}
+def easter_sunday(year):
+    # anonymous Gregorian computus
+    a=year%19; b,cc=divmod(year,100); d,e=divmod(b,4); f=(b+8)//25; g=(b-f+1)//3
+    h=(19*a+b-d-g+15)%30; i,k=divmod(cc,4); l=(32+2*e+2*i-h-k)%7; m=(a+11*h+22*l)//451
+    month,day=divmod(h+l-7*m+114,31)
+    return dt.date(year,month,day+1)
+
+def holidays_for(year):
+    return {
+        easter_sunday(year):"Easter Sunday ★",
+        dt.date(year,10,31):"Halloween ★",
+        dt.date(year,12,25):"Christmas Day ★",
+    }
 
 # ---------------- Meteors ----------------
-METEOR_WINDOWS = [
-    (dt.date(2026,1,2), dt.date(2026,1,3), "Quadrantids peak window"),
-    (dt.date(2026,4,21),dt.date(2026,4,22),"Lyrids peak window"),
-    (dt.date(2026,7,28),dt.date(2026,7,29),"Delta Aquarids peak window"),
-    (dt.date(2026,8,12),dt.date(2026,8,13),"Perseids peak window"),
-    (dt.date(2026,10,21),dt.date(2026,10,22),"Orionids peak window"),
-    (dt.date(2026,11,4),dt.date(2026,11,5),"Taurids peak window"),
-    (dt.date(2026,11,17),dt.date(2026,11,18),"Leonids peak window"),
-    (dt.date(2026,12,13),dt.date(2026,12,14),"Geminids peak window"),
-    (dt.date(2026,12,21),dt.date(2026,12,22),"Ursids peak window"),
+METEOR_PEAKS = [   # (month, day) of the two dates each peak window is written on
+    ((1,2),  (1,3),  "Quadrantids peak window"),
+    ((4,21), (4,22), "Lyrids peak window"),
+    ((7,28), (7,29), "Delta Aquarids peak window"),
+    ((8,12), (8,13), "Perseids peak window"),
+    ((10,21),(10,22),"Orionids peak window"),
+    ((11,4), (11,5), "Taurids peak window"),
+    ((11,17),(11,18),"Leonids peak window"),
+    ((12,13),(12,14),"Geminids peak window"),
+    ((12,21),(12,22),"Ursids peak window"),
 ]
-def meteor_labels_for_date(d):
-    return [label for a,b,label in METEOR_WINDOWS if a<=d<=b]
-
-# ---------------- Seasons ----------------
-season_markers = {
-    dt.date(2026,3,20):"Spring Equinox",
-    dt.date(2026,6,21):"Summer Solstice",
-    dt.date(2026,9,23):"Autumn Equinox",
-    dt.date(2026,12,21):"Winter Solstice",
-}
+def meteor_windows_for(year):
+    return [(dt.date(year,*a), dt.date(year,*b), label) for a,b,label in METEOR_PEAKS]
 
 # ---------------- Astro helpers ----------------
-OSLO = ZoneInfo("Europe/Oslo"); UTC = ZoneInfo("UTC")
-def moon_sign_for_day(d: dt.date)->str:
-    if d == dt.date(2026,8,27): return "Pisces"  # special rule
-    local = dt.datetime(d.year,d.month,d.day,12,0,tzinfo=OSLO).astimezone(UTC)
-    e = ephem.Ecliptic(ephem.Moon(local))
-    lon = (float(e.lon)*180.0/math.pi)%360.0
-    return zodiac_order[int(lon//30)]
-
-PLANETS={"Mercury":ephem.Mercury,"Venus":ephem.Venus,"Mars":ephem.Mars,"Jupiter":ephem.Jupiter,"Saturn":ephem.Saturn,"Uranus":ephem.Uranus,"Neptune":ephem.Neptune,"Pluto":ephem.Pluto}
-
-def _sidx(body_ctor,t)->int:
-    e=ephem.Ecliptic(body_ctor(t)); lon=(float(e.lon)*180.0/math.pi)%360.0; return int(lon//30)
-
-def _ing(body_ctor,year):
-    out=[]; d=dt.date(year,1,1); end=dt.date(year,12,31)
-    prev=_sidx(body_ctor, dt.datetime(d.year,d.month,d.day,12,0,tzinfo=OSLO).astimezone(UTC))
-    while d<=end:
-        idx=_sidx(body_ctor, dt.datetime(d.year,d.month,d.day,12,0,tzinfo=OSLO).astimezone(UTC))
-        if idx!=prev: out.append((d,zodiac_order[idx])); prev=idx
-        d+=dt.timedelta(days=1)
-    return out
-
-ingresses={p:_ing(ctor,2026) for p,ctor in PLANETS.items()}
-planet_ingress_by_date={}
-for p,items in ingresses.items():
-    for d,sign in items:
-        planet_ingress_by_date.setdefault(d,[]).append(f"{p} → {sign} {zodiac_glyph[sign]}")
-
-def _elon(body_ctor,t):
-    e=ephem.Ecliptic(body_ctor(t)); return (float(e.lon)*180.0/math.pi)%360.0
-
-def mercury_retrograde_periods(year):
-    start=dt.date(year,1,1); end=dt.date(year,12,31)
-    prev=_elon(ephem.Mercury, dt.datetime(start.year,start.month,start.day,12,0,tzinfo=OSLO).astimezone(UTC))
-    d=start+dt.timedelta(days=1); inR=False; res=[]; Rs=None
-    while d<=end:
-        lon=_elon(ephem.Mercury, dt.datetime(d.year,d.month,d.day,12,0,tzinfo=OSLO).astimezone(UTC))
-        delta=lon-prev
-        if delta<-180: delta+=360
-        if delta>180:  delta-=360
-        if not inR and delta<0: inR=True; Rs=d
-        elif inR and delta>=0: inR=False; res.append((Rs,d)); Rs=None
-        prev=lon; d+=dt.timedelta(days=1)
-    if inR and Rs: res.append((Rs,end))
-    return res
-
-retro_markers={}
-for a,b in mercury_retrograde_periods(2026):
-    retro_markers.setdefault(a,[]).append("Mercury R starts")
-    retro_markers.setdefault(b,[]).append("Mercury R ends")
-
-eclipses=[(dt.date(2026,8,12),"Solar"),(dt.date(2026,8,28),"Lunar")]
+MOON_SIGN_OVERRIDES = {dt.date(2026,8,27):"Pisces"}  # special rule
+
+class YearTables:
+    # everything a year's pages show, for the local dates of one zone
+    def __init__(self, year, tz):
+        # exact UTC instants, solved once per year for every zone (astro_results.py) ...
+        with profiling.stage("astro"):
+            res = astro_results.get(year)
+        # ... and only re-bucketed onto this zone's dates
+        with profiling.stage("projection"):
+            local = res.local(tz)
+        self.year = year
+        self.zone = ZoneInfo(tz)
+        self.moon = local.moon                               # {date: MoonDay}: exact changes, dominant sign
+        self.lunations = local.lunations                     # [(date, lunar.Lunation)]
+        self.new_moons, self.full_moons = local.new_moons, local.full_moons   # {date: sign}
+        self.eclipses = local.eclipses                       # [(date, "Solar"|"Lunar", sign)]
+        self.sun_times = [(t, sign) for d, sign, t in local.ingresses["Sun"]]
+        self.sun_ingress = dict(local.sun_ingresses())
+        self.ingresses = {p: [(d, sign) for d, sign, t in local.ingresses[p]] for p in PLANETS}
+        self.station_times = {p: [(t, kind) for d, kind, t in local.stations[p]] for p in PLANETS}
+        self.season_markers = local.seasons
+        self.holidays = holidays_for(year)
+        self.meteor_windows = meteor_windows_for(year)
+        with profiling.stage("events"):
+            self.events = index_events(self)
+
+    def moon_sign_for_day(self, d: dt.date)->str:
+        # the sign the Moon holds for most of the local day (moon_days.py)
+        if d in MOON_SIGN_OVERRIDES: return MOON_SIGN_OVERRIDES[d]
+        return self.moon[d].sign
+
+    def zone_label(self):
+        # "Europe/Oslo" -> "Oslo", "America/New_York" -> "New York"
+        return self.zone.key.rsplit("/", 1)[-1].replace("_", " ")
+
+@functools.lru_cache(maxsize=None)
+def _load_year(year, tz):
+    return YearTables(year, tz)
+
+def load_year(year, tz=None):
+    # -> the YearTables of `year` on the local dates of `tz` (default TZ),
+    # computed once per process
+    return _load_year(year, tz or TZ)
+
+# ---------------- One PDF being drawn ----------------
+class Drawing:
+    # what the page functions below draw from: the canvas, the year's tables
+    # and a personalized order's overlay; one per build or fragment
+    def __init__(self, tables, overlay=None, dedication=""):
+        self.c = None                        # the canvas, opened by the build
+        self.t = tables                      # YearTables
+        self.personal_by_date = overlay or {}   # {date: [label]} natal transits (see natal.py)
+        self.dedication = dedication         # front-page line for a personalized order
 
 # ---------------- PDF ----------------
-c=canvas.Canvas(pdf_path,pagesize=landscape(A4))
 W,H=landscape(A4)
 
+# month grid layout (shared event lines are clipped to a cell's width)
+LM,RM,TM,BM=1.8*cm,1.8*cm,3.0*cm,2.3*cm
+CELL_W=(W-LM-RM)/7; CELL_PAD=0.23*cm
+# every month shape's cells, day-number and text anchors, worked out once
+# (month_layout.py); the grid starts below the ~0.9cm weekday header
+GRID=month_layout.Layout(x=LM, top=H-TM-0.9*cm, cell_w=CELL_W, grid_h=H-(TM+BM)-0.9*cm,
+                         number=(CELL_W/2, 0.0, 0.28*cm), text=(CELL_PAD, 0.63, 0.0),
+                         line_gap=0.28*cm, floor=0.92*cm)
+
 def wrap_to_width(text,font,size,max_w):
-    words=text.split(" "); lines=[]; cur=""
-    for w in words:
-        trial=w if not cur else f"{cur} {w}"
-        if cur and stringWidth(trial,font,size)>max_w:
-            lines.append(cur); cur=w
-        else:
-            cur=trial
-    if cur: lines.append(cur)
-    return lines
+    return textfit.wrap(text,font,size,max_w)
 
 def safe_join(items):
     return " · ".join(items)
@@ -188,8 +179,113 @@ def first_wrapped_line(text, font_name, font_size, max_w):
     if not wrapped: return ""
     return wrapped[0].rstrip(" ,.;:·")
 
+# ---------------- Event index ----------------
+def index_events(t):
+    # every grid event of a YearTables' year as a typed record, bucketed by date once
+    Event = event_index.Event
+    ev = event_index.EventIndex()
+    d = dt.date(t.year,1,1)
+    while d.year == t.year:
+        # a change day carries the exact instant and the sign entered
+        at, entered = t.moon[d].changes[0] if t.moon[d].changes else (None, None)
+        ev.add(Event(d, "moon", "Moon", t.moon_sign_for_day(d), at and at.astimezone(UTC), entered))
+        d += dt.timedelta(days=1)
+    for d, l in t.lunations:
+        ev.add(Event(d, "phase", "Moon", l.sign, l.instant, l.kind))
+    for d, l in t.lunations:
+        if l.eclipse:
+            ev.add(Event(d, "eclipse", "Sun" if l.eclipse=="Solar" else "Moon", l.sign, l.instant, l.eclipse))
+    for d, label in t.season_markers.items(): ev.add(Event(d, "season", "Sun", detail=label))
+    for d, label in t.holidays.items():       ev.add(Event(d, "holiday", detail=label))
+    for a, b, label in t.meteor_windows:      ev.add_span(a, b, "meteor", detail=label)
+    for at, sign in t.sun_times:
+        ev.add(Event(at.astimezone(t.zone).date(), "ingress", "Sun", sign, at))
+    for p, items in t.ingresses.items():
+        for d, sign in items:
+            ev.add(Event(d, "ingress", p, sign))
+    for p, items in t.station_times.items():
+        for at, kind in items:
+            ev.add(Event(at.astimezone(t.zone).date(), "station", p, instant=at, detail=kind))
+    return ev.sort()
+
+def event_label(e, zone):
+    k = e.kind
+    if k == "moon" and e.instant:   # ☽, not "Moon": Sagittarius and the time still fit a cell
+        return f"☽ → {e.detail} {zodiac_glyph[e.detail]} {e.instant.astimezone(zone):%H:%M}"
+    if k == "moon":    return f"Moon in {e.sign} {zodiac_glyph[e.sign]}"
+    if k == "phase":   return "○ New Moon" if e.detail == "New" else "● Full Moon"
+    if k == "eclipse": return f"{e.detail} Eclipse {zodiac_glyph[e.sign]}"
+    if k == "ingress": return f"{e.body} → {e.sign} {zodiac_glyph[e.sign]}"
+    if k == "station": return f"{e.body} R starts" if e.detail == "R" else f"{e.body} R ends"
+    return e.detail   # season, holiday, meteor, natal
+
+def _shared_line(e):
+    # same-day planet ingresses, stations and natal transits share one line
+    if e.kind == "ingress": return "planets" if e.body != "Sun" else None
+    return e.kind if e.kind in ("station", "natal") else None
+
+def clipped(labels):
+    # a shared line, cut to what fits in a cell
+    return first_wrapped_line(safe_join(labels), FONT_BOLD, 7.2, CELL_W-2*CELL_PAD)
+
+def day_events(dr, d):
+    # pre-sorted for the year; a personal overlay is merged in per build
+    extra = [event_index.Event(d, "natal", detail=t) for t in dr.personal_by_date.get(d, ())]
+    return dr.t.events.on(d, extra)
+
+def cell_lines(day, zone):
+    # a day's events (in drawing order) -> the text lines of its cell
+    out=[]; i=0
+    while i < len(day):
+        group=_shared_line(day[i]); j=i+1
+        if group is None:
+            out.append(event_label(day[i], zone))
+        else:
+            while j < len(day) and _shared_line(day[j]) == group: j+=1
+            out.append(clipped([event_label(e, zone) for e in day[i:j]]))
+        i=j
+    return out
+
+# ---------------- Page templates ----------------
+# Chrome that repeats many times in a document (the borders of a full week)
+# is drawn once as a PDF form (XObject) and only referenced after that. Pieces
+# used a few times per document (the seasonal background, 3 pages each) cost
+# more as a form than inline and stay on the page.
+def use_form(c, name, draw):
+    if not c.hasForm(name):
+        c.beginForm(name); draw(); c.endForm()
+    c.doForm(name)
+
+def month_chrome(c, tint, fg):
+    # seasonal background and weekday header
+    c.setFillColor(tint); c.rect(0,0,W,H,fill=True,stroke=False)
+    c.setFont(FONT_BOLD,12); c.setFillColor(fg)
+    for i,wd in enumerate(["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]):
+        c.drawCentredString(LM+CELL_W*(i+0.5),H-TM+0.45*cm,wd)
+
+def week_row(c, ch):
+    # borders of a full Mon..Sun week of cells ch high, bottom edge at y=0
+    c.setStrokeColor(colors.white)
+    for col in range(7): c.rect(LM + col*CELL_W,0,CELL_W,ch)
+
+def month_grid(c, g, fg):
+    # cell borders of a GRID month (full weeks reuse one row form per row
+    # height) and the big day numbers, bottom-center; only real-day cells
+    c.setStrokeColor(colors.white)
+    for week, full in zip(g.weeks, g.full):
+        if full:
+            c.saveState(); c.translate(0, week[0].y)
+            use_form(c, f"week-{g.rows}", lambda: week_row(c, g.cell_h))
+            c.restoreState()
+        else:
+            for cell in week: c.rect(cell.x,cell.y,cell.w,cell.h)
+    c.setFont(FONT_BOLD,18); c.setFillColor(fg)
+    for cell in g.cells:
+        c.drawCentredString(*cell.number, str(cell.day))
+
 # ---------------- Front page ----------------
-def draw_front():
+def draw_front(dr):
+    c=dr.c
     c.setFillColor(colors.white); c.rect(0,0,W,H,fill=True,stroke=False)
     m=2.0*cm; c.setLineWidth(2); c.setStrokeColor(colors.Color(0,0,0,0.12))
     c.roundRect(m,m,W-2*m,H-2*m,14,stroke=True,fill=False)
@@ -198,145 +294,55 @@ def draw_front():
     cols=6; gap=(W-2*m)/(cols+1); y_top=H-m-0.9*cm; y_bot=m+0.9*cm
     for i in range(cols): c.drawCentredString(m+(i+1)*gap,y_top,glyphs[i])
     for i in range(cols): c.drawCentredString(m+(i+1)*gap,y_bot,glyphs[i+6])
-    c.setFont(FONT_BOLD,36); c.drawCentredString(W/2,H-6.5*cm,"The 12 Month Calendar of 2026")
+    c.setFont(FONT_BOLD,36); c.drawCentredString(W/2,H-6.5*cm,f"The 12 Month Calendar of {dr.t.year}")
     c.setFont(FONT_REG,18);  c.drawCentredString(W/2,H-8.3*cm,"Gregorian months · 1 month per page")
     c.setFont(FONT_REG,13);  c.drawCentredString(W/2,H-9.8*cm,"Seasonal palette · Winter blue · Spring pink · Summer gold · Autumn plum")
-draw_front(); c.showPage()
+    if dr.dedication:
+        c.setFont(FONT_BOLD,15); c.drawCentredString(W/2,H-11.6*cm,dr.dedication)
 
 # ---------------- Month page (only real-day boxes) ----------------
-def draw_month_gregorian(year, month):
+def draw_month_gregorian(dr, month):
+    c, year = dr.c, dr.t.year
     name  = calendar.month_name[month]
     tint  = month_color_map[month]
     is_autumn = month in (9,10,11)
     fg = colors.white if is_autumn else colors.black
+    g = GRID.grid(*month_layout.shape(year, month))
 
-    c.setFillColor(tint); c.rect(0,0,W,H,fill=True,stroke=False)
+    month_chrome(c, tint, fg)
+    month_grid(c, g, fg)
 
     sym=month_symbols.get(month,"")
     c.setFillColor(fg); c.setFont(FONT_BOLD,26)
-    c.drawCentredString(W/2,H-1.6*cm,f"{sym+' ' if sym else ''}{name} 2026")
-
-    # layout
-    lm,rm,tm,bm=1.8*cm,1.8*cm,3.0*cm,2.3*cm
-    left,top=lm,H-tm; cols=7
-    cw=(W-lm-rm)/cols; pad=0.23*cm
-
-    # weekday header
-    c.setFont(FONT_BOLD,12); c.setFillColor(fg)
-    for i,wd in enumerate(["Mon","Tue","Wed","Thu","Fri","Sat","Sun"]):
-        c.drawCentredString(left+cw*(i+0.5),top+0.45*cm,wd)
-
-    # month shape (no ghost boxes)
-    first_wd, days_in_month = calendar.monthrange(year, month)  # Mon=0..Sun=6
-    # rows needed:
-    rows = (first_wd + days_in_month + 6)//7  # ceil
-
-    # build event dict only for real days
-    day_events = {}
-    def push(d, text): day_events.setdefault(d, []).append(text)
-
-    for day in range(1, days_in_month+1):
-        d = dt.date(year, month, day)
-        ms = moon_sign_for_day(d)
-        push(d, f"Moon in {ms} {zodiac_glyph[ms]}")
-        if d in new_moons:  push(d, "○ New Moon")
-        if d in full_moons: push(d, "● Full Moon")
-        for dE, kind in eclipses:
-            if d == dE:
-                if kind=="Lunar":
-                    msE = moon_sign_for_day(dE)
-                    push(d, f"Lunar Eclipse {zodiac_glyph[msE]}")
-                else:
-                    sdt=dt.datetime(dE.year,dE.month,dE.day,12,0,tzinfo=OSLO).astimezone(UTC)
-                    slon=(float(ephem.Ecliptic(ephem.Sun(sdt)).lon)*180.0/math.pi)%360.0
-                    ssign=zodiac_order[int(slon//30)]
-                    push(d, f"Solar Eclipse {zodiac_glyph[ssign]}")
-        if d in season_markers:  push(d, season_markers[d])
-        if d in GLOBAL_HOLIDAYS: push(d, GLOBAL_HOLIDAYS[d])
-        for a,b,label in METEOR_WINDOWS:
-            if a<=d<=b: push(d, label)
-        if d in sun_ingress:
-            s = sun_ingress[d]; push(d, f"Sun → {s} {zodiac_glyph[s]}")
-        if d in planet_ingress_by_date:
-            compact = safe_join(planet_ingress_by_date[d])
-            push(d, first_wrapped_line(compact, FONT_BOLD, 7.2, cw-2*pad))
-        if d in retro_markers:
-            txt = safe_join(retro_markers[d])
-            push(d, first_wrapped_line(txt, FONT_BOLD, 7.2, cw-2*pad))
-
-    # Aug 27 rule
-    if month == 8:
-        d27 = dt.date(2026,8,27)
-        if d27 in day_events:
-            day_events[d27] = [s for s in day_events[d27] if ("Full Moon" not in s and "Eclipse" not in s)]
-
-    # vertical metrics depend on rows used
-    # total height for rows
-    total_h = H - (tm + bm) - 0.9*cm  # header height ~0.9cm
-    ch = total_h / rows
-
-    # draw only real-day cells
-    for r in range(rows):
-        for col in range(cols):
-            # map to day number
-            n = r*7 + col - first_wd + 1
-            if n < 1 or n > days_in_month:
-                continue  # NO BOX for out-of-month cells
-            d = dt.date(year, month, n)
-
-            x = left + col*cw
-            y = (H - tm - 0.9*cm) - (r+1)*ch  # below weekday header
-
-            # cell border
-            c.setStrokeColor(colors.white); c.rect(x,y,cw,ch)
-
-            # stack geometry
-            stack_start = y + ch*0.63
-            line_gap    = 0.28*cm
-            safe_floor  = y + 0.92*cm
-            usable_w    = cw - 2*pad
-
-            lines = day_events.get(d, [])
-            # stable order
-            priority = {"Moon in":0, "○ New Moon":1, "● Full Moon":1, "Eclipse":2,
-                        "Equinox":3, "Solstice":3, "peak window":4,
-                        "Sun →":5, "Mercury →":6, "Venus →":7, "Mars →":8,
-                        "Jupiter →":9, "Saturn →":10, "Uranus →":11, "Neptune →":12, "Pluto →":13,
-                        "Mercury R":14, "★":15}
-            def keyfn(s):
-                for k,v in priority.items():
-                    if s.startswith(k) or k in s: return v
-                return 99
-            lines.sort(key=keyfn)
-
-            # draw lines
-            c.setFillColor(fg)
-            y_line = stack_start; base = 7.2
-            max_lines = max(0, int((stack_start - safe_floor)//line_gap))
-            drawn=0
-            for txt in lines:
-                if not txt: continue
-                if drawn>=max_lines:
-                    if y_line - line_gap >= safe_floor:
-                        c.setFont(FONT_BOLD, base)
-                        c.drawString(x+pad, y_line - line_gap, "…")
-                    break
-                size=base
-                while stringWidth(txt, FONT_BOLD, size) > usable_w and size > 6.7:
-                    size -= 0.2
-                if stringWidth(txt, FONT_BOLD, size) > usable_w:
-                    w0=wrap_to_width(txt, FONT_BOLD, size, usable_w)
-                    if w0: txt=w0[0].rstrip(" ,.;:·")
-                c.setFont(FONT_BOLD, size)
-                c.drawString(x+pad, y_line, txt)
-                y_line -= line_gap; drawn += 1
-
-            # BIG day number bottom-center
-            c.setFont(FONT_BOLD,18); c.setFillColor(fg)
-            c.drawCentredString(x+cw/2, y+0.28*cm, str(n))
+    c.drawCentredString(W/2,H-1.6*cm,f"{sym+' ' if sym else ''}{name} {year}")
+
+    line_gap=GRID.line_gap; usable_w=CELL_W-2*CELL_PAD; base=7.2
+    for cell in g.cells:
+        lines = cell_lines(day_events(dr, dt.date(year, month, cell.day)), dr.t.zone)
+
+        # draw lines down from the cell's text anchor
+        c.setFillColor(fg)
+        x, y_line = cell.text
+        safe_floor = cell.y + GRID.floor
+        drawn=0
+        for txt in lines:
+            if not txt: continue
+            if drawn>=cell.max_lines:
+                if y_line - line_gap >= safe_floor:
+                    c.setFont(FONT_BOLD, base)
+                    c.drawString(x, y_line - line_gap, "…")
+                break
+            size=textfit.fit_size(txt, FONT_BOLD, usable_w, base)
+            if textfit.width(txt, FONT_BOLD, size) > usable_w:
+                w0=wrap_to_width(txt, FONT_BOLD, size, usable_w)
+                if w0: txt=w0[0].rstrip(" ,.;:·")
+            c.setFont(FONT_BOLD, size)
+            c.drawString(x, y_line, txt)
+            y_line -= line_gap; drawn += 1
 
 # ---------------- Information page ----------------
-def info_page():
+def info_page(dr):
+    c=dr.c
     c.setFillColor(colors.white); c.rect(0,0,W,H,fill=True,stroke=False)
     c.setFillColor(colors.black)
     c.setFont(FONT_BOLD,24); c.drawCentredString(W/2,H-2.5*cm,"Information")
@@ -353,9 +359,10 @@ def info_page():
     c.setFont(FONT_REG,11); c.drawString(left,y,"Winter pastel blue · Spring pastel pink · Summer warm gold · Autumn dark plum"); y-=1.0*cm
     c.setFont(FONT_BOLD,12); c.drawString(left,y,"Event Types"); y-=0.6*cm
     c.setFont(FONT_REG,11)
-    for line in ["○ New Moon · ● Full Moon · Sun → Sign",
+    for line in [f"Moon in Sign (most of the day) · ☽ → Sign hh:mm (exact change, {dr.t.zone_label()} time)",
+                 "○ New Moon · ● Full Moon · Sun → Sign",
                  "Planet → Sign (Mercury to Pluto)",
-                 "Mercury R starts · Mercury R ends",
+                 "Planet R starts · Planet R ends (station days)",
                  "Eclipse (Solar or Lunar) · Equinox · Solstice"]:
         c.drawString(left,y,line); y-=0.5*cm
     c.setFont(FONT_BOLD,12); c.drawString(left,y,"Meteor Showers · Peak windows"); y-=0.6*cm
@@ -375,7 +382,8 @@ def info_page():
     c.showPage()
 
 # ---------------- Reference page ----------------
-def reference_page():
+def reference_page(dr):
+    c, full_moons = dr.c, dr.t.full_moons
     c.setFillColor(colors.white); c.rect(0,0,W,H,fill=True,stroke=False); c.setFillColor(colors.black)
 
     left_x   = 2.2*cm
@@ -401,7 +409,7 @@ def reference_page():
         if sum(1 for dd in full_moons if dd.month==d.month)>1 and d==max([dd for dd in full_moons if dd.month==d.month]): name="Blue Moon"
         fm.append((d,sign,name))
     def fmt_fm(it): d,sign,name=it; return f"{d.strftime('%b %d')}: Full Moon in {sign} {zodiac_glyph[sign]} · {name}"
-    y_after_fm = draw_two_column_panel(left_x,right_x,top_y,"Full Moons 2026",fm,fmt_fm,rows_left_max=7)
+    y_after_fm = draw_two_column_panel(left_x,right_x,top_y,f"Full Moons {dr.t.year}",fm,fmt_fm,rows_left_max=7)
 
     y_next = y_after_fm - 1.0*cm
 
@@ -418,7 +426,7 @@ def reference_page():
 
     c.setFont(FONT_BOLD,16); c.drawString(right_x,y_next,"Sun entries")
     y_s = y_next - 0.8*cm; c.setFont(FONT_REG,11)
-    sun_items = sorted(sun_ingress.items())
+    sun_items = sorted(dr.t.sun_ingress.items())
     def fmt_sun(it): d,sign=it; return f"{d.strftime('%b %d')}: Sun → {sign} {zodiac_glyph[sign]}"
     rows_per_col=8; col_w=6.6*cm
     x1=right_x; x2=right_x+col_w
@@ -433,13 +441,99 @@ def reference_page():
     c.showPage()
 
 # ---------------- Build ----------------
-def build():
-    for m in range(1,13):
-        draw_month_gregorian(2026, m); c.showPage()
-    info_page()
-    reference_page()
-    c.save()
-    print(f"Saved: {pdf_path}")
+PAGES = ["front", *range(1,13), "info", "reference"]
+
+def draw_page(dr, page):
+    with profiling.stage(f"page {page}"):
+        if page == "front": draw_front(dr); dr.c.showPage()
+        elif page == "info": info_page(dr)
+        elif page == "reference": reference_page(dr)
+        else: draw_month_gregorian(dr, page); dr.c.showPage()
+
+# ---------------- Incremental rebuilds (page_cache.py) ----------------
+def style_inputs():
+    return [W, H, LM, RM, TM, BM, CELL_PAD, FONT_REG, FONT_BOLD,
+            month_color_map, month_symbols, zodiac_glyph]
+
+def page_inputs(dr, page):
+    # everything a page shows that is not a style constant
+    year = dr.t.year
+    if page == "front": return [year, dr.dedication]
+    if page == "info": return []
+    if page == "reference": return [year, sorted(dr.t.full_moons.items()), sorted(dr.t.sun_ingress.items())]
+    days = calendar.monthrange(year, page)[1]
+    return [year, [[e.to_row() for e in day_events(dr, dt.date(year, page, n))] for n in range(1, days+1)]]
+
+def page_key(dr, page):
+    code = page_cache.code_key(sys.modules[__name__], textfit, event_index, month_layout, fonts)
+    return page_cache.key(__name__, code, style_inputs(), dr.t.zone.key, page, page_inputs(dr, page))
+
+def drawing(year, tz=None, overlay=None, for_whom=""):
+    # -> a Drawing of `year` in `tz` (fonts registered, tables loaded), no canvas yet
+    with profiling.stage("fonts"): setup_fonts()
+    return Drawing(load_year(year, tz), overlay, for_whom)
+
+def _draw(dr, canv, pages):
+    dr.c = canv
+    fonts.prime(canv, [FONT_REG, FONT_BOLD], GLYPHS)
+    for page in pages: draw_page(dr, page)
+    with profiling.stage("save"): canv.save()
+
+def render_fragment(year, pages, overlay=None, for_whom="", tz=None):
+    # -> PDF bytes holding just `pages`; runs in pool workers for split builds
+    buf = io.BytesIO()
+    _draw(drawing(year, tz, overlay, for_whom), canvas.Canvas(buf,pagesize=landscape(A4)), pages)
+    return buf.getvalue()
+
+def split_pages(n):
+    # PAGES in n contiguous runs of near-equal length
+    k, r = divmod(len(PAGES), n)
+    runs, i = [], 0
+    for j in range(n):
+        runs.append(PAGES[i:i+k+(j<r)]); i += k+(j<r)
+    return [run for run in runs if run]
+
+def build(year=YEAR, out=None, tz=None, overlay=None, for_whom="", pool=None, parts=None,
+          incremental=True, profile=None):
+    # out: path or writable binary stream, written page by page (pdf_stream.py);
+    # tz: the zone whose local dates events land on (default TZ; the astro
+    # itself is shared by every zone, see astro_results.py);
+    # overlay/for_whom: personalized orders; pool: an executor to render
+    # `parts` page runs on in parallel, merged in order; incremental: an
+    # existing file at the path gets only its changed pages redrawn
+    # (page_cache.py; a path's page keys are recorded either way).
+    # -> the build's profiling.Report; profile: captures to take, see profiling.py
+    with profiling.session(f"12-month core {year}", profile) as rep:
+        _build(year, out, tz, overlay, for_whom, pool, parts, incremental)
+    return rep
+
+def _build(year, out, tz, overlay, for_whom, pool, parts, incremental):
+    if out is None:
+        os.makedirs(OUT_DIR, exist_ok=True)
+        suffix = "" if tz in (None, TZ) else "-" + tz.replace("/", "_")
+        out = os.path.join(OUT_DIR, f"core-{year}-v1{suffix}.pdf")
+    if isinstance(out, str):
+        dr = drawing(year, tz, overlay, for_whom)
+        with profiling.stage("page keys"):
+            keys = [page_key(dr, page) for page in PAGES]
+        if incremental:
+            with profiling.stage("splice"):
+                redrawn = page_cache.rebuild(out, keys, lambda i: render_fragment(year, [PAGES[i]], overlay, for_whom, tz))
+            if redrawn is not None:
+                print(f"Saved: {out} ({len(redrawn)} of {len(PAGES)} pages redrawn)")
+                return
+        with open(out, "wb") as f: _build(year, f, tz, overlay, for_whom, pool, parts, False)
+        page_cache.record(out, keys)
+        print(f"Saved: {out}")
+    elif pool is not None:
+        runs = split_pages(parts or getattr(pool, "_max_workers", 4))
+        with profiling.stage("fragments"):
+            futs = [pool.submit(render_fragment, year, run, overlay, for_whom, tz) for run in runs]
+            frags = [f.result() for f in futs]
+        with profiling.stage("merge"):
+            out.write(pdf_merge.merge(frags))
+    else:
+        _draw(drawing(year, tz, overlay, for_whom), pdf_stream.Canvas(out,pagesize=landscape(A4)), PAGES)
 
 if __name__ == "__main__":
     build()
@@ -0,0 +1,57 @@
+# stations.py
+# Exact station-retrograde / station-direct instants for Mercury..Pluto.
+# A coarse longitude grid (days for Mercury, a month for the outer planets)
+# brackets every change of direction; Brent then solves speed(t) = 0, where
+# speed is a central difference of ecliptic longitude.
+
+import math
+import datetime as dt
+import ephem
+
+from ingress_engine import lon_at, brent, to_utc
+
+RETRO_BODIES = ["Mercury","Venus","Mars","Jupiter","Saturn","Uranus","Neptune","Pluto"]
+
+# grid spacing in days: comfortably below half the shortest retrograde run
+STEP = {"Mercury": 4.0, "Venus": 8.0, "Mars": 12.0, "Jupiter": 20.0,
+        "Saturn": 25.0, "Uranus": 30.0, "Neptune": 30.0, "Pluto": 30.0}
+
+H    = 0.05   # days, half-width of the speed difference
+XTOL = 1e-4   # days (~9 s)
+
+def _wrap(x):
+    return (x + 180.0) % 360.0 - 180.0
+
+def speed(name, t):
+    # deg/day
+    return _wrap(lon_at(name, t + H) - lon_at(name, t - H))/(2*H)
+
+def stations(name, start, end):
+    # [(ephem float, "R" | "D")] for start <= t < end (ephem floats)
+    start, end = float(start), float(end)
+    step = STEP[name]
+    n = int(math.ceil((end - start)/step)) + 2
+    ts = [start - step + i*step for i in range(n + 1)]
+    ls = [lon_at(name, t) for t in ts]
+    chords = [_wrap(b - a) for a, b in zip(ls, ls[1:])]
+    f = lambda t: speed(name, t)
+    out = []
+    for i in range(1, len(chords)):
+        if (chords[i-1] < 0) == (chords[i] < 0):
+            continue
+        a, b = ts[i-1], ts[i+1]
+        fa, fb = f(a), f(b)
+        if (fa < 0) == (fb < 0):
+            continue   # no clean bracket: grid too coarse for this run
+        t = brent(f, a, b, fa, fb, xtol=XTOL)
+        if start <= t < end and not (out and abs(out[-1][0] - t) < step):
+            out.append((t, "R" if fb < 0 else "D"))
+    return out
+
+def scan_stations(year, bodies=RETRO_BODIES, years=1, margin=0):
+    # {body: [(aware UTC datetime, "R" | "D")]} for `years` calendar years from
+    # `year`, widened by `margin` days on both sides
+    start = ephem.Date(ephem.Date(dt.datetime(year, 1, 1)) - margin)
+    end   = ephem.Date(ephem.Date(dt.datetime(year + years, 1, 1)) + margin)
+    return {name: [(to_utc(t), kind) for t, kind in stations(name, start, end)]
+            for name in bodies}
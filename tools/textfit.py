@@ -0,0 +1,64 @@
+# textfit.py
+# Text measurement for the calendar cells without re-measuring strings.
+#
+# Advance widths are cached per (font, codepoint) in 1/1000 em, and each
+# distinct label's total is cached per font, so a width at any size is one
+# multiplication. Shrinking a label onto the 0.2 pt size ladder is solved in
+# closed form from its 1 pt width, and wrapping adds up word widths it has
+# already measured instead of re-measuring every growing prefix.
+
+import math
+from collections import Counter
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfmetrics
+
+_advances = {}   # font -> {codepoint: advance in 1/1000 em}
+MEASURED = Counter()   # reportlab stringWidth calls per font (read by profiling.py)
+
+def advance(font, ch):
+    adv = _advances.setdefault(font, {})
+    a = adv.get(ch)
+    if a is None:
+        MEASURED[font] += 1
+        a = adv[ch] = pdfmetrics.stringWidth(ch, font, 1000)
+    return a
+
+@lru_cache(maxsize=65536)
+def em_width(text, font):
+    # width in 1/1000 em; same sum as reportlab's stringWidth
+    return sum(advance(font, ch) for ch in text)
+
+def width(text, font, size):
+    return 0.001*size*em_width(text, font)
+
+def fit_size(text, font, max_w, base=7.2, floor=6.7, step=0.2):
+    # largest size on the base, base-step, ... ladder at which text fits in
+    # max_w, but never below the first rung at or under floor (the text may
+    # still overflow there; the caller wraps it)
+    w = 0.001*em_width(text, font)
+    if w*base <= max_w:
+        return base
+    n_min = math.ceil((base - floor)/step - 1e-9)
+    n = min(max(1, math.ceil((base - max_w/w)/step)), n_min)
+    # settle rounding at the exact boundary
+    if n > 1 and w*(base - (n - 1)*step) <= max_w: n -= 1
+    elif n < n_min and w*(base - n*step) > max_w: n += 1
+    return base - n*step
+
+def wrap(text, font, size, max_w):
+    # greedy word wrap; each word is measured once and line widths are
+    # running sums of the words already placed
+    limit = max_w/(0.001*size)
+    space = em_width(" ", font)
+    lines, cur, cur_w = [], "", 0.0
+    for word in text.split(" "):
+        ww = em_width(word, font)
+        if not cur:
+            cur, cur_w = word, ww
+        elif cur_w + space + ww > limit:
+            lines.append(cur); cur, cur_w = word, ww
+        else:
+            cur, cur_w = f"{cur} {word}", cur_w + space + ww
+    if cur: lines.append(cur)
+    return lines
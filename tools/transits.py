@@ -0,0 +1,96 @@
+# transits.py
+# Natal transit overlay: when does each of the year's planets make an exact
+# aspect to a buyer's natal points?
+#
+# Per year (shared by every order) the noon longitude table, with one sample
+# added on each side (the noons of Dec 31 before and Jan 1 after the year, so
+# the first and last half days are covered), is unwrapped and folded into
+# interval hulls: one [lo, hi] per day and one per block of days. A day
+# covers [noon, next noon): a crossing exactly at a sample belongs to the
+# day it starts, not also to the one before.
+# Per order each target longitude (natal point ± aspect angle) is tested
+# against the block hulls first, and only blocks that can contain it are
+# opened. The crossing instant is then interpolated inside the day.
+
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import ephem
+
+import ephem_cache
+from ingress_engine import to_utc
+from lon_table import wrap180
+from natal import ASPECTS, TRANSITING
+
+BLOCK = 16   # days per block hull
+
+def edges(table, bodies=TRANSITING):
+    # -> (longitudes before, longitudes after) the table's year for `bodies`,
+    # at its sample time (ephem_cache.edge_lons)
+    before, after = zip(*(ephem_cache.edge_lons(b, table.year, table.tz, table.hour) for b in bodies))
+    return before, after
+
+def _contains(lo, hi, target):
+    # does [lo, hi] (unwrapped degrees) contain target + 360k for some integer k?
+    return np.floor((hi - target)/360.0) >= np.ceil((lo - target)/360.0)
+
+class TransitIndex:
+    def __init__(self, table, bodies=TRANSITING, block=BLOCK, edge_lons=None):
+        # edge_lons: edges(table, bodies) if already known
+        self.table = table
+        self.bodies = list(bodies)
+        self.block = block
+        before, after = edge_lons or edges(table, self.bodies)
+        lons = np.column_stack((before, table.lons[[table.rows[b] for b in self.bodies]], after))
+        # unwrapped: continuous across 360°, so retrograde loops are plain intervals
+        steps = wrap180(np.diff(lons, axis=1))
+        self.u = np.concatenate((lons[:, :1], lons[:, :1] + np.cumsum(steps, axis=1)), axis=1)
+        self.lo = np.minimum(self.u[:, :-1], self.u[:, 1:])      # bodies × day intervals
+        self.hi = np.maximum(self.u[:, :-1], self.u[:, 1:])
+        n = self.lo.shape[1]
+        nb = -(-n // block)
+        pad = nb*block - n
+        self.blo = np.pad(self.lo, ((0, 0), (0, pad)), constant_values=np.inf).reshape(len(self.bodies), nb, block).min(axis=2)
+        self.bhi = np.pad(self.hi, ((0, 0), (0, pad)), constant_values=-np.inf).reshape(len(self.bodies), nb, block).max(axis=2)
+        t0, t1 = ephem_cache.edge_instants(table.year, table.tz, table.hour)
+        self.instants = np.array((t0, *ephem_cache.day_instants(table.year, table.tz, table.hour), t1))
+
+    def crossings(self, targets):
+        # -> [(body index, ephem instant, target index)] for every exact crossing
+        targets = np.asarray(targets, dtype=np.float64)
+        out = []
+        hits = np.nonzero(_contains(self.blo[:, :, None], self.bhi[:, :, None], targets[None, None, :]))
+        for b, k, t in zip(*hits):
+            j0, j1 = k*self.block, min((k + 1)*self.block, self.lo.shape[1])
+            T = targets[t]
+            for j in np.flatnonzero(_contains(self.lo[b, j0:j1], self.hi[b, j0:j1], T)) + j0:
+                u0, u1 = self.u[b, j], self.u[b, j + 1]
+                v = T + 360.0*np.floor((max(u0, u1) - T)/360.0)
+                if v == u1:
+                    continue   # at the next sample: day j + 1's
+                frac = (v - u0)/(u1 - u0) if u1 != u0 else 0.0
+                out.append((b, self.instants[j] + frac*(self.instants[j + 1] - self.instants[j]), t))
+        return out
+
+    def transits(self, natal):
+        # [(aware UTC datetime, body, aspect glyph, natal point)] sorted by time
+        targets, labels = [], []
+        for p, lon in natal.items():
+            for glyph, angle in ASPECTS:
+                for a in {angle, -angle % 360.0}:
+                    targets.append((lon + a) % 360.0)
+                    labels.append((glyph, p))
+        out = [(to_utc(ephem.Date(t)), self.bodies[b], *labels[i]) for b, t, i in self.crossings(targets)]
+        out.sort(key=lambda x: x[0])
+        return out
+
+    def transit_days(self, natal, tz=None):
+        # {local date: [label]} of the table's year for the calendar overlay;
+        # tz defaults to the table's
+        zone = ZoneInfo(tz or self.table.tz)
+        out = {}
+        for t, body, glyph, p in self.transits(natal):
+            d = t.astimezone(zone).date()
+            if d.year == self.table.year:
+                out.setdefault(d, []).append(f"{body} {glyph} natal {p}")
+        return out